@@ -43,6 +43,24 @@ def run_consultancy(company: str, industry: str = "", url: str = "", location: s
         print(result.stderr)
         return False
 
+def run_batch(input_file: str, workers: int = 2):
+    """Run a CSV/JSONL prospect list through one warm consultancy process"""
+    script_path = Path("modules/client-automation/execution/run_batch_consultancy.py")
+    
+    cmd = [sys.executable, str(script_path), input_file, "--workers", str(workers)]
+    
+    print(f">> Starting batch consultancy for {input_file} ({workers} workers)...")
+    print()
+    
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    print(result.stdout[-2000:])
+    
+    if result.returncode != 0:
+        print(">> Some companies failed - see the manifest for details")
+        print(result.stderr[-2000:])
+    
+    return result.returncode == 0
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: py consultancy_api.py <company> [industry] [url] [location]")
@@ -5,56 +5,167 @@ Handles authentication, rate limiting, error handling for all modules
 
 import os
 import time
+import atexit
+import threading
 import requests
 from typing import Dict, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from core.lib.rate_limiter import get_rate_limiter
+from core.lib.retry import RetryPolicy, DEFAULT_RETRY_POLICY
+from core.lib.circuit_breaker import get_circuit_breaker
+
 load_dotenv()
 
 
+# Pooled keep-alive sessions, shared per scheme + host for the life of the process
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(base_url: str, pool_connections: int = 10, pool_maxsize: int = 10,
+                pool_block: bool = False) -> requests.Session:
+    """
+    Get the shared pooled session for a host
+    
+    Args:
+        base_url: Any URL on the host (sessions are keyed by scheme + host)
+        pool_connections: Number of per-host pools the adapter caches
+        pool_maxsize: Max keep-alive connections held open per host (an existing
+            session's pool is grown to the largest size any caller asks for)
+        pool_block: Wait for a free connection instead of opening extra ones
+    
+    Returns:
+        requests.Session reused by every client talking to that host
+    """
+    parsed = urlparse(base_url)
+    key = f"{parsed.scheme}://{parsed.netloc}"
+    
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Connection": "keep-alive"})
+            _sessions[key] = session
+        else:
+            # A later caller may need a bigger pool than whoever created the session;
+            # grow it in place so every client sharing the host gets the larger size
+            adapter = session.get_adapter(key)
+            if pool_connections > adapter._pool_connections or pool_maxsize > adapter._pool_maxsize:
+                grown = (max(pool_connections, adapter._pool_connections),
+                         max(pool_maxsize, adapter._pool_maxsize))
+                print(f"[WARN] Growing connection pool for {key} from "
+                      f"{adapter._pool_connections}/{adapter._pool_maxsize} to {grown[0]}/{grown[1]}")
+                adapter.init_poolmanager(*grown, block=adapter._pool_block or pool_block)
+        return session
+
+
+def close_sessions():
+    """Close every pooled session (called automatically at interpreter exit)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+atexit.register(close_sessions)
+
+
 class APIClient:
     """Reusable API client with built-in error handling and rate limiting"""
     
-    def __init__(self, base_url: str, api_key: str = None, rate_limit: float = 0.5):
+    def __init__(self, base_url: str, api_key: str = None, rate_limit: float = 0.5,
+                 rate_limit_key: str = None, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, timeout: float = 30, retry_policy: RetryPolicy = None):
         self.base_url = base_url
         self.api_key = api_key
         self.rate_limit = rate_limit  # Seconds between requests
-        self.last_request_time = 0
+        self.timeout = timeout
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.circuit_breaker = get_circuit_breaker(urlparse(base_url).netloc)
+        
+        # Token bucket shared by every client (and thread) hitting the same API
+        self.rate_limiter = None
+        if rate_limit_key or rate_limit:
+            self.rate_limiter = get_rate_limiter(
+                rate_limit_key or urlparse(base_url).netloc,
+                rate=1.0 / rate_limit if rate_limit else None
+            )
+        self.session = get_session(base_url, pool_connections, pool_maxsize, pool_block)
     
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self.last_request_time = time.time()
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
     
-    def get(self, endpoint: str, params: Dict = None, headers: Dict = None) -> Dict:
-        """GET request with error handling"""
-        self._wait_for_rate_limit()
-        
+    def _request(self, method: str, endpoint: str, headers: Dict = None,
+                 idempotent: bool = None, **kwargs) -> Dict:
+        """Send a request, retrying transient failures per the retry policy"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         _headers = self._build_headers(headers)
         
-        try:
-            response = requests.get(url, params=params, headers=_headers, timeout=30)
-            response.raise_for_status()
-            return {"success": True, "data": response.json()}
-        except requests.exceptions.RequestException as e:
-            return {"success": False, "error": str(e)}
-    
-    def post(self, endpoint: str, data: Dict = None, headers: Dict = None) -> Dict:
-        """POST request with error handling"""
-        self._wait_for_rate_limit()
+        if idempotent is None:
+            idempotent = self.retry_policy.is_idempotent(method, _headers)
         
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        _headers = self._build_headers(headers)
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow_request():
+                return {"success": False, "error": f"Circuit open for {self.circuit_breaker.name}, skipping request"}
+            
+            self._wait_for_rate_limit()
+            
+            try:
+                response = self.session.request(method, url, headers=_headers, timeout=self.timeout, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.circuit_breaker.record_failure()
+                # ConnectionError (incl. ConnectTimeout) means nothing reached the server
+                request_sent = not isinstance(e, requests.exceptions.ConnectionError)
+                if self.retry_policy.should_retry(attempt, idempotent, request_sent=request_sent):
+                    time.sleep(self.retry_policy.delay(attempt))
+                    attempt += 1
+                    continue
+                return {"success": False, "error": str(e)}
+            
+            # 5xx means the provider is unhealthy; 4xx (incl. 429) means it is up and answering
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            
+            if self.retry_policy.should_retry(attempt, idempotent, status=response.status_code):
+                time.sleep(self.retry_policy.delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+            
+            try:
+                response.raise_for_status()
+                return {"success": True, "data": response.json()}
+            except requests.exceptions.RequestException as e:
+                return {"success": False, "error": str(e), "status": response.status_code}
+    
+    def get(self, endpoint: str, params: Dict = None, headers: Dict = None) -> Dict:
+        """GET request with error handling"""
+        return self._request("GET", endpoint, headers=headers, params=params)
+    
+    def post(self, endpoint: str, data: Dict = None, headers: Dict = None,
+             idempotent: bool = None) -> Dict:
+        """
+        POST request with error handling
         
-        try:
-            response = requests.post(url, json=data, headers=_headers, timeout=30)
-            response.raise_for_status()
-            return {"success": True, "data": response.json()}
-        except requests.exceptions.RequestException as e:
-            return {"success": False, "error": str(e)}
+        POSTs are only resent after server errors when marked idempotent
+        (or sent with an Idempotency-Key header); refused requests (429/503,
+        connection failures) are always safe to retry.
+        """
+        return self._request("POST", endpoint, headers=headers, idempotent=idempotent, json=data)
     
     def _build_headers(self, custom_headers: Dict = None) -> Dict:
         """Build headers with API key if available"""
@@ -76,7 +187,8 @@ def get_gemini_client() -> APIClient:
     return APIClient(
         base_url="https://generativelanguage.googleapis.com/v1beta",
         api_key=api_key,
-        rate_limit=1.0  # 60/min = ~1/sec
+        rate_limit=1.0,  # 60/min = ~1/sec
+        rate_limit_key="gemini"
     )
 
 
@@ -86,7 +198,8 @@ def get_keiai_client() -> APIClient:
     return APIClient(
         base_url="https://api.kie.ai/api/v1",
         api_key=api_key,
-        rate_limit=0.5
+        rate_limit=0.5,
+        rate_limit_key="keiai"
     )
 
 
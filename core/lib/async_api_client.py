@@ -0,0 +1,175 @@
+"""
+Async API Client for Antigravity Platform
+asyncio-native counterpart of APIClient for servers and bots that must not block their event loop
+"""
+
+import os
+import asyncio
+import httpx
+from typing import Dict
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+
+from core.lib.rate_limiter import get_rate_limiter, SQLiteTokenBucket
+from core.lib.retry import RetryPolicy, DEFAULT_RETRY_POLICY
+from core.lib.circuit_breaker import get_circuit_breaker
+
+load_dotenv()
+
+
+class AsyncAPIClient:
+    """Async API client with bounded concurrency, same result contract as APIClient"""
+
+    def __init__(self, base_url: str, api_key: str = None, rate_limit: float = 0.5,
+                 rate_limit_key: str = None, max_in_flight: int = 10, timeout: float = 30,
+                 retry_policy: RetryPolicy = None):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.rate_limit = rate_limit  # Seconds between requests
+        self.timeout = timeout
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.circuit_breaker = get_circuit_breaker(urlparse(base_url).netloc)
+        self.max_in_flight = max_in_flight
+
+        # Same shared token bucket the sync APIClient uses for this API
+        self.rate_limiter = None
+        if rate_limit_key or rate_limit:
+            self.rate_limiter = get_rate_limiter(
+                rate_limit_key or urlparse(base_url).netloc,
+                rate=1.0 / rate_limit if rate_limit else None
+            )
+
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the pooled httpx client on first use (inside the running loop)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_in_flight,
+                    max_keepalive_connections=self.max_in_flight
+                )
+            )
+        return self._client
+
+    async def _wait_for_rate_limit(self):
+        """Ensure we don't exceed rate limits without blocking the event loop"""
+        if self.rate_limiter:
+            if isinstance(self.rate_limiter, SQLiteTokenBucket):
+                # The shared bucket's BEGIN IMMEDIATE can wait on another process's lock
+                wait = await asyncio.to_thread(self.rate_limiter.reserve)
+            else:
+                wait = self.rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def _request(self, method: str, endpoint: str, headers: Dict = None,
+                       idempotent: bool = None, **kwargs) -> Dict:
+        """Send a request under the in-flight semaphore, retrying per the retry policy"""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        _headers = self._build_headers(headers)
+
+        if idempotent is None:
+            idempotent = self.retry_policy.is_idempotent(method, _headers)
+
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow_request():
+                return {"success": False, "error": f"Circuit open for {self.circuit_breaker.name}, skipping request"}
+
+            # Backoff sleeps happen outside the semaphore so waiting retries don't hold a slot
+            async with self._semaphore:
+                await self._wait_for_rate_limit()
+
+                try:
+                    response = await self._get_client().request(method, url, headers=_headers, **kwargs)
+                    error = None
+                except httpx.HTTPError as e:
+                    response, error = None, e
+
+            if error is not None:
+                self.circuit_breaker.record_failure()
+                # Connect errors mean nothing reached the server
+                request_sent = not isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+                if self.retry_policy.should_retry(attempt, idempotent, request_sent=request_sent):
+                    await asyncio.sleep(self.retry_policy.delay(attempt))
+                    attempt += 1
+                    continue
+                return {"success": False, "error": str(error)}
+
+            # 5xx means the provider is unhealthy; 4xx (incl. 429) means it is up and answering
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            if self.retry_policy.should_retry(attempt, idempotent, status=response.status_code):
+                await asyncio.sleep(self.retry_policy.delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+
+            try:
+                response.raise_for_status()
+                return {"success": True, "data": response.json()}
+            except (httpx.HTTPError, ValueError) as e:
+                return {"success": False, "error": str(e)}
+
+    async def get(self, endpoint: str, params: Dict = None, headers: Dict = None) -> Dict:
+        """GET request with error handling"""
+        return await self._request("GET", endpoint, headers=headers, params=params)
+
+    async def post(self, endpoint: str, data: Dict = None, headers: Dict = None,
+                   idempotent: bool = None) -> Dict:
+        """POST request with error handling (see APIClient.post for retry semantics)"""
+        return await self._request("POST", endpoint, headers=headers, idempotent=idempotent, json=data)
+
+    def _build_headers(self, custom_headers: Dict = None) -> Dict:
+        """Build headers with API key if available"""
+        headers = {"Content-Type": "application/json"}
+
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        if custom_headers:
+            headers.update(custom_headers)
+
+        return headers
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+# Pre-configured clients for common APIs
+def get_async_gemini_client(max_in_flight: int = 5) -> AsyncAPIClient:
+    """Get configured async Gemini API client"""
+    api_key = os.getenv("GEMINI_API_KEY")
+    return AsyncAPIClient(
+        base_url="https://generativelanguage.googleapis.com/v1beta",
+        api_key=api_key,
+        rate_limit=1.0,  # 60/min = ~1/sec
+        rate_limit_key="gemini",
+        max_in_flight=max_in_flight
+    )
+
+
+def get_async_keiai_client(max_in_flight: int = 5) -> AsyncAPIClient:
+    """Get configured async Kei.ai API client"""
+    api_key = os.getenv("KEI_AI_API_KEY")
+    return AsyncAPIClient(
+        base_url="https://api.kie.ai/api/v1",
+        api_key=api_key,
+        rate_limit=0.5,
+        rate_limit_key="keiai",
+        max_in_flight=max_in_flight
+    )
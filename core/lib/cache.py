@@ -0,0 +1,177 @@
+"""
+Persistent response cache shared across Antigravity modules
+Content-addressed SQLite store with TTL, size-bounded LRU eviction and hit/miss counters
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+
+class SQLiteCache:
+    """Persistent JSON cache with TTL, LRU eviction and hit/miss counters"""
+
+    def __init__(self, db_path: Union[str, Path], namespace: str = "default",
+                 ttl: float = 86400, max_entries: int = 10000):
+        """
+        Args:
+            db_path: SQLite file (created if missing, may be shared by several namespaces)
+            namespace: Logical cache name inside the file
+            ttl: Default time-to-live in seconds
+            max_entries: Entries kept per namespace before least-recently-used ones are evicted
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "created REAL NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (namespace, accessed)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection (safe across threads and processes), committed and closed on exit"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Content-address a request: SHA-256 of its canonical JSON form"""
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, count: bool = True) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry (count=False leaves the hit/miss counters alone)"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires FROM entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+
+            if row and row[1] > now:
+                conn.execute(
+                    "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key)
+                )
+                if count:
+                    with self._lock:
+                        self.hits += 1
+                return json.loads(row[0])
+
+            if row:
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+
+        if count:
+            with self._lock:
+                self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        """Store a JSON-serialisable value, evicting LRU entries past max_entries"""
+        now = time.time()
+        expires = now + (self.ttl if ttl is None else ttl)
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, created, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), now, expires, now)
+            )
+
+            count = conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+            if count > self.max_entries:
+                # Drop expired rows first, then the least recently used ones
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND expires <= ?", (self.namespace, now))
+                overflow = conn.execute(
+                    "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+                ).fetchone()[0] - self.max_entries
+
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM entries WHERE namespace = ? AND key IN ("
+                        "SELECT key FROM entries WHERE namespace = ? ORDER BY accessed LIMIT ?)",
+                        (self.namespace, self.namespace, overflow)
+                    )
+                    with self._lock:
+                        self.evictions += overflow
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+
+    def clear(self):
+        """Remove every entry in this namespace"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this process plus current entry count"""
+        with self._connect() as conn:
+            entries = conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "namespace": self.namespace,
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+
+_caches: Dict[Tuple[str, str], SQLiteCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(db_path: Union[str, Path], namespace: str, ttl: float = 86400,
+              max_entries: int = 10000) -> SQLiteCache:
+    """
+    Get the process-wide cache for a (file, namespace) pair so counters are shared
+
+    Args:
+        db_path: SQLite file
+        namespace: Logical cache name
+        ttl: Default TTL, used only when the cache is first created
+        max_entries: LRU bound, used only when the cache is first created
+
+    Returns:
+        Shared SQLiteCache instance
+    """
+    key = (str(Path(db_path).resolve()), namespace)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = SQLiteCache(db_path, namespace, ttl, max_entries)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,123 @@
+"""
+Circuit breakers for upstream providers
+Fail fast while a provider is down instead of sitting through every timeout
+"""
+
+import time
+import threading
+from datetime import datetime
+from typing import Dict
+
+
+class CircuitBreaker:
+    """Per-host breaker: closed -> open after N consecutive failures -> half-open probe -> closed"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        """
+        Args:
+            name: Upstream key, usually the host name
+            failure_threshold: Consecutive failures before the circuit opens
+            recovery_timeout: Seconds to stay open before letting a probe through
+            half_open_max_calls: Concurrent probes allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.total_failures = 0
+        self.total_rejected = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a call may go out right now"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    self.total_rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self.half_open_calls = 0
+
+            if self.state == self.HALF_OPEN:
+                if self.half_open_calls >= self.half_open_max_calls:
+                    self.total_rejected += 1
+                    return False
+                self.half_open_calls += 1
+
+            return True
+
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.half_open_calls = 0
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold or on a failed probe"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.half_open_calls = 0
+
+    def snapshot(self) -> Dict:
+        """Current state for dashboards and orchestrator logs"""
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+            return {
+                "name": self.name,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "total_failures": self.total_failures,
+                "total_rejected": self.total_rejected,
+                "retry_in_seconds": round(retry_in, 1),
+                "checked_at": datetime.now().isoformat()
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker for an upstream
+
+    Args:
+        name: Upstream key (e.g., "api.search.brave.com")
+        failure_threshold: Used only when the breaker is first created
+        recovery_timeout: Used only when the breaker is first created
+
+    Returns:
+        Shared CircuitBreaker instance
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, failure_threshold, recovery_timeout)
+            _breakers[name] = breaker
+        return breaker
+
+
+def get_breaker_states() -> Dict[str, Dict]:
+    """Snapshot of every breaker created in this process"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.snapshot() for b in breakers}
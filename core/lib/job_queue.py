@@ -0,0 +1,507 @@
+"""
+Durable job queue for long-running background work
+SQLite-backed queue and job store with priorities, admission control, per-tenant concurrency caps,
+indexed paginated history, a fixed-size worker pool and crash recovery for jobs orphaned by a dead process
+"""
+
+import os
+import json
+import uuid
+import socket
+import sqlite3
+import time
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+# Point every service (Vault, MCP server) at the same file to share one job store
+DEFAULT_JOBS_DB = os.getenv("CONSULTANCY_JOBS_DB", str(PROJECT_ROOT / ".tmp" / "jobs" / "consultancy_jobs.db"))
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETE = "complete"
+ERROR = "error"
+
+
+class QueueFullError(Exception):
+    """Raised by submit() when admission control rejects a job"""
+
+    def __init__(self, message: str, retry_after: int = 30):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class JobQueue:
+    """Persistent job queue; every method opens its own connection, so it is safe across threads and processes"""
+
+    def __init__(self, db_path: Union[str, Path], max_queued: int = 100, per_tenant_running: int = 2,
+                 per_tenant_queued: int = 20, max_attempts: int = 2, stale_after: float = 300,
+                 name: str = "default"):
+        """
+        Args:
+            db_path: SQLite file (created if missing, may be shared by several services)
+            name: Queue this instance submits to and claims from; history lookups span all queues
+            max_queued: Jobs allowed to wait before submit() rejects new ones
+            per_tenant_running: Jobs one tenant may have running at once
+            per_tenant_queued: Jobs one tenant may have waiting at once
+            max_attempts: Runs per job before an interrupted job is marked as failed
+            stale_after: Seconds without a heartbeat before a running job counts as orphaned
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_queued = max_queued
+        self.per_tenant_running = per_tenant_running
+        self.per_tenant_queued = per_tenant_queued
+        self.max_attempts = max_attempts
+        self.stale_after = stale_after
+        self.name = name
+        # Identifies this process as the owner of the jobs it claims
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, tenant TEXT NOT NULL, priority INTEGER NOT NULL DEFAULT 0, "
+                "status TEXT NOT NULL, company TEXT, payload TEXT NOT NULL, state TEXT NOT NULL DEFAULT '{}', "
+                "results TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+                "created_at TEXT NOT NULL, started_at TEXT, completed_at TEXT, "
+                "owner TEXT, heartbeat_at TEXT, queue TEXT NOT NULL DEFAULT 'default')"
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "queue" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN queue TEXT NOT NULL DEFAULT 'default'")
+                conn.execute("DROP INDEX IF EXISTS idx_jobs_claim")
+                conn.execute("DROP INDEX IF EXISTS idx_jobs_tenant")
+
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_queue_claim ON jobs (queue, status, priority DESC, created_at)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_queue_tenant ON jobs (queue, tenant, status)")
+            # History lookups: newest first, optionally by company or status
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at, job_id)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE, created_at, job_id)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at, job_id)")
+
+    @contextmanager
+    def _connect(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Short-lived connection wrapped in a transaction
+
+        immediate=True takes the write lock up front (BEGIN IMMEDIATE) so
+        read-then-write sequences such as claiming a job are atomic across processes.
+        """
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            # A failed COMMIT (or SQLite itself) may already have ended the transaction
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        """Flatten a row: payload and state fields sit next to the queue columns"""
+        job = json.loads(row["payload"])
+        job.update(json.loads(row["state"]))
+        job.update({
+            "job_id": row["job_id"],
+            "queue": row["queue"],
+            "tenant": row["tenant"],
+            "priority": row["priority"],
+            "status": row["status"],
+            "company": row["company"],
+            "attempts": row["attempts"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "completed_at": row["completed_at"],
+            "results": json.loads(row["results"]) if row["results"] else None,
+            "error": row["error"]
+        })
+        return job
+
+    def submit(self, job_id: str, payload: Dict, tenant: str = "default", priority: int = 0,
+               company: str = None, state: Dict = None) -> Dict:
+        """
+        Enqueue a job, subject to admission control
+
+        Args:
+            job_id: Unique job ID
+            payload: JSON-serialisable job inputs
+            tenant: Tenant the job is accounted to
+            priority: Higher runs first; FIFO within a priority
+            company: Company name (kept as a column for lookups)
+            state: Initial mutable state (phase, progress, ...)
+
+        Returns:
+            The stored job
+
+        Raises:
+            QueueFullError: Queue or tenant backlog is at its limit
+        """
+        with self._connect(immediate=True) as conn:
+            queued = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE queue = ? AND status = ?", (self.name, QUEUED)
+            ).fetchone()[0]
+            if queued >= self.max_queued:
+                raise QueueFullError(f"Job queue is full ({queued} jobs waiting)")
+
+            tenant_queued = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE queue = ? AND tenant = ? AND status = ?", (self.name, tenant, QUEUED)
+            ).fetchone()[0]
+            if tenant_queued >= self.per_tenant_queued:
+                raise QueueFullError(f"Tenant '{tenant}' already has {tenant_queued} jobs waiting")
+
+            conn.execute(
+                "INSERT INTO jobs (job_id, queue, tenant, priority, status, company, payload, state, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, self.name, tenant, priority, QUEUED, company, json.dumps(payload), json.dumps(state or {}),
+                 self._now())
+            )
+
+        return self.get(job_id)
+
+    def claim(self) -> Optional[Dict]:
+        """
+        Atomically take the next runnable job for this process
+
+        Picks the highest-priority, oldest queued job whose tenant is below its
+        running cap. Returns None when nothing is runnable.
+        """
+        with self._connect(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT job_id FROM jobs AS q WHERE queue = ? AND status = ? AND ("
+                "SELECT COUNT(*) FROM jobs AS r WHERE r.queue = q.queue AND r.tenant = q.tenant AND r.status = ?) < ? "
+                "ORDER BY priority DESC, created_at ASC LIMIT 1",
+                (self.name, QUEUED, RUNNING, self.per_tenant_running)
+            ).fetchone()
+            if not row:
+                return None
+
+            now = self._now()
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, owner = ?, heartbeat_at = ?, attempts = attempts + 1 "
+                "WHERE job_id = ?",
+                (RUNNING, now, self.owner, now, row["job_id"])
+            )
+
+        return self.get(row["job_id"])
+
+    def update_state(self, job_id: str, **fields):
+        """Merge fields into the job's mutable state (also refreshes its heartbeat)"""
+        with self._connect(immediate=True) as conn:
+            row = conn.execute("SELECT state FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if not row:
+                return
+            state = json.loads(row["state"])
+            state.update(fields)
+            conn.execute(
+                "UPDATE jobs SET state = ?, heartbeat_at = ? WHERE job_id = ?",
+                (json.dumps(state), self._now(), job_id)
+            )
+
+    def finish(self, job_id: str, status: str, results: Dict = None, error: str = None, **state):
+        """Mark a job complete or failed, optionally merging final state"""
+        with self._connect(immediate=True) as conn:
+            row = conn.execute("SELECT state FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if not row:
+                return
+            merged = json.loads(row["state"])
+            merged.update(state)
+            conn.execute(
+                "UPDATE jobs SET status = ?, results = ?, error = ?, state = ?, completed_at = ?, owner = NULL "
+                "WHERE job_id = ?",
+                (status, json.dumps(results) if results is not None else None, error, json.dumps(merged),
+                 self._now(), job_id)
+            )
+
+    def heartbeat(self):
+        """Refresh the heartbeat of every job this process is running"""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = ?",
+                (self._now(), self.owner, RUNNING)
+            )
+
+    def recover(self) -> List[str]:
+        """
+        Requeue running jobs whose owner stopped heartbeating (crashed or restarted process)
+
+        Only this queue's jobs are touched; other processes sharing the database
+        recover their own. Jobs that already used max_attempts are failed instead
+        of retried forever.
+
+        Returns:
+            IDs of requeued jobs
+        """
+        cutoff = (datetime.now() - timedelta(seconds=self.stale_after)).isoformat()
+        with self._connect(immediate=True) as conn:
+            rows = conn.execute(
+                "SELECT job_id, attempts FROM jobs "
+                "WHERE queue = ? AND status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+                (self.name, RUNNING, cutoff)
+            ).fetchall()
+
+            requeued = []
+            for row in rows:
+                if row["attempts"] >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, error = ?, completed_at = ?, owner = NULL WHERE job_id = ?",
+                        (ERROR, f"Interrupted {row['attempts']} times, giving up", self._now(), row["job_id"])
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, owner = NULL, started_at = NULL WHERE job_id = ?",
+                        (QUEUED, row["job_id"])
+                    )
+                    requeued.append(row["job_id"])
+
+        return requeued
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a job, or None if unknown"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list_jobs(self, company: str = None, status: str = None, limit: int = 20,
+                  cursor: str = None) -> Dict:
+        """
+        One page of job history, newest first
+
+        Keyset pagination on (created_at, job_id), so every page is an index range
+        scan no matter how many jobs have accumulated.
+
+        Args:
+            company: Only jobs for this company (case-insensitive)
+            status: Only jobs in this status
+            limit: Page size
+            cursor: next_cursor from the previous page
+
+        Returns:
+            {"jobs": [...], "next_cursor": str or None}
+        """
+        clauses, params = [], []
+        if company:
+            clauses.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if cursor:
+            created_at, _, job_id = cursor.partition("|")
+            clauses.append("(created_at < ? OR (created_at = ? AND job_id < ?))")
+            params.extend([created_at, created_at, job_id])
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM jobs {where}ORDER BY created_at DESC, job_id DESC LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+
+        jobs = [self._to_dict(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = jobs[-1]
+            next_cursor = f"{last['created_at']}|{last['job_id']}"
+        return {"jobs": jobs, "next_cursor": next_cursor}
+
+    def stats(self) -> Dict:
+        """Job counts per status for this queue plus admission limits"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs WHERE queue = ? GROUP BY status", (self.name,)
+            ).fetchall()
+        counts = {QUEUED: 0, RUNNING: 0, COMPLETE: 0, ERROR: 0}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return {
+            "queue": self.name,
+            "counts": counts,
+            "max_queued": self.max_queued,
+            "per_tenant_running": self.per_tenant_running,
+            "per_tenant_queued": self.per_tenant_queued
+        }
+
+
+class JobProgressRecorder:
+    """
+    Turns engine progress events into a claimed job's state and persists it
+
+    Phase and job events are written immediately; counter-only updates at most
+    once per persist_interval, so a chatty job doesn't hammer the store.
+    """
+
+    def __init__(self, queue: JobQueue, job: Dict, phase_weights: Dict[str, int],
+                 recent_events: int = 20, persist_interval: float = 1.0):
+        """
+        Args:
+            queue: Store the job lives in
+            job: Claimed job (its state fields are reset for a fresh run)
+            phase_weights: Progress percentage credited when each phase succeeds
+            recent_events: Events kept in state for status queries
+            persist_interval: Minimum seconds between counter-only writes
+        """
+        self.queue = queue
+        self.job_id = job["job_id"]
+        self.phase_weights = phase_weights
+        self.recent_limit = recent_events
+        self.persist_interval = persist_interval
+        # A job recovered after a crash starts over from a clean slate
+        self.phase = "starting"
+        self.progress = 0
+        self.phases: Dict[str, str] = {}
+        self.counters: Dict = {}
+        self.recent: List[Dict] = []
+        self._persisted = 0.0
+        self._lock = threading.Lock()
+        self.queue.update_state(self.job_id, **self.state())
+
+    def state(self) -> Dict:
+        """Current state as stored on the job"""
+        with self._lock:
+            return {
+                "phase": self.phase,
+                "progress": self.progress,
+                "phases": dict(self.phases),
+                "counters": dict(self.counters),
+                "recent_events": list(self.recent)
+            }
+
+    def __call__(self, event: Dict):
+        with self._lock:
+            self.counters = event.get("counters", self.counters)
+            self.recent = (self.recent + [{k: v for k, v in event.items() if k != "counters"}])[-self.recent_limit:]
+
+            if event["type"] == "phase_start":
+                self.phase = event["phase"]
+                self.phases[event["phase"]] = RUNNING
+            elif event["type"] == "phase_end":
+                self.phases[event["phase"]] = event["status"]
+                if event["status"] == "success":
+                    self.progress = min(99, self.progress + self.phase_weights.get(event["phase"], 0))
+
+            now = time.monotonic()
+            persist = event["type"].startswith(("phase_", "job_")) or now - self._persisted >= self.persist_interval
+            if persist:
+                self._persisted = now
+
+        if persist:
+            self.queue.update_state(self.job_id, **self.state())
+
+    def finish(self, status: str, results: Dict = None, error: str = None):
+        """Store the outcome together with the final progress state"""
+        state = self.state()
+        if status == COMPLETE:
+            state.update(phase=COMPLETE, progress=100)
+        self.queue.finish(self.job_id, status, results=results, error=error, **state)
+
+
+class WorkerPool:
+    """Fixed number of threads that claim jobs from a JobQueue and run them through a handler"""
+
+    def __init__(self, queue: JobQueue, handler: Callable[[Dict], None], workers: int = 2,
+                 poll_interval: float = 2.0, heartbeat_interval: float = 30.0):
+        """
+        Args:
+            queue: Queue to claim from
+            handler: Called with the claimed job; must call queue.finish() (unhandled
+                     exceptions are recorded as errors)
+            workers: Jobs run concurrently by this process
+            poll_interval: Seconds between claim attempts while idle (notify() wakes workers early)
+            heartbeat_interval: Seconds between heartbeats and orphan recovery sweeps
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Recover orphaned jobs, then start workers and the heartbeat thread"""
+        if self._threads:
+            return
+
+        requeued = self.queue.recover()
+        if requeued:
+            print(f"[QUEUE] Requeued {len(requeued)} interrupted jobs")
+
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        thread = threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def notify(self):
+        """Wake idle workers (call after submitting a job)"""
+        self._wakeup.set()
+
+    def stop(self, timeout: float = None):
+        """Stop claiming new jobs; running jobs finish (or are recovered after a restart)"""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self):
+        while not self._stopping.is_set():
+            try:
+                if not self._work_one():
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+            except Exception as e:
+                # A worker that dies silently shrinks the pool; log and keep going
+                print(f"[QUEUE] Worker error: {e}")
+                self._stopping.wait(self.poll_interval)
+
+    def _work_one(self) -> bool:
+        """Claim and run one job; False when there was nothing to claim"""
+        job = self.queue.claim()
+        if job is None:
+            return False
+
+        try:
+            self.handler(job)
+        except Exception as e:
+            self.queue.finish(job["job_id"], ERROR, error=str(e))
+
+        # A finished job may free a tenant slot for another waiting job
+        self._wakeup.set()
+        return True
+
+    def _heartbeat(self):
+        while not self._stopping.wait(self.heartbeat_interval):
+            try:
+                self.queue.heartbeat()
+                if self.queue.recover():
+                    self._wakeup.set()
+            except sqlite3.Error as e:
+                print(f"[QUEUE] Heartbeat failed: {e}")
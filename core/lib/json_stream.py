@@ -0,0 +1,133 @@
+"""
+Incremental JSON parsing for streamed LLM output
+Emits elements of chosen top-level arrays as soon as they close and rejects malformed output early
+"""
+
+import json
+from typing import Any, Iterable, List, Tuple
+
+# Text allowed before the JSON document (markdown code fence)
+FENCE_PREFIXES = ("```json", "```JSON", "```")
+
+
+class IncrementalJSONParser:
+    """
+    Parses one JSON object fed in arbitrary chunks
+
+    Tracks string/escape state and bracket nesting character by character, so
+    every element of a watched top-level array (e.g. "opportunities") can be
+    decoded the moment its closing brace arrives. Structural errors (prose
+    instead of JSON, mismatched brackets) raise ValueError on the chunk that
+    contains them rather than after the whole generation.
+    """
+
+    def __init__(self, arrays: Iterable[str] = ()):
+        """
+        Args:
+            arrays: Top-level keys whose array elements are emitted incrementally
+        """
+        self.arrays = set(arrays)
+        self.text = ""          # Everything fed so far (kept for error reporting and the final decode)
+        self._pos = 0           # Next character of self.text to scan
+        self._start = None      # Index of the document's opening brace
+        self._end = None        # Index just past its closing brace
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = None
+        self._keys: List[str] = []   # Key of the value being parsed, per object level
+        self._item_start = None
+        self._array_key = None
+
+    def _fail(self, message: str):
+        raise ValueError(f"{message} at offset {self._pos}: {self.text[max(0, self._pos - 40):self._pos + 1]!r}")
+
+    def _prefix_ok(self, complete: bool) -> bool:
+        """Only whitespace or a markdown fence (possibly still arriving) may precede the document"""
+        prefix = self.text[:self._pos + (0 if complete else 1)].strip()
+        if complete:
+            return not prefix or prefix in FENCE_PREFIXES
+        return not prefix or any(fence.startswith(prefix) for fence in FENCE_PREFIXES)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk
+
+        Returns:
+            (array key, decoded element) for every watched element completed in this chunk
+        """
+        self.text += chunk
+        completed = []
+
+        while self._pos < len(self.text):
+            char = self.text[self._pos]
+
+            if self._end is not None:
+                pass  # Trailing fence/whitespace after the document is ignored
+
+            elif self._start is None:
+                if char == "{" and self._prefix_ok(complete=True):
+                    self._start = self._pos
+                    self._stack.append("{")
+                    self._keys.append(None)
+                elif not self._prefix_ok(complete=False):
+                    self._fail("Response is not JSON")
+
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._last_string = self.text[self._string_start + 1:self._pos]
+
+            elif char == '"':
+                self._in_string = True
+                self._string_start = self._pos
+
+            elif char == ":":
+                if self._stack[-1] == "{":
+                    self._keys[-1] = self._last_string
+
+            elif char in "{[":
+                # A watched top-level array opens, or one of its elements starts
+                if len(self._stack) == 1 and char == "[" and self._keys[-1] in self.arrays:
+                    self._array_key = self._keys[-1]
+                elif len(self._stack) == 2 and self._array_key is not None:
+                    self._item_start = self._pos
+                self._stack.append(char)
+                self._keys.append(None)
+
+            elif char in "}]":
+                expected = "{" if char == "}" else "["
+                if not self._stack or self._stack[-1] != expected:
+                    self._fail("Mismatched bracket")
+                self._stack.pop()
+                self._keys.pop()
+
+                if len(self._stack) == 2 and self._item_start is not None:
+                    raw = self.text[self._item_start:self._pos + 1]
+                    try:
+                        completed.append((self._array_key, json.loads(raw)))
+                    except json.JSONDecodeError as e:
+                        self._fail(f"Malformed {self._array_key} element ({e.msg})")
+                    self._item_start = None
+                elif len(self._stack) == 1 and self._array_key is not None:
+                    self._array_key = None
+                elif not self._stack:
+                    self._end = self._pos + 1
+
+            self._pos += 1
+
+        return completed
+
+    def close(self) -> Any:
+        """Decode the complete document (raises ValueError if it never finished or is invalid)"""
+        if self._start is None:
+            self._pos = len(self.text)
+            self._fail("Response is not JSON")
+        if self._end is None:
+            self._fail("Response ended before the JSON document closed")
+        return json.loads(self.text[self._start:self._end])
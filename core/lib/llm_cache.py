@@ -0,0 +1,269 @@
+"""
+LLM response cache shared across Antigravity modules
+Exact matches on normalised prompt + model + generation params, with opt-in MinHash near-duplicate matching
+"""
+
+import os
+import re
+import json
+import struct
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from core.lib.cache import get_cache
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = os.getenv("LLM_CACHE_DB", str(PROJECT_ROOT / ".tmp" / "cache" / "llm_responses.db"))
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Near-duplicate index rows of evicted/expired completions are swept at least every this many stores
+INDEX_SWEEP_EVERY = 100
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry"""
+    return re.sub(r"\s+", " ", prompt).strip()
+
+
+class MinHasher:
+    """MinHash signatures over word shingles for cheap Jaccard estimates"""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 42):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> List[int]:
+        """Signature of the text's word shingles (one blake2b hash per shingle, then cheap permutations)"""
+        words = text.lower().split()
+        size = self.shingle_size
+        shingles = {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+        hashes = [
+            struct.unpack("<Q", hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest())[0]
+            for s in shingles
+        ]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    @staticmethod
+    def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        matches = sum(1 for a, b in zip(sig_a, sig_b) if a == b)
+        return matches / len(sig_a)
+
+
+class LLMCache:
+    """Cache for LLM completions with TTL, LRU eviction and optional near-duplicate matching"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, ttl: float = 3 * 86400, max_entries: int = 5000,
+                 near_duplicates: bool = False, similarity_threshold: float = 0.9, bands: int = 16):
+        """
+        Args:
+            db_path: SQLite file for cached completions
+            ttl: Seconds a completion stays valid
+            max_entries: LRU bound on stored completions
+            near_duplicates: Also serve prompts whose estimated Jaccard similarity >= threshold
+            similarity_threshold: Minimum similarity for a near-duplicate hit
+            bands: LSH bands (MinHash permutations are split evenly across them)
+        """
+        self.entries = get_cache(db_path, "llm", ttl, max_entries)
+        self.db_path = Path(db_path)
+        self.near_duplicates = near_duplicates
+        self.similarity_threshold = similarity_threshold
+        self.bands = bands
+        self.hasher = MinHasher(num_perm=bands * 4)
+        self.near_hits = 0
+        self._lock = threading.Lock()
+        self._stores = 0
+        self._swept_evictions = 0
+
+        if near_duplicates:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_signatures ("
+                    "key TEXT PRIMARY KEY, scope TEXT NOT NULL, signature TEXT NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_bands ("
+                    "scope TEXT NOT NULL, band INTEGER NOT NULL, bucket TEXT NOT NULL, key TEXT NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_bands ON llm_bands (scope, band, bucket)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_bands_key ON llm_bands (key)")
+                self._sweep_index(conn)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _sweep_index(self, conn: sqlite3.Connection):
+        """
+        Drop signature and band rows whose completion is gone
+
+        SQLiteCache evicts (LRU) and expires entries without knowing about the
+        near-duplicate index, so without this both tables grow forever and
+        band lookups keep returning dead keys.
+        """
+        conn.execute(
+            "DELETE FROM llm_signatures WHERE key NOT IN ("
+            "SELECT key FROM entries WHERE namespace = ? AND expires > ?)",
+            (self.entries.namespace, time.time())
+        )
+        conn.execute("DELETE FROM llm_bands WHERE key NOT IN (SELECT key FROM llm_signatures)")
+
+    def _band_buckets(self, signature: List[int]) -> List[str]:
+        rows = len(signature) // self.bands
+        return [
+            hashlib.sha1(json.dumps(signature[i * rows:(i + 1) * rows]).encode("utf-8")).hexdigest()
+            for i in range(self.bands)
+        ]
+
+    def get(self, prompt: str, model: str, params: Dict = None) -> Optional[str]:
+        """
+        Look up a cached completion
+
+        Args:
+            prompt: Full prompt text
+            model: Model name (part of the key)
+            params: Generation params such as temperature (part of the key)
+
+        Returns:
+            Cached completion text, or None on miss
+        """
+        normalized = normalize_prompt(prompt)
+        scope = self.entries.make_key(model, params or {})
+        cached = self.entries.get(self.entries.make_key(normalized, scope))
+        if cached is not None or not self.near_duplicates:
+            return cached
+
+        signature = self.hasher.signature(normalized)
+        with self._connect() as conn:
+            candidates = set()
+            for band, bucket in enumerate(self._band_buckets(signature)):
+                rows = conn.execute(
+                    "SELECT key FROM llm_bands WHERE scope = ? AND band = ? AND bucket = ?",
+                    (scope, band, bucket)
+                ).fetchall()
+                candidates.update(r[0] for r in rows)
+
+            best_key, best_score = None, 0.0
+            for key in candidates:
+                row = conn.execute("SELECT signature FROM llm_signatures WHERE key = ?", (key,)).fetchone()
+                if not row:
+                    continue
+                score = MinHasher.similarity(signature, json.loads(row[0]))
+                if score > best_score:
+                    best_key, best_score = key, score
+
+        if best_key is None or best_score < self.similarity_threshold:
+            return None
+
+        # The exact lookup above already counted this request once
+        cached = self.entries.get(best_key, count=False)
+        if cached is None:
+            # Entry expired or was evicted; drop its stale index rows
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_bands WHERE key = ?", (best_key,))
+                conn.execute("DELETE FROM llm_signatures WHERE key = ?", (best_key,))
+            return None
+
+        with self._lock:
+            self.near_hits += 1
+        return cached
+
+    def set(self, prompt: str, model: str, text: str, params: Dict = None):
+        """Store a completion for this prompt/model/params"""
+        normalized = normalize_prompt(prompt)
+        scope = self.entries.make_key(model, params or {})
+        key = self.entries.make_key(normalized, scope)
+        self.entries.set(key, text)
+
+        if self.near_duplicates:
+            signature = self.hasher.signature(normalized)
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_bands WHERE key = ?", (key,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_signatures (key, scope, signature) VALUES (?, ?, ?)",
+                    (key, scope, json.dumps(signature))
+                )
+                conn.executemany(
+                    "INSERT INTO llm_bands (scope, band, bucket, key) VALUES (?, ?, ?, ?)",
+                    [(scope, band, bucket, key) for band, bucket in enumerate(self._band_buckets(signature))]
+                )
+
+                # Sweep right after this store evicted anything, and periodically for expiries
+                with self._lock:
+                    self._stores += 1
+                    evictions = self.entries.evictions
+                    sweep = evictions != self._swept_evictions or self._stores % INDEX_SWEEP_EVERY == 0
+                    self._swept_evictions = evictions
+                if sweep:
+                    self._sweep_index(conn)
+
+    def get_or_generate(self, prompt: str, model: str, generate: Callable[[], str],
+                        params: Dict = None) -> str:
+        """
+        Return the cached completion or call generate() and cache its result
+
+        Exceptions from generate() propagate and nothing is cached, so callers
+        keep their existing error handling.
+        """
+        cached = self.get(prompt, model, params)
+        if cached is not None:
+            return cached
+
+        text = generate()
+        if text:
+            self.set(prompt, model, text, params)
+        return text
+
+    def stats(self) -> Dict:
+        """Hit/miss counters (a near-duplicate hit counts as one hit) plus near-duplicate hits"""
+        stats = self.entries.stats()
+        with self._lock:
+            near_hits = self.near_hits
+
+        # Each near hit was first recorded as an exact miss
+        stats["hits"] += near_hits
+        stats["misses"] -= near_hits
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["near_duplicate_hits"] = near_hits
+        return stats
+
+
+_default_cache: Optional[LLMCache] = None
+_default_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """
+    Get the process-wide LLM cache
+
+    Configured via LLM_CACHE_DB, LLM_CACHE_TTL (seconds), LLM_CACHE_MAX_ENTRIES and
+    LLM_CACHE_NEAR_DUPLICATES=1 to opt in to MinHash near-duplicate matching.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = LLMCache(
+                db_path=DEFAULT_DB_PATH,
+                ttl=float(os.getenv("LLM_CACHE_TTL", 3 * 86400)),
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", 5000)),
+                near_duplicates=os.getenv("LLM_CACHE_NEAR_DUPLICATES", "0") == "1"
+            )
+        return _default_cache
@@ -0,0 +1,306 @@
+"""
+PDF rendering service
+Renders HTML held in memory with a long-lived renderer instead of one browser/parse per report:
+WeasyPrint with cached stylesheets and font configuration, or a warm pool of Chromium contexts
+"""
+
+import os
+import re
+import atexit
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+PDF_ENGINE = os.getenv("PDF_ENGINE", "auto")  # auto | weasyprint | playwright
+PDF_MAX_CONCURRENCY = int(os.getenv("PDF_MAX_CONCURRENCY", 4))
+# Browser contexts are replaced after this many jobs so leaked memory never accumulates
+PDF_RECYCLE_AFTER = int(os.getenv("PDF_RECYCLE_AFTER", 50))
+PDF_TIMEOUT = float(os.getenv("PDF_TIMEOUT", 60))
+
+STYLESHEET_CACHE_SIZE = 32
+
+# Plain <style> blocks (no media attribute) are lifted out and served from the stylesheet cache
+STYLE_BLOCK = re.compile(r"<style(?:\s+type=[\"']text/css[\"'])?\s*>(.*?)</style>", re.I | re.S)
+HEAD_OPEN = re.compile(r"<head[^>]*>", re.I)
+
+
+def _with_base(html: str, base_url: Optional[str]) -> str:
+    """Add a <base> tag so relative assets resolve when the HTML never touches disk"""
+    if not base_url:
+        return html
+    tag = f'<base href="{base_url.rstrip("/")}/">'
+    match = HEAD_OPEN.search(html)
+    return html[:match.end()] + tag + html[match.end():] if match else tag + html
+
+
+class WeasyPrintRenderer:
+    """
+    WeasyPrint with parsed stylesheets and fonts reused across reports
+
+    Reports built from the same template share their <style> blocks, so each
+    distinct block is parsed into a CSS object once per base URL (relative
+    url(...) references resolve against it) and handed back to every later
+    render instead of being re-parsed with the document.
+    """
+
+    def __init__(self, max_concurrency: int = PDF_MAX_CONCURRENCY):
+        self._slots = threading.Semaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._stylesheets: "OrderedDict[tuple, object]" = OrderedDict()
+        self._font_config = None
+        self._modules = None
+
+    def _load(self):
+        # Imported under the lock: a concurrent import of a half-failed module raises KeyError
+        with self._lock:
+            if self._modules is None:
+                try:
+                    import weasyprint
+                    from weasyprint.text.fonts import FontConfiguration
+                except OSError as e:
+                    # weasyprint raises OSError (not ImportError) when Pango/Cairo are missing
+                    raise ImportError(f"weasyprint system libraries missing: {e}") from e
+                self._modules = (weasyprint, FontConfiguration)
+            return self._modules
+
+    def _stylesheet(self, css_text: str, base_url: Optional[str], weasyprint):
+        key = (css_text, base_url)
+        with self._lock:
+            sheet = self._stylesheets.get(key)
+            if sheet is not None:
+                self._stylesheets.move_to_end(key)
+                return sheet
+
+        sheet = weasyprint.CSS(string=css_text, base_url=base_url, font_config=self._font_config)
+        with self._lock:
+            self._stylesheets[key] = sheet
+            while len(self._stylesheets) > STYLESHEET_CACHE_SIZE:
+                self._stylesheets.popitem(last=False)
+        return sheet
+
+    def render(self, html: str, base_url: Optional[str] = None) -> bytes:
+        """Render HTML to PDF bytes"""
+        weasyprint, FontConfiguration = self._load()
+        with self._lock:
+            if self._font_config is None:
+                self._font_config = FontConfiguration()
+
+        stylesheets = [self._stylesheet(css, base_url, weasyprint) for css in STYLE_BLOCK.findall(html)]
+        body = STYLE_BLOCK.sub("", html)
+
+        with self._slots:
+            document = weasyprint.HTML(string=body, base_url=base_url)
+            return document.write_pdf(stylesheets=stylesheets, font_config=self._font_config)
+
+
+class ChromiumPool:
+    """
+    One headless Chromium kept alive for the process with a pool of warm contexts
+
+    Playwright's async API runs on a private event loop thread, so callers on
+    any thread can submit work. Each pooled slot is a context with an open
+    page; HTML is loaded with set_content (no temp files), at most `size`
+    reports render at once, and a slot is rebuilt after `recycle_after` jobs
+    or any failure. A browser that dies is relaunched.
+    """
+
+    def __init__(self, size: int = PDF_MAX_CONCURRENCY, recycle_after: int = PDF_RECYCLE_AFTER,
+                 timeout: float = PDF_TIMEOUT):
+        self.size = size
+        self.recycle_after = recycle_after
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright = None
+        self._browser = None
+        self._idle: Optional[asyncio.Queue] = None
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            from playwright.async_api import async_playwright
+
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="pdf-chromium", daemon=True).start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._start(async_playwright), loop).result(self.timeout)
+            except Exception:
+                loop.call_soon_threadsafe(loop.stop)
+                raise
+            self._loop = loop
+
+    async def _start(self, async_playwright):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._new_slot())
+
+    async def _new_slot(self) -> dict:
+        if not self._browser.is_connected():
+            self._browser = await self._playwright.chromium.launch()
+        context = await self._browser.new_context()
+        return {"context": context, "page": await context.new_page(), "jobs": 0, "origin": None}
+
+    async def _retire(self, slot: dict):
+        try:
+            await slot["context"].close()
+        except Exception:
+            pass  # Already gone with a crashed browser
+
+    async def _render(self, html: str, base_url: Optional[str]) -> bytes:
+        slot = await self._idle.get()
+        try:
+            # None marks a slot whose rebuild failed earlier; build it now
+            if slot is None:
+                slot = await self._new_slot()
+            # set_content keeps the page's origin; local assets only load from a file:// origin
+            if base_url and base_url.startswith("file:") and slot["origin"] != base_url:
+                await slot["page"].goto(base_url, timeout=self.timeout * 1000)
+                slot["origin"] = base_url
+            await slot["page"].set_content(_with_base(html, base_url), wait_until="load",
+                                           timeout=self.timeout * 1000)
+            pdf = await slot["page"].pdf(format="A4", print_background=True)
+            slot["jobs"] += 1
+            return pdf
+        except BaseException:
+            # Includes cancellation after a caller timed out: the page may be mid-load
+            if slot is not None:
+                slot["jobs"] = self.recycle_after
+            raise
+        finally:
+            if slot is not None and slot["jobs"] >= self.recycle_after:
+                await self._retire(slot)
+                try:
+                    slot = await self._new_slot()
+                except Exception:
+                    slot = None
+            self._idle.put_nowait(slot)
+
+    def render(self, html: str, base_url: Optional[str] = None) -> bytes:
+        """
+        Render HTML to PDF bytes on a pooled context (blocks while all contexts are busy)
+
+        Raises:
+            TimeoutError: No PDF within `timeout` seconds, waiting for a context included
+        """
+        self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self._render(html, base_url), self._loop)
+        try:
+            return future.result(self.timeout)
+        except FutureTimeout:
+            # Cancelling frees the context; its slot is rebuilt before reuse
+            future.cancel()
+            raise TimeoutError(f"Chromium render exceeded {self.timeout:g}s")
+
+    async def _stop(self):
+        while not self._idle.empty():
+            slot = self._idle.get_nowait()
+            if slot is not None:
+                await self._retire(slot)
+        await self._browser.close()
+        await self._playwright.stop()
+
+    def close(self):
+        """Close the browser and stop the loop thread"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._stop(), loop).result(self.timeout)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class PDFRenderer:
+    """
+    Renders in-memory HTML to PDF with the first engine that works
+
+    "auto" tries WeasyPrint first and falls back to the Chromium pool, the
+    same order the report scripts always used. An engine that is not
+    installed is skipped for the rest of the process.
+    """
+
+    ENGINES = ("weasyprint", "playwright")
+
+    def __init__(self, engine: str = PDF_ENGINE, max_concurrency: int = PDF_MAX_CONCURRENCY,
+                 recycle_after: int = PDF_RECYCLE_AFTER):
+        if engine != "auto" and engine not in self.ENGINES:
+            raise ValueError(f"Unknown PDF engine: {engine}")
+        self.engines: List[str] = list(self.ENGINES) if engine == "auto" else [engine]
+        self.renderers = {
+            "weasyprint": WeasyPrintRenderer(max_concurrency),
+            "playwright": ChromiumPool(max_concurrency, recycle_after)
+        }
+        self.unavailable = set()
+        self.last_engine: Optional[str] = None
+
+    def render(self, html: str, base_url: Optional[str] = None, engine: Optional[str] = None) -> bytes:
+        """
+        Render HTML to PDF bytes
+
+        Args:
+            html: Complete HTML document
+            base_url: URL (file:// for local directories, with trailing slash) that relative
+                images/stylesheets resolve against
+            engine: Use only this engine instead of the configured order
+
+        Raises:
+            RuntimeError: If no engine is installed or every engine failed
+        """
+        errors = []
+        for name in [engine] if engine else self.engines:
+            if name in self.unavailable:
+                errors.append(f"{name} not installed")
+                continue
+            try:
+                pdf = self.renderers[name].render(html, base_url)
+            except ImportError as e:
+                self.unavailable.add(name)
+                errors.append(f"{name} not installed ({e})")
+                continue
+            except Exception as e:
+                print(f"[WARN] {name} PDF rendering failed: {e}")
+                errors.append(f"{name}: {e}")
+                continue
+            self.last_engine = name
+            return pdf
+
+        raise RuntimeError("PDF rendering failed: " + "; ".join(errors))
+
+    def render_to_file(self, html: str, path: Union[str, Path], base_url: Optional[str] = None,
+                       engine: Optional[str] = None) -> Path:
+        """Render HTML and write the PDF; returns the path"""
+        pdf = self.render(html, base_url, engine)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(pdf)
+        return path
+
+    def close(self):
+        self.renderers["playwright"].close()
+
+
+_renderer: Optional[PDFRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_pdf_renderer() -> PDFRenderer:
+    """Get the process-wide PDF renderer (browser launched lazily, closed at exit)"""
+    global _renderer
+
+    if _renderer is not None:
+        return _renderer
+
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = PDFRenderer()
+            atexit.register(_renderer.close)
+        return _renderer
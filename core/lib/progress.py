@@ -0,0 +1,94 @@
+"""
+Progress reporting for long-running jobs
+Thread-safe counters (queries, LLM calls in flight, bytes written) forwarded to a listener as events
+"""
+
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+
+class ProgressTracker:
+    """
+    Collects progress for one job and forwards every change as an event
+
+    Every event carries a snapshot of the counters, so consumers only need the
+    latest one. Without a listener the tracker just counts, which keeps it
+    cheap to pass around unconditionally.
+    """
+
+    def __init__(self, on_event: Optional[Callable[[Dict], None]] = None, **context):
+        """
+        Args:
+            on_event: Called with each event dict; runs on the reporting thread
+            context: Extra fields stamped on every event (e.g. company)
+        """
+        self.on_event = on_event
+        self.context = context
+
+        self.queries_total = 0
+        self.queries_completed = 0
+        self.llm_in_flight = 0
+        self.llm_calls_completed = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+    def counters(self) -> Dict:
+        """Current counter values"""
+        with self._lock:
+            return {
+                "queries_total": self.queries_total,
+                "queries_completed": self.queries_completed,
+                "llm_in_flight": self.llm_in_flight,
+                "llm_calls_completed": self.llm_calls_completed,
+                "bytes_written": self.bytes_written
+            }
+
+    def emit(self, event_type: str, **data):
+        """Send an event to the listener (a failing listener never breaks the job)"""
+        if not self.on_event:
+            return
+
+        event = {"type": event_type, "timestamp": datetime.now().isoformat()}
+        event.update(self.context)
+        event.update(data)
+        event["counters"] = self.counters()
+
+        try:
+            self.on_event(event)
+        except Exception as e:
+            print(f"[WARN] Progress listener failed: {e}")
+
+    def add_queries(self, count: int, label: str = None):
+        """Announce queries about to run"""
+        with self._lock:
+            self.queries_total += count
+        self.emit("queries_planned", label=label, count=count)
+
+    def query_done(self, label: str = None):
+        """Mark one announced query as finished (success or failure)"""
+        with self._lock:
+            self.queries_completed += 1
+        self.emit("query_done", label=label)
+
+    @contextmanager
+    def llm_call(self, label: str = None) -> Iterator[None]:
+        """Track an LLM request for the duration of the block"""
+        with self._lock:
+            self.llm_in_flight += 1
+        self.emit("llm_start", label=label)
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.llm_in_flight -= 1
+                self.llm_calls_completed += 1
+            self.emit("llm_end", label=label)
+
+    def wrote(self, path: str, nbytes: int):
+        """Record an output file"""
+        with self._lock:
+            self.bytes_written += nbytes
+        self.emit("file_written", path=path, bytes=nbytes)
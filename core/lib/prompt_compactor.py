@@ -0,0 +1,202 @@
+"""
+Prompt compaction for research payloads
+Flattens JSON into facts, drops URLs/metadata/boilerplate, removes near-duplicate snippets,
+ranks facts by relevance to the prompt and fits each section into a token budget
+"""
+
+import re
+import json
+from typing import Any, Dict, List, Tuple
+
+from core.lib.search_index import BM25Index, tokenize
+
+# Keys that never help the model: links, bookkeeping and scraper/knowledge-base metadata
+DROP_KEYS = {
+    "url", "urls", "link", "links", "timestamp", "scraped_at", "fetched_at", "checked", "etag",
+    "last_modified", "pages", "source", "evidence", "program_id", "relevance", "knowledge_base",
+    "log_file", "file", "error"
+}
+
+URL_PATTERN = re.compile(r"(https?://|www\.)\S+", re.I)
+BOILERPLATE_PATTERN = re.compile(
+    r"(cookies?|privacy policy|terms of (use|service)|all rights reserved|©|copyright \d{4}|"
+    r"subscribe to our newsletter|sign (in|up)|log ?in|skip to (main )?content|accept all)",
+    re.I
+)
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+
+MAX_FACT_CHARS = 400
+MIN_FACT_TOKENS = 8  # Smaller leftovers are not worth a truncated fact
+NEAR_DUPLICATE = 0.8
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English prose)"""
+    return (len(text) + 3) // 4
+
+
+class PromptCompactor:
+    """Turns research/strategy/funding JSON into a compact, budgeted fact list"""
+
+    def __init__(self, drop_keys: set = None, near_duplicate: float = NEAR_DUPLICATE):
+        self.drop_keys = DROP_KEYS if drop_keys is None else drop_keys
+        self.near_duplicate = near_duplicate
+
+    def _clean(self, text: str) -> str:
+        """Strip URLs and collapse whitespace"""
+        return " ".join(URL_PATTERN.sub("", str(text)).split())
+
+    def _record(self, item: Dict) -> str:
+        """One fact for a flat record (search hit, opportunity, program)"""
+        fields = {
+            key: self._clean(value) for key, value in item.items()
+            if key not in self.drop_keys and isinstance(value, (str, int, float)) and str(value).strip()
+        }
+        if "title" in fields and "description" in fields:
+            head = f"{fields.pop('title')} — {fields.pop('description')}"
+            return "; ".join([head] + [f"{key}: {value}" for key, value in fields.items()])
+        return "; ".join(f"{key}: {value}" for key, value in fields.items())
+
+    def facts(self, data: Any, path: str = "") -> List[str]:
+        """Flatten data into short, URL-free facts in document order"""
+        if data is None:
+            return []
+
+        if isinstance(data, dict):
+            scalars = all(not isinstance(value, (dict, list)) for value in data.values())
+            if scalars and path:
+                record = self._record(data)
+                return [record] if record else []
+            facts = []
+            for key, value in data.items():
+                if key in self.drop_keys:
+                    continue
+                sub = self.facts(value, key)
+                # Label short values and plain lists ("pain_points: ..."); long prose and records speak for themselves
+                labelled = (
+                    (not isinstance(value, (dict, list)) and len(sub) == 1)
+                    or (isinstance(value, list) and all(not isinstance(item, (dict, list)) for item in value))
+                )
+                if labelled:
+                    sub = [f"{key}: {fact}" for fact in sub]
+                facts.extend(sub)
+            return facts
+
+        if isinstance(data, list):
+            return [fact for item in data for fact in self.facts(item, path)]
+
+        # Long prose (scraped pages, summaries) is split so ranking can keep the useful sentences
+        text = self._clean(data)
+        sentences = SENTENCE_SPLIT.split(str(data)) if len(text) > MAX_FACT_CHARS else [str(data)]
+        facts = []
+        for sentence in sentences:
+            sentence = self._clean(sentence)
+            if sentence and not (len(sentence) < 160 and BOILERPLATE_PATTERN.search(sentence)):
+                facts.append(sentence[:MAX_FACT_CHARS])
+        return facts
+
+    def _dedupe(self, facts: List[str]) -> Tuple[List[str], int]:
+        """Drop exact and near-duplicate facts (word-set Jaccard similarity)"""
+        kept, kept_words = [], []
+        for fact in facts:
+            words = set(tokenize(fact))
+            if not words:
+                continue
+            if any(
+                len(words & other) / len(words | other) >= self.near_duplicate for other in kept_words
+            ):
+                continue
+            kept.append(fact)
+            kept_words.append(words)
+        return kept, len(facts) - len(kept)
+
+    def _select(self, facts: List[str], budget: int, focus: str) -> List[str]:
+        """Most relevant facts that fit the budget, returned in document order"""
+        scores = dict(BM25Index(dict(enumerate(facts))).search(focus, top_k=len(facts))) if focus else {}
+        ranked = sorted(range(len(facts)), key=lambda i: (-scores.get(i, 0.0), i))
+
+        chosen, used = [], 0
+        for i in ranked:
+            cost = estimate_tokens(facts[i]) + 1
+            if used + cost > budget:
+                continue
+            chosen.append(i)
+            used += cost
+
+        # Nothing fits whole: keep the best fact cut to the budget rather than overrun it
+        if not chosen and ranked and budget > MIN_FACT_TOKENS:
+            return [facts[ranked[0]][:(budget - 1) * 4 - 1].rstrip() + "…"]
+        return [facts[i] for i in sorted(chosen)]
+
+    def compact(self, data: Any, budget: int, focus: str = "") -> Dict:
+        """
+        Compact a payload for a prompt
+
+        Top-level keys become sections; the budget is shared between them,
+        with whatever a small section leaves unused passed on to the larger ones.
+
+        Args:
+            data: JSON-like payload (dict, list or text)
+            budget: Token budget for the whole payload
+            focus: Prompt instructions/keywords used to rank facts
+
+        Returns:
+            {"text", "input_tokens", "output_tokens", "facts_in", "facts_out", "duplicates"}
+        """
+        input_tokens = estimate_tokens(data if isinstance(data, str) else json.dumps(data, indent=2, default=str))
+
+        if isinstance(data, dict):
+            # Scalar fields (company, industry, ...) share one unlabelled section; nested values get their own
+            scalars = {key: value for key, value in data.items() if not isinstance(value, (dict, list))}
+            sections = {"": self.facts(scalars)}
+            sections.update({
+                key: self.facts(value, key) for key, value in data.items()
+                if key not in scalars and key not in self.drop_keys
+            })
+        else:
+            sections = {"": self.facts(data)}
+
+        facts_in = duplicates = facts_out = 0
+        deduped = {}
+        for name, facts in sections.items():
+            facts_in += len(facts)
+            deduped[name], dropped = self._dedupe(facts)
+            duplicates += dropped
+
+        # Smallest sections first so their unused share rolls over
+        remaining = budget
+        rendered = {}
+        order = sorted(deduped, key=lambda name: sum(estimate_tokens(f) for f in deduped[name]))
+        for position, name in enumerate(order):
+            if not deduped[name]:
+                continue
+            share = remaining // (len(order) - position)
+            header = f"## {name}\n" if name else ""
+            # One token held back for the blank line that separates sections
+            selected = self._select(deduped[name], share - estimate_tokens(header) - 1, focus)
+            if not selected:
+                continue
+            rendered[name] = header + "\n".join(f"- {fact}" for fact in selected)
+            remaining -= estimate_tokens(rendered[name]) + 1
+            facts_out += len(selected)
+
+        text = "\n\n".join(rendered[name] for name in deduped if name in rendered)
+        return {
+            "text": text,
+            "input_tokens": input_tokens,
+            "output_tokens": estimate_tokens(text),
+            "facts_in": facts_in,
+            "facts_out": facts_out,
+            "duplicates": duplicates
+        }
+
+
+_compactor = PromptCompactor()
+
+
+def compact_for_prompt(data: Any, budget: int, focus: str = "", label: str = "payload") -> str:
+    """Compact data with the shared compactor, log the token savings and return the text"""
+    result = _compactor.compact(data, budget, focus)
+    print(f"[COMPACT] {label}: {result['input_tokens']:,} -> {result['output_tokens']:,} tokens "
+          f"({result['facts_out']}/{result['facts_in']} facts, {result['duplicates']} duplicates dropped)")
+    return result["text"]
@@ -0,0 +1,162 @@
+"""
+Token-bucket rate limiting shared across Antigravity modules
+Buckets are keyed per API and shared by threads (in memory) or by worker processes (SQLite)
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+# Default (tokens per second, burst capacity) per upstream API
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "gemini": (1.0, 5),   # 60/min with a small burst
+    "keiai": (2.0, 4),
+    "brave": (1.0, 1),    # Brave free tier allows 1 query/sec
+    "n8n": (5.0, 10)
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket with burst capacity"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Max tokens that can accumulate (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens now, going into debt if the bucket is empty
+
+        Returns:
+            Seconds the caller must wait before using the reserved tokens
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available, returns seconds waited"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SQLiteTokenBucket:
+    """Token bucket whose state lives in SQLite so separate processes share one budget"""
+
+    def __init__(self, name: str, rate: float, capacity: float = 1, db_path: str = ".tmp/rate_limits.db"):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps this safe across threads and forks
+        return sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens now, going into debt if the bucket is empty
+
+        Returns:
+            Seconds the caller must wait before using the reserved tokens
+        """
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes the write lock so the read-modify-write is atomic across processes
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+
+            if row:
+                available = min(self.capacity, row[0] + (now - row[1]) * self.rate)
+            else:
+                available = self.capacity
+
+            available -= tokens
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                (self.name, available, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            # A failed BEGIN IMMEDIATE (e.g. lock timeout) never opened a transaction
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available, returns seconds waited"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_limiters: Dict[str, object] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: Optional[float] = None, capacity: Optional[float] = None):
+    """
+    Get the process-wide rate limiter for an API
+
+    Set RATE_LIMIT_DB to a SQLite path to share buckets between worker processes;
+    otherwise buckets are shared by threads within this process only.
+
+    Args:
+        name: API key (e.g., "gemini", "keiai", "brave", "n8n")
+        rate: Tokens per second (defaults to DEFAULT_LIMITS, or 1/sec)
+        capacity: Burst capacity (defaults to DEFAULT_LIMITS, or 1)
+
+    Returns:
+        TokenBucket or SQLiteTokenBucket, created on first use
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            default_rate, default_capacity = DEFAULT_LIMITS.get(name, (1.0, 1))
+            rate = rate or default_rate
+            capacity = capacity or default_capacity
+
+            db_path = os.getenv("RATE_LIMIT_DB")
+            if db_path:
+                limiter = SQLiteTokenBucket(name, rate, capacity, db_path)
+            else:
+                limiter = TokenBucket(rate, capacity)
+            _limiters[name] = limiter
+        return limiter
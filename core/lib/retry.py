@@ -0,0 +1,107 @@
+"""
+Retry policy shared across Antigravity modules
+Exponential backoff with full jitter, Retry-After support and idempotency awareness
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if missing/unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed request"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504)):
+        """
+        Args:
+            max_attempts: Total attempts including the first one
+            base_delay: Backoff ceiling for the first retry, doubled each attempt
+            max_delay: Upper bound for any single wait (including Retry-After)
+            retry_statuses: HTTP statuses considered transient
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = set(retry_statuses)
+
+    @staticmethod
+    def is_idempotent(method: str, headers: dict = None) -> bool:
+        """Safe to resend: idempotent verbs, or a POST carrying an Idempotency-Key"""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return bool(headers and any(k.lower() == "idempotency-key" for k in headers))
+
+    def should_retry(self, attempt: int, idempotent: bool, status: int = None,
+                     request_sent: bool = True) -> bool:
+        """
+        Args:
+            attempt: Zero-based attempt that just failed
+            idempotent: Whether the request is safe to resend
+            status: HTTP status, or None for a transport error
+            request_sent: False when the failure happened before the request left (connect errors)
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+
+        if status is None:
+            # Connection never established -> the server cannot have acted on it
+            return idempotent or not request_sent
+
+        if status not in self.retry_statuses:
+            return False
+
+        # 429/503 mean the server refused the work, so even a non-idempotent POST is safe
+        return idempotent or status in (429, 503)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before the next attempt
+
+        Honours Retry-After when present, otherwise full-jitter exponential backoff
+        so concurrent callers don't retry in lockstep.
+        """
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.max_delay)
+
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
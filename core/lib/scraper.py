@@ -0,0 +1,350 @@
+"""
+Website scraper shared by the research scripts
+One pooled session per scraper, ETag/Last-Modified revalidation against a local page cache, a bounded crawl of key pages
+and a streaming text extractor whose memory and CPU stay bounded regardless of page size
+"""
+
+import os
+import re
+import time
+import atexit
+import codecs
+import threading
+from datetime import datetime
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.lib.cache import get_cache
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+PAGE_CACHE_DB = os.getenv("SCRAPER_CACHE_DB", os.path.join(PROJECT_ROOT, ".tmp", "cache", "pages.db"))
+PAGE_CACHE_TTL = float(os.getenv("SCRAPER_CACHE_TTL", 30 * 86400))
+# Within this window a cached page is served without touching the network at all
+PAGE_FRESH_SECONDS = float(os.getenv("SCRAPER_FRESH_SECONDS", 6 * 3600))
+# Hosts whose keep-alive connections the shared session holds at once (least recently used dropped)
+POOLED_HOSTS = 32
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0 Safari/537.36")
+
+TEXT_TAGS = {"p", "h1", "h2", "h3", "li"}
+# Never rendered or repeated on every page (nav, footer, ...); their text is skipped entirely
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "nav", "footer", "aside", "form"}
+
+# Pages worth crawling after the homepage, in priority order
+KEY_PAGES = {
+    "about": re.compile(r"/(about|about-us|company|who-we-are|our-story|team)(/|$)", re.I),
+    "pricing": re.compile(r"/(pricing|plans|packages)(/|$)", re.I),
+    "services": re.compile(r"/(services|solutions|products|what-we-do)(/|$)", re.I),
+    "careers": re.compile(r"/(careers|jobs|join-us|work-with-us|hiring)(/|$)", re.I)
+}
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Incremental HTML parser that emits text blocks as they close
+
+    Feed it chunks as they arrive; only the current block and a short link
+    list are held in memory. Blocks already seen (per extractor, or shared
+    across pages via `seen`) are dropped so repeated boilerplate appears once.
+    """
+
+    def __init__(self, base_url: str, max_chars: int = 5000, max_links: int = 200, seen: set = None):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.host = urlparse(base_url).netloc
+        self.max_chars = max_chars
+        self.max_links = max_links
+        self.seen = set() if seen is None else seen
+
+        self.chars = 0
+        self.links: List[str] = []
+        self._blocks: List[str] = []
+        self._current: List[str] = []
+        self._text_depth = 0
+        self._skip_depth = 0
+
+    @property
+    def done(self) -> bool:
+        """True once the text budget is spent (links are best-effort after that)"""
+        return self.chars >= self.max_chars
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in TEXT_TAGS:
+            self._flush()
+            self._text_depth += 1
+        elif tag == "a" and len(self.links) < self.max_links:
+            href = dict(attrs).get("href")
+            if href:
+                link = urljoin(self.base_url, href).split("#")[0]
+                if urlparse(link).netloc == self.host and link not in self.links:
+                    self.links.append(link)
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in TEXT_TAGS:
+            self._flush()
+            self._text_depth = max(0, self._text_depth - 1)
+
+    def handle_data(self, data):
+        if self._text_depth and not self._skip_depth and not self.done:
+            self._current.append(data)
+
+    def _flush(self):
+        """Close the current block, keeping it if it is new and within budget"""
+        text = " ".join("".join(self._current).split())
+        self._current = []
+        if not text or self.done:
+            return
+
+        fingerprint = text.lower()
+        if fingerprint in self.seen:
+            return
+        self.seen.add(fingerprint)
+
+        text = text[:self.max_chars - self.chars]
+        self.chars += len(text) + 1
+        self._blocks.append(text)
+
+    def drain(self) -> List[str]:
+        """Blocks completed since the last call"""
+        blocks, self._blocks = self._blocks, []
+        return blocks
+
+    def stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Feed decoded chunks and yield text blocks, stopping as soon as the budget is reached"""
+        for chunk in chunks:
+            self.feed(chunk)
+            yield from self.drain()
+            if self.done:
+                return
+
+        self.close()
+        self._flush()
+        yield from self.drain()
+
+
+def stream_text(chunks: Iterable[str], base_url: str = "", max_chars: int = 5000,
+                seen: set = None) -> Iterator[str]:
+    """Yield deduplicated text blocks from HTML chunks without building a DOM"""
+    yield from HTMLTextExtractor(base_url, max_chars, seen=seen).stream(chunks)
+
+
+class WebScraper:
+    """
+    Fetches pages through one pooled session and a revalidating page cache
+
+    Every site goes through the scraper's own session instead of a per-host
+    session from api_client, which would otherwise be created for each
+    scraped domain and kept for the life of the process. Close the scraper
+    (or use it as a context manager) to release its connections.
+    """
+
+    def __init__(self, max_pages: int = 4, max_chars: int = 5000, max_bytes: int = 1_000_000,
+                 timeout: float = 10, max_workers: int = 4):
+        """
+        Args:
+            max_pages: Pages fetched per crawl, homepage included
+            max_chars: Extracted text kept per page
+            max_bytes: Response bytes read per page before the body is cut off
+            timeout: Per-request timeout in seconds
+            max_workers: Key pages fetched concurrently
+        """
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = get_cache(PAGE_CACHE_DB, "pages", ttl=PAGE_CACHE_TTL) if PAGE_CACHE_TTL > 0 else None
+
+        adapter = HTTPAdapter(pool_connections=POOLED_HOSTS, pool_maxsize=max_workers)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _decoded_chunks(self, response: requests.Response) -> Iterator[str]:
+        """Decode the body incrementally, reading at most max_bytes"""
+        # requests guesses ISO-8859-1 for any text/* without a charset; most sites are UTF-8
+        charset = response.encoding if "charset" in response.headers.get("Content-Type", "") else "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        size = 0
+        for chunk in response.iter_content(chunk_size=16 * 1024):
+            chunk = chunk[:self.max_bytes - size]
+            size += len(chunk)
+            yield decoder.decode(chunk)
+            if size >= self.max_bytes:
+                break
+        yield decoder.decode(b"", final=True)
+
+    def extract(self, response: requests.Response) -> Dict:
+        """
+        Stream visible text and same-site links out of a response
+
+        Parsing stops (and the connection is released) once max_chars of text
+        is collected, so a multi-MB page costs about as much as a small one.
+        """
+        extractor = HTMLTextExtractor(response.url, self.max_chars)
+        try:
+            blocks = list(extractor.stream(self._decoded_chunks(response)))
+        finally:
+            response.close()
+
+        return {"text": "\n".join(blocks), "links": extractor.links}
+
+    def fetch(self, url: str) -> Optional[Dict]:
+        """
+        Fetch one page, revalidating the cached copy with If-None-Match/If-Modified-Since
+
+        When the site times out, is unreachable or answers 5xx, the cached copy
+        (however old) is served with source "stale" instead.
+
+        Returns:
+            Page dict (url, status, text, links, fetched_at, source) or None if unreachable
+        """
+        key = self.cache.make_key("page", url) if self.cache else None
+        cached = self.cache.get(key) if self.cache else None
+
+        if cached and time.time() - cached["checked"] < PAGE_FRESH_SECONDS:
+            return dict(cached, source="cache")
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException as e:
+            print(f"[WARN] Fetch failed for {url}: {e}")
+            # A stale copy beats nothing when the site is down
+            return dict(cached, source="stale") if cached else None
+
+        if response.status_code == 304 and cached:
+            response.close()
+            page = dict(cached, checked=time.time())
+            self.cache.set(key, page)
+            return dict(page, source="revalidated")
+
+        if response.status_code >= 500 and cached:
+            response.close()
+            print(f"[WARN] {url} answered {response.status_code}, serving cached copy")
+            return dict(cached, source="stale")
+
+        if response.status_code != 200:
+            response.close()
+            return {"url": url, "status": response.status_code, "text": "", "links": [],
+                    "fetched_at": datetime.now().isoformat(), "source": "network"}
+
+        page = {
+            "url": response.url,
+            "status": 200,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": datetime.now().isoformat(),
+            "checked": time.time()
+        }
+        try:
+            page.update(self.extract(response))
+        except requests.exceptions.RequestException as e:
+            # Timed out or dropped while reading the body
+            print(f"[WARN] Fetch failed for {url}: {e}")
+            return dict(cached, source="stale") if cached else None
+
+        if self.cache:
+            self.cache.set(key, page)
+        return dict(page, source="network")
+
+    def find_key_pages(self, links: List[str]) -> Dict[str, str]:
+        """Pick one link per key page type (about, pricing, ...) from the homepage links"""
+        found = {}
+        for kind, pattern in KEY_PAGES.items():
+            for link in links:
+                if pattern.search(urlparse(link).path):
+                    found[kind] = link
+                    break
+        return found
+
+    def crawl(self, url: str) -> Optional[Dict]:
+        """
+        Scrape the homepage plus up to max_pages - 1 key pages concurrently
+
+        Returns:
+            {"url", "pages": [{"kind", "url", "text", "source"}], "content"} or None if the homepage failed
+        """
+        home = self.fetch(url)
+        if not home or home["status"] != 200:
+            return None
+
+        targets = list(self.find_key_pages(home["links"]).items())[:max(0, self.max_pages - 1)]
+        pages = [{"kind": "home", "url": home["url"], "text": home["text"], "source": home["source"]}]
+
+        if targets:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets)),
+                                    thread_name_prefix="scrape") as pool:
+                results = pool.map(lambda target: self.fetch(target[1]), targets)
+
+                for (kind, link), page in zip(targets, results):
+                    if page and page["status"] == 200 and page["text"]:
+                        pages.append({"kind": kind, "url": page["url"], "text": page["text"],
+                                      "source": page["source"]})
+
+        # Header/footer copy that survived extraction is usually repeated on every page: keep the first copy
+        seen, sections = set(), []
+        for page in pages:
+            blocks = [block for block in page["text"].split("\n") if block.lower() not in seen]
+            seen.update(block.lower() for block in blocks)
+            if blocks:
+                text = "\n".join(blocks)
+                sections.append(text if page["kind"] == "home" else f"[{page['kind'].upper()}] {text}")
+
+        content = "\n\n".join(sections)
+        return {"url": home["url"], "pages": pages, "content": content}
+
+
+_scraper: Optional[WebScraper] = None
+_scraper_lock = threading.Lock()
+
+
+def get_scraper() -> WebScraper:
+    """
+    Process-wide scraper, closed at exit
+
+    Configure per-call limits by building a WebScraper directly, and close it
+    (or use `with WebScraper(...) as scraper:`) when the batch is done.
+    """
+    global _scraper
+
+    if _scraper is not None:
+        return _scraper
+
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = WebScraper()
+            atexit.register(_scraper.close)
+        return _scraper
@@ -0,0 +1,82 @@
+"""
+In-memory full-text search for small catalogues
+BM25 ranking over an inverted index; rebuilt wholesale when the documents change
+"""
+
+import re
+import math
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it",
+    "of", "on", "or", "our", "that", "the", "their", "to", "up", "with", "your"
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9&+]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords (keeps acronyms like sr&ed intact)"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over an inverted index of term -> {doc_id: term frequency}"""
+
+    def __init__(self, documents: Dict[str, str], k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            documents: doc_id -> searchable text
+            k1: Term-frequency saturation
+            b: Document-length normalisation
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+
+        for doc_id, text in documents.items():
+            tokens = tokenize(text)
+            self.doc_lengths[doc_id] = len(tokens)
+            for term, count in Counter(tokens).items():
+                self.postings.setdefault(term, {})[doc_id] = count
+
+        total = len(self.doc_lengths)
+        self.avg_length = sum(self.doc_lengths.values()) / total if total else 0.0
+        self.idf = {
+            term: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def search(self, query: str, top_k: int = 10,
+               where: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a free-text query
+
+        Args:
+            query: Search text
+            top_k: Maximum results
+            where: Optional doc_id predicate applied before ranking
+
+        Returns:
+            [(doc_id, score)] with score > 0, best first
+        """
+        scores: Dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf[term]
+            for doc_id, tf in docs.items():
+                if where and not where(doc_id):
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / (self.avg_length or 1))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:top_k]
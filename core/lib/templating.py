@@ -0,0 +1,158 @@
+"""
+Shared Jinja rendering engine for proposals
+One Environment per template directory for the whole process, compiled templates kept in memory
+and as bytecode on disk, and rendered output streamed straight to file
+"""
+
+import os
+import time
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR", os.path.join(PROJECT_ROOT, ".tmp", "cache", "jinja"))
+
+
+def format_currency(value, currency="CAD"):
+    """Format number as currency"""
+    try:
+        return f"${float(value):,.0f} {currency}"
+    except (ValueError, TypeError):
+        return value
+
+
+def format_date(value, format="%B %d, %Y"):
+    """Format a datetime or ISO date string"""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).strftime(format)
+        except ValueError:
+            return value
+    if isinstance(value, datetime):
+        return value.strftime(format)
+    return value
+
+
+def format_percentage(value):
+    """Format number as percentage"""
+    try:
+        return f"{float(value):.1f}%"
+    except (ValueError, TypeError):
+        return value
+
+
+FILTERS = {
+    "format_currency": format_currency,
+    "format_date": format_date,
+    "format_percentage": format_percentage
+}
+
+
+_environments: Dict[str, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def get_environment(template_dir: Union[str, Path]) -> Environment:
+    """
+    Get the process-wide Environment for a template directory
+
+    Templates are compiled on first use and kept for the life of the process
+    (no size limit, no mtime checks); the compiled bytecode is also written to
+    TEMPLATE_CACHE_DIR so the next process skips parsing entirely. HTML
+    templates are autoescaped, Markdown/text templates are not.
+
+    Args:
+        template_dir: Directory holding the templates
+
+    Returns:
+        Shared Environment with the proposal filters registered
+    """
+    key = str(Path(template_dir).resolve())
+    with _environments_lock:
+        env = _environments.get(key)
+        if env is None:
+            os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+            env = Environment(
+                loader=FileSystemLoader(key),
+                bytecode_cache=FileSystemBytecodeCache(TEMPLATE_CACHE_DIR),
+                autoescape=select_autoescape(["html", "htm", "xml"]),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                keep_trailing_newline=True,
+                cache_size=-1,
+                auto_reload=False
+            )
+            env.filters.update(FILTERS)
+            _environments[key] = env
+        return env
+
+
+def precompile(template_dir: Union[str, Path]) -> int:
+    """Compile every template in a directory up front (e.g. before a batch run); returns how many"""
+    env = get_environment(template_dir)
+    names = env.list_templates(filter_func=lambda name: not name.startswith("."))
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+def render(template_dir: Union[str, Path], name: str, **context) -> str:
+    """Render a template to a string"""
+    return get_environment(template_dir).get_template(name).render(**context)
+
+
+def render_to_file(template_dir: Union[str, Path], name: str, path: Union[str, Path], **context) -> Path:
+    """
+    Render a template straight to disk
+
+    Output is written chunk by chunk as the template produces it, so the full
+    document is never held in memory.
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    get_environment(template_dir).get_template(name).stream(**context).dump(str(path), encoding="utf-8")
+    return path
+
+
+def benchmark(template_dir: Union[str, Path], name: str, contexts: Iterable[Dict],
+              output_dir: Optional[Union[str, Path]] = None) -> Dict:
+    """
+    Time rendering a batch of documents to file
+
+    Args:
+        template_dir: Directory holding the template
+        name: Template to render
+        contexts: One context per document
+        output_dir: Where to write (a temporary directory if omitted)
+
+    Returns:
+        {"documents", "compile_seconds", "render_seconds", "per_document_ms"}
+    """
+    contexts = list(contexts)
+
+    started = time.perf_counter()
+    get_environment(template_dir).get_template(name)
+    compile_seconds = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as scratch:
+        target = Path(output_dir or scratch)
+        started = time.perf_counter()
+        for i, context in enumerate(contexts):
+            render_to_file(template_dir, name, target / f"{i:05d}_{name}", **context)
+        render_seconds = time.perf_counter() - started
+
+    return {
+        "documents": len(contexts),
+        "compile_seconds": round(compile_seconds, 4),
+        "render_seconds": round(render_seconds, 4),
+        "per_document_ms": round(1000 * render_seconds / max(1, len(contexts)), 3)
+    }
@@ -6,11 +6,11 @@ Main server implementation exposing consultancy automation tools
 import asyncio
 import json
 import os
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
+from uuid import uuid4
 
 from mcp.server import Server
 from mcp.types import Tool, Resource, TextContent
@@ -27,8 +27,29 @@ EXECUTION_PATH = MODULES_PATH / "execution"
 OUTPUTS_PATH = MODULES_PATH / "outputs" / "proposals"
 TMP_PATH = MODULES_PATH / ".tmp"
 
-# In-memory job tracker (use database in production)
-jobs_db = {}
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.lib.job_queue import DEFAULT_JOBS_DB, JobQueue, JobProgressRecorder, WorkerPool, QueueFullError
+
+# Persistent job store (CONSULTANCY_JOBS_DB), shareable with the Vault for one indexed history.
+# Jobs submitted here go to the "mcp" queue and run on this server's worker pool.
+job_store = JobQueue(
+    DEFAULT_JOBS_DB,
+    max_queued=int(os.getenv("CONSULTANCY_MAX_QUEUED", 50)),
+    per_tenant_running=int(os.getenv("CONSULTANCY_MAX_JOBS", 2)),
+    name="mcp"
+)
+
+PHASE_PROGRESS = {"research": 30, "funding": 20, "strategy": 25, "proposals": 25}
+
+
+def load_engine():
+    """Import the consultancy engine on first use (keeps server startup light)"""
+    if str(EXECUTION_PATH) not in sys.path:
+        sys.path.insert(0, str(EXECUTION_PATH))
+    import run_full_consultancy
+    return run_full_consultancy
 
 
 # ============================================================================
@@ -42,6 +63,13 @@ class RunConsultancyInput(BaseModel):
     location: Optional[str] = Field(default="Canada", description="Geographic location for funding research")
 
 
+class ListHistoryInput(BaseModel):
+    company: Optional[str] = Field(default=None, description="Only analyses for this company")
+    status: Optional[str] = Field(default=None, description="Only jobs in this status: 'queued', 'running', 'complete' or 'error'")
+    limit: int = Field(default=20, ge=1, le=100, description="Page size")
+    cursor: Optional[str] = Field(default=None, description="next_cursor from the previous page")
+
+
 class CheckStatusInput(BaseModel):
     job_id: str = Field(description="Job ID to check status for")
 
@@ -76,7 +104,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="check_consultancy_status",
-            description="Check the status and progress of a running consultancy job",
+            description="Check the status and progress of a running consultancy job, including per-phase state, search/AI-call counters and recent progress events",
             inputSchema=CheckStatusInput.model_json_schema()
         ),
         Tool(
@@ -96,8 +124,8 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="list_consultancy_history",
-            description="List all past consultancy analyses with basic info and status",
-            inputSchema={}
+            description="List past consultancy analyses (newest first, paginated), optionally filtered by company or status",
+            inputSchema=ListHistoryInput.model_json_schema()
         )
     ]
 
@@ -117,7 +145,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     elif name == "send_proposals_email":
         return await send_proposals_email(arguments)
     elif name == "list_consultancy_history":
-        return await list_consultancy_history()
+        return await list_consultancy_history(arguments or {})
     else:
         return [TextContent(
             type="text",
@@ -134,45 +162,22 @@ async def run_full_consultancy(args: dict) -> list[TextContent]:
         # Generate job ID
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         company_slug = input_data.company.lower().replace(" ", "_")
-        job_id = f"job_{timestamp}_{company_slug}"
-        
-        # Create job record
-        job_data = {
-            "job_id": job_id,
-            "company": input_data.company,
-            "industry": input_data.industry,
-            "url": input_data.url,
-            "location": input_data.location,
-            "status": "running",
-            "phase": "initializing",
-            "progress": 0,
-            "created_at": datetime.now().isoformat(),
-            "started_at": datetime.now().isoformat(),
-            "completed_at": None,
-            "results": None,
-            "error": None
-        }
-        
-        jobs_db[job_id] = job_data
-        
-        # Build command
-        script_path = EXECUTION_PATH / "run_full_consultancy.py"
-        cmd = [sys.executable, str(script_path), input_data.company]
-        
-        if input_data.industry:
-            cmd.extend(["--industry", input_data.industry])
-        if input_data.url:
-            cmd.extend(["--url", input_data.url])
-        if input_data.location:
-            cmd.extend(["--location", input_data.location])
-        
-        # Run in background
-        asyncio.create_task(execute_consultancy(job_id, cmd))
+        job_id = f"job_{timestamp}_{company_slug}_{uuid4().hex[:8]}"
+        
+        # Persist the job; the worker pool picks it up
+        job_store.submit(
+            job_id,
+            payload={"industry": input_data.industry, "url": input_data.url, "location": input_data.location},
+            company=input_data.company,
+            state={"phase": "initializing", "progress": 0, "phases": {}, "counters": {}, "recent_events": []}
+        )
+        worker_pool.start()
+        worker_pool.notify()
         
         response = {
             "success": True,
             "job_id": job_id,
-            "status": "running",
+            "status": "queued",
             "message": f"Consultancy analysis started for {input_data.company}",
             "estimated_time": "10-15 minutes",
             "check_status_with": f"check_consultancy_status with job_id: {job_id}"
@@ -183,6 +188,16 @@ async def run_full_consultancy(args: dict) -> list[TextContent]:
             text=json.dumps(response, indent=2)
         )]
         
+    except QueueFullError as e:
+        return [TextContent(
+            type="text",
+            text=json.dumps({
+                "success": False,
+                "error": str(e),
+                "retry_after_seconds": e.retry_after
+            }, indent=2)
+        )]
+        
     except Exception as e:
         return [TextContent(
             type="text",
@@ -193,59 +208,39 @@ async def run_full_consultancy(args: dict) -> list[TextContent]:
         )]
 
 
-async def execute_consultancy(job_id: str, cmd: list[str]):
-    """Background task to execute consultancy"""
-    job = jobs_db[job_id]
+def execute_consultancy(job: dict):
+    """Worker pool handler: run one claimed job in-process and store its results"""
+    recorder = JobProgressRecorder(job_store, job, PHASE_PROGRESS)
     
     try:
-        # Update status
-        job["phase"] = "running"
-        job["progress"] = 10
-        
-        # Execute command
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+        results = load_engine().run_consultancy(
+            company_name=job["company"],
+            industry=job["industry"] or None,
+            url=job["url"] or None,
+            location=job["location"] or "Canada",
+            on_event=recorder
         )
         
-        # Wait for completion
-        stdout, stderr = await process.communicate()
+        summary = {
+            "metrics": results["metrics"],
+            "phases": results["phases"],
+            "progress": results["progress"],
+            "files": results["files"],
+            "insights": (results["research"] or {}).get("insights"),
+            "log_file": results["log_file"]
+        }
         
-        if process.returncode == 0:
-            # Success
-            job["status"] = "complete"
-            job["phase"] = "complete"
-            job["progress"] = 100
-            job["completed_at"] = datetime.now().isoformat()
-            
-            # Parse results (look for generated files)
-            company_slug = job["company"].lower().replace(" ", "_")
-            results = {
-                "metrics": {
-                    "proposals_generated": 4,
-                    "research_complete": True,
-                    "funding_analyzed": True
-                },
-                "files": {
-                    "executive_summary": f"outputs/proposals/{company_slug}_executive_summary_*.md",
-                    "technical_roadmap": f"outputs/proposals/{company_slug}_technical_roadmap_*.md",
-                    "financial_model": f"outputs/proposals/{company_slug}_financial_model_*.md",
-                    "funding_application": f"outputs/proposals/{company_slug}_funding_application_*.md"
-                }
-            }
-            job["results"] = results
-            
+        if results["success"]:
+            recorder.finish("complete", results=summary)
         else:
-            # Error
-            job["status"] = "error"
-            job["error"] = stderr.decode() if stderr else "Unknown error"
-            job["completed_at"] = datetime.now().isoformat()
+            failed = [name for name, phase in results["phases"].items() if phase["status"] != "success"]
+            recorder.finish("error", results=summary, error=f"Phases did not complete: {', '.join(failed)}")
             
     except Exception as e:
-        job["status"] = "error"
-        job["error"] = str(e)
-        job["completed_at"] = datetime.now().isoformat()
+        recorder.finish("error", error=str(e))
+
+
+worker_pool = WorkerPool(job_store, execute_consultancy, workers=int(os.getenv("CONSULTANCY_MAX_JOBS", 2)))
 
 
 async def check_consultancy_status(args: dict) -> list[TextContent]:
@@ -254,7 +249,9 @@ async def check_consultancy_status(args: dict) -> list[TextContent]:
         input_data = CheckStatusInput(**args)
         job_id = input_data.job_id
         
-        if job_id not in jobs_db:
+        job = job_store.get(job_id)
+        
+        if not job:
             return [TextContent(
                 type="text",
                 text=json.dumps({
@@ -263,8 +260,6 @@ async def check_consultancy_status(args: dict) -> list[TextContent]:
                 }, indent=2)
             )]
         
-        job = jobs_db[job_id]
-        
         response = {
             "success": True,
             "job_id": job_id,
@@ -272,6 +267,9 @@ async def check_consultancy_status(args: dict) -> list[TextContent]:
             "status": job["status"],
             "phase": job["phase"],
             "progress": job["progress"],
+            "phases": job["phases"],
+            "counters": job["counters"],
+            "recent_events": job.get("recent_events", []),
             "created_at": job["created_at"],
             "completed_at": job["completed_at"],
             "error": job["error"]
@@ -298,7 +296,9 @@ async def get_consultancy_results(args: dict) -> list[TextContent]:
         input_data = GetResultsInput(**args)
         job_id = input_data.job_id
         
-        if job_id not in jobs_db:
+        job = job_store.get(job_id)
+        
+        if not job:
             return [TextContent(
                 type="text",
                 text=json.dumps({
@@ -307,8 +307,6 @@ async def get_consultancy_results(args: dict) -> list[TextContent]:
                 }, indent=2)
             )]
         
-        job = jobs_db[job_id]
-        
         if job["status"] != "complete":
             return [TextContent(
                 type="text",
@@ -322,7 +320,7 @@ async def get_consultancy_results(args: dict) -> list[TextContent]:
             "success": True,
             "job_id": job_id,
             "company": job["company"],
-            "industry": job["industry"],
+            "industry": job.get("industry"),
             "completed_at": job["completed_at"],
             "results": job["results"]
         }
@@ -349,7 +347,9 @@ async def download_proposal(args: dict) -> list[TextContent]:
         job_id = input_data.job_id
         proposal_type = input_data.proposal_type
         
-        if job_id not in jobs_db:
+        job = job_store.get(job_id)
+        
+        if not job:
             return [TextContent(
                 type="text",
                 text=json.dumps({
@@ -358,8 +358,6 @@ async def download_proposal(args: dict) -> list[TextContent]:
                 }, indent=2)
             )]
         
-        job = jobs_db[job_id]
-        
         if job["status"] != "complete":
             return [TextContent(
                 type="text",
@@ -444,28 +442,36 @@ async def send_proposals_email(args: dict) -> list[TextContent]:
         )]
 
 
-async def list_consultancy_history() -> list[TextContent]:
-    """List all consultancy jobs"""
-    try:
-        history = []
-        
-        for job_id, job in jobs_db.items():
-            history.append({
-                "job_id": job_id,
+def history_page(company: str = None, status: str = None, limit: int = 20, cursor: str = None) -> dict:
+    """One indexed page of job history, newest first"""
+    page = job_store.list_jobs(company=company, status=status, limit=limit, cursor=cursor)
+    return {
+        "history": [
+            {
+                "job_id": job["job_id"],
                 "company": job["company"],
-                "industry": job["industry"],
+                "industry": job.get("industry"),
                 "status": job["status"],
                 "created_at": job["created_at"],
                 "completed_at": job["completed_at"]
-            })
-        
-        # Sort by created date (newest first)
-        history.sort(key=lambda x: x["created_at"], reverse=True)
+            }
+            for job in page["jobs"]
+        ],
+        "next_cursor": page["next_cursor"]
+    }
+
+
+async def list_consultancy_history(args: dict) -> list[TextContent]:
+    """List consultancy jobs, one page at a time"""
+    try:
+        input_data = ListHistoryInput(**args)
+        page = history_page(input_data.company, input_data.status, input_data.limit, input_data.cursor)
         
         response = {
             "success": True,
-            "total": len(history),
-            "history": history
+            "total": len(page["history"]),
+            "history": page["history"],
+            "next_cursor": page["next_cursor"]
         }
         
         return [TextContent(
@@ -511,17 +517,8 @@ async def read_resource(uri: str) -> str:
     """Read resource content"""
     
     if uri == "consultancy://history":
-        # Return job history as JSON
-        history = [
-            {
-                "job_id": job_id,
-                "company": job["company"],
-                "status": job["status"],
-                "created_at": job["created_at"]
-            }
-            for job_id, job in jobs_db.items()
-        ]
-        return json.dumps(history, indent=2)
+        # Latest page of job history as JSON (use list_consultancy_history to page further)
+        return json.dumps(history_page(limit=50), indent=2)
     
     elif uri == "consultancy://templates":
         # Return available templates
@@ -541,16 +538,46 @@ async def read_resource(uri: str) -> str:
 # SERVER STARTUP
 # ============================================================================
 
-if __name__ == "__main__":
-    import asyncio
+def claim_stdout():
+    """
+    Reserve the real stdout for JSON-RPC and send everything else to stderr
+
+    The engine runs in-process on the worker pool and print()s its progress;
+    on stdio any byte that is not a protocol message corrupts the stream. The
+    original stdout is duplicated for the protocol, then fd 1 and sys.stdout are
+    pointed at stderr so engine output (and any subprocess it starts) lands
+    there instead.
+
+    Returns:
+        Async text stream over the original stdout for stdio_server
+    """
+    import io
+    import anyio
+    
+    sys.stdout.flush()
+    protocol_fd = os.dup(1)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return anyio.wrap_file(io.TextIOWrapper(os.fdopen(protocol_fd, "wb"), encoding="utf-8"))
+
+
+async def serve():
+    """Serve MCP over stdio with the worker pool running"""
     from mcp.server.stdio import stdio_server
     
-    async def main():
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
+    # Claimed before any worker can print
+    protocol_stdout = claim_stdout()
+    
+    # Pick up jobs queued before a restart
+    worker_pool.start()
     
-    asyncio.run(main())
+    async with stdio_server(stdout=protocol_stdout) as (read_stream, write_stream):
+        await app.run(
+            read_stream,
+            write_stream,
+            app.create_initialization_options()
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(serve())
@@ -0,0 +1,103 @@
+"""
+Stdio protocol check for the InnovLead Consultancy MCP server
+Runs a job through the server with an engine that prints heavily and verifies
+every byte on stdout is still a JSON-RPC message
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+SERVER_DIR = Path(__file__).parent
+PROJECT_ROOT = SERVER_DIR.parent.parent
+
+# Child process: the real server with load_engine swapped for one that prints like the engine does
+CHILD = """
+import asyncio, sys
+sys.path.insert(0, {root!r})
+from mcp_servers.innovlead_consultancy import server
+
+class NoisyEngine:
+    @staticmethod
+    def run_consultancy(company_name, industry, url, location, on_event):
+        for i in range(50):
+            print(f"[RESEARCH] step {{i}} for {{company_name}}")
+        print("not json at all", flush=True)
+        return {{"success": True, "metrics": {{}}, "phases": {{}}, "progress": 100,
+                "files": {{}}, "research": {{}}, "log_file": None}}
+
+server.load_engine = lambda: NoisyEngine
+asyncio.run(server.serve())
+"""
+
+
+def send(proc, message):
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+
+
+def receive(proc, request_id):
+    """Read stdout until the response to request_id; every line must parse as JSON-RPC"""
+    while True:
+        line = proc.stdout.readline()
+        if not line:
+            raise AssertionError("Server closed stdout before responding")
+        message = json.loads(line)  # Raises on any stray output
+        assert message.get("jsonrpc") == "2.0", f"Not a JSON-RPC message: {line!r}"
+        if message.get("id") == request_id:
+            return message
+
+
+def call_tool(proc, request_id, name, arguments):
+    send(proc, {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+                "params": {"name": name, "arguments": arguments}})
+    response = receive(proc, request_id)
+    return json.loads(response["result"]["content"][0]["text"])
+
+
+def test_tool_call_keeps_stream_intact():
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, CONSULTANCY_JOBS_DB=os.path.join(tmp, "jobs.db"))
+        proc = subprocess.Popen(
+            [sys.executable, "-c", CHILD.format(root=str(PROJECT_ROOT))],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, env=env
+        )
+        try:
+            send(proc, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+                "protocolVersion": "2025-06-18", "capabilities": {},
+                "clientInfo": {"name": "stdio-check", "version": "1.0"}
+            }})
+            receive(proc, 1)
+            send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+            submitted = call_tool(proc, 2, "run_full_consultancy", {"company": "Stdio Check"})
+            assert submitted["success"], submitted
+
+            status = {}
+            for request_id in range(3, 40):
+                status = call_tool(proc, request_id, "check_consultancy_status", {"job_id": submitted["job_id"]})
+                if status.get("status") in ("complete", "error"):
+                    break
+                time.sleep(0.25)
+            assert status.get("status") == "complete", status
+        finally:
+            proc.stdin.close()
+            remaining = proc.stdout.read()
+            proc.wait(timeout=10)
+            stderr = proc.stderr.read()
+
+        for line in remaining.splitlines():
+            json.loads(line)
+        assert "[RESEARCH] step 49" in stderr, "Engine output should be on stderr"
+
+    print("✓ Engine output went to stderr; stdout carried only JSON-RPC")
+
+
+if __name__ == "__main__":
+    test_tool_call_keeps_stream_intact()
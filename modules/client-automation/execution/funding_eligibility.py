@@ -0,0 +1,269 @@
+"""
+Funding Eligibility Scoring
+Rule/feature-based matching of companies to funding programs, vectorised with NumPy
+Every company x program pair is scored in one pass; LLM review is left for the top matches only
+"""
+
+import sys
+import os
+import time
+from typing import Dict, List
+
+import numpy as np
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from funding_kb import FUNDING_PROGRAMS, PROVINCES, location_scope
+
+COUNTRIES = ["CA", "US"]
+PROVINCE_CODES = list(PROVINCES)
+
+# Component weights (sum to 1)
+WEIGHTS = {"industry": 0.4, "region": 0.2, "size": 0.15, "rd": 0.25}
+
+# Industry keywords implying R&D-heavy work, used when no rd_intensity is given
+RD_INTENSITY = [
+    (("software", "saas", "technology", "tech", "ai", "biotech", "research", "pharma", "robotics"), 0.7),
+    (("manufacturing", "engineering", "energy", "cleantech", "agtech", "medical"), 0.4)
+]
+DEFAULT_RD_INTENSITY = 0.2
+
+HIGH_SCORE = 0.75
+MEDIUM_SCORE = 0.5
+
+
+def estimate_rd_intensity(industry: str = None) -> float:
+    """Rough R&D intensity (0-1) from the industry description"""
+    words = set((industry or "").lower().replace("/", " ").replace(",", " ").split())
+    for keywords, intensity in RD_INTENSITY:
+        if words.intersection(keywords):
+            return intensity
+    return DEFAULT_RD_INTENSITY
+
+
+def _number(value) -> float:
+    """Parse a headcount/revenue value ("250", "1.2M", 40) or NaN if unknown"""
+    if value is None or value == "":
+        return np.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = str(value).lower().replace(",", "").replace("$", "").strip()
+    multiplier = {"k": 1e3, "m": 1e6, "b": 1e9}.get(text[-1:], 1)
+    try:
+        return float(text.rstrip("kmb")) * multiplier
+    except ValueError:
+        return np.nan
+
+
+class EligibilityScorer:
+    """
+    Scores companies against the funding catalogue
+
+    Programs are encoded once as feature arrays (sectors, country, province,
+    size limits, expected R&D). Each call encodes the companies the same way
+    and combines the components with broadcasting, so cost grows with the
+    matrix size rather than with Python loops over pairs.
+    """
+
+    def __init__(self, programs: List[Dict] = None):
+        self.programs = programs or FUNDING_PROGRAMS
+        self.sectors = sorted({
+            name for program in self.programs for name in program["industries"] if name != "any"
+        })
+
+        self.p_industry = np.array([
+            [name in program["industries"] for name in self.sectors] for program in self.programs
+        ], dtype=np.float32)
+        self.p_any = np.array(["any" in program["industries"] for program in self.programs])
+        self.p_sector_only = np.array([bool(program.get("sector_only")) for program in self.programs])
+        self.p_country = np.array([
+            COUNTRIES.index(program["country"]) if program["country"] in COUNTRIES else -1
+            for program in self.programs
+        ])
+        self.p_province = np.array([
+            PROVINCE_CODES.index(program["region"]) if program["region"] else -1 for program in self.programs
+        ])
+        self.p_min_employees = np.array([program.get("min_employees", -np.inf) for program in self.programs])
+        self.p_max_employees = np.array([program.get("max_employees", np.inf) for program in self.programs])
+        self.p_min_revenue = np.array([program.get("min_revenue", -np.inf) for program in self.programs])
+        self.p_max_revenue = np.array([program.get("max_revenue", np.inf) for program in self.programs])
+        self.p_rd = np.array([program.get("rd_weight", 0.3) for program in self.programs])
+
+    def encode(self, companies: List[Dict]) -> Dict[str, np.ndarray]:
+        """Company feature arrays (industry multi-hot, country, province, size, R&D intensity)"""
+        industry = np.zeros((len(companies), len(self.sectors)), dtype=np.float32)
+        country = np.empty(len(companies), dtype=int)
+        province = np.empty(len(companies), dtype=int)
+        employees = np.empty(len(companies))
+        revenue = np.empty(len(companies))
+        rd = np.empty(len(companies))
+
+        for i, company in enumerate(companies):
+            text = (company.get("industry") or "").lower()
+            industry[i] = [name in text for name in self.sectors]
+
+            code, prov = location_scope(company.get("location"))
+            country[i] = COUNTRIES.index(code)
+            province[i] = PROVINCE_CODES.index(prov) if prov else -1
+
+            employees[i] = _number(company.get("employees", company.get("employee_count")))
+            revenue[i] = _number(company.get("revenue"))
+            rd[i] = company.get("rd_intensity", estimate_rd_intensity(company.get("industry")))
+
+        return {"industry": industry, "country": country, "province": province,
+                "employees": employees, "revenue": revenue, "rd": rd}
+
+    def score(self, companies: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Score every company x program pair
+
+        Returns:
+            n x m arrays: "score" (0-1, 0 when ineligible), "eligible", "needs_info"
+            and the per-component fits used for explanations
+        """
+        c = self.encode(companies)
+
+        # Industry: shared sector > catalogue-wide program > no overlap (sector-only programs require overlap)
+        overlap = (c["industry"] @ self.p_industry.T) > 0
+        industry_fit = np.where(overlap, 1.0, np.where(self.p_any, 0.5, 0.0))
+        sector_ok = overlap | ~self.p_sector_only
+
+        # Region: wrong country or wrong province rules a program out
+        country_ok = (self.p_country == -1) | (c["country"][:, None] == self.p_country)
+        same_province = c["province"][:, None] == self.p_province
+        province_ok = (self.p_province == -1) | (c["province"][:, None] == -1) | same_province
+        region_fit = np.where(self.p_province == -1, 0.7, np.where(same_province, 1.0, 0.5))
+
+        # Size: hard limits when known, half credit when a limited program meets an unknown size
+        employees = c["employees"][:, None]
+        revenue = c["revenue"][:, None]
+        employees_known = ~np.isnan(employees)
+        revenue_known = ~np.isnan(revenue)
+        limited_employees = np.isfinite(self.p_min_employees) | np.isfinite(self.p_max_employees)
+        limited_revenue = np.isfinite(self.p_min_revenue) | np.isfinite(self.p_max_revenue)
+
+        with np.errstate(invalid="ignore"):
+            employees_in = (employees >= self.p_min_employees) & (employees <= self.p_max_employees)
+            revenue_in = (revenue >= self.p_min_revenue) & (revenue <= self.p_max_revenue)
+        size_ok = (~employees_known | employees_in | ~limited_employees) & (~revenue_known | revenue_in | ~limited_revenue)
+        size_unknown = (limited_employees & ~employees_known) | (limited_revenue & ~revenue_known)
+        size_fit = np.where(size_unknown, 0.5, 1.0)
+
+        # R&D: programs expecting R&D lose score by the company's shortfall
+        rd_fit = 1.0 - np.clip(self.p_rd - c["rd"][:, None], 0.0, 1.0)
+
+        eligible = sector_ok & country_ok & province_ok & size_ok
+        score = eligible * (
+            WEIGHTS["industry"] * industry_fit + WEIGHTS["region"] * region_fit
+            + WEIGHTS["size"] * size_fit + WEIGHTS["rd"] * rd_fit
+        )
+
+        return {
+            "score": score, "eligible": eligible, "needs_info": eligible & size_unknown,
+            "industry_overlap": overlap, "same_province": same_province,
+            "rd_fit": rd_fit, "rd": np.broadcast_to(c["rd"][:, None], score.shape)
+        }
+
+    def explain(self, scored: Dict[str, np.ndarray], i: int, j: int) -> List[str]:
+        """Human-readable reasons for one company x program score"""
+        program = self.programs[j]
+        reasons = []
+
+        if scored["industry_overlap"][i, j]:
+            reasons.append(f"Targets the company's sector ({', '.join(n for n in program['industries'] if n != 'any')})")
+        elif self.p_any[j]:
+            reasons.append("Open to businesses in any sector")
+
+        if self.p_province[j] == -1:
+            reasons.append("National program" if self.p_country[j] != -1 else "Available in any country")
+        elif scored["same_province"][i, j]:
+            reasons.append(f"Provincial program for {program['region']}")
+        else:
+            reasons.append(f"Provincial program for {program['region']} (confirm the company operates there)")
+
+        if scored["needs_info"][i, j]:
+            reasons.append("Size limits apply: confirm headcount/revenue")
+
+        if self.p_rd[j] >= 0.7:
+            if scored["rd_fit"][i, j] >= 0.85:
+                reasons.append("R&D-heavy program matches the company's technical work")
+            else:
+                reasons.append(f"Expects significant R&D (company estimate {scored['rd'][i, j]:.0%})")
+
+        return reasons
+
+    def rank(self, companies: List[Dict], top_k: int = 5, min_score: float = 0.3) -> List[Dict]:
+        """
+        Ranked eligible programs per company
+
+        Returns:
+            [{"company", "matches": [{"program_id", "program", "category", "score", "band",
+              "needs_info", "estimated_amount", "reasons"}]}] in input order
+        """
+        scored = self.score(companies)
+        order = np.argsort(-scored["score"], axis=1, kind="stable")[:, :top_k]
+
+        ranked = []
+        for i, company in enumerate(companies):
+            matches = []
+            for j in order[i]:
+                value = float(scored["score"][i, j])
+                if value < min_score:
+                    break
+                program = self.programs[j]
+                matches.append({
+                    "program_id": program["id"],
+                    "program": program["name"],
+                    "category": program["category"],
+                    "score": round(value, 3),
+                    "band": "high" if value >= HIGH_SCORE else "medium" if value >= MEDIUM_SCORE else "low",
+                    "needs_info": bool(scored["needs_info"][i, j]),
+                    "estimated_amount": program["amount"],
+                    "eligibility": program["eligibility"],
+                    "reasons": self.explain(scored, i, int(j))
+                })
+            ranked.append({"company": company.get("company"), "matches": matches})
+
+        return ranked
+
+
+def benchmark(companies: int = 1000, programs: int = 100, seed: int = 7) -> float:
+    """Seconds to rank `companies` synthetic prospects against `programs` catalogue entries"""
+    rng = np.random.default_rng(seed)
+    catalogue = [
+        dict(FUNDING_PROGRAMS[k % len(FUNDING_PROGRAMS)], id=f"program_{k}") for k in range(programs)
+    ]
+    industries = ["SaaS", "manufacturing", "retail", "healthcare clinic", "agtech", "software consulting"]
+    locations = ["Toronto, Ontario", "Canada", "Vancouver, BC", "Montreal, Quebec", "Austin, USA", "Calgary, Alberta"]
+    prospects = [
+        {
+            "company": f"Prospect {k}",
+            "industry": industries[rng.integers(len(industries))],
+            "location": locations[rng.integers(len(locations))],
+            "employees": int(rng.integers(1, 800)) if rng.random() > 0.3 else None
+        }
+        for k in range(companies)
+    ]
+
+    scorer = EligibilityScorer(catalogue)
+    started = time.perf_counter()
+    scorer.rank(prospects)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        print(f"1000 prospects x 100 programs ranked in {benchmark():.3f}s")
+    elif len(sys.argv) > 1:
+        profile = {
+            "company": sys.argv[1],
+            "industry": sys.argv[2] if len(sys.argv) > 2 else None,
+            "location": sys.argv[3] if len(sys.argv) > 3 else "Canada",
+            "employees": sys.argv[4] if len(sys.argv) > 4 else None
+        }
+        for match in EligibilityScorer().rank([profile])[0]["matches"]:
+            print(f"{match['score']:.2f} [{match['band']}] {match['program']}: {'; '.join(match['reasons'])}")
+    else:
+        print("Usage: python funding_eligibility.py 'Company' [Industry] [Location] [Employees] | --benchmark")
@@ -0,0 +1,476 @@
+"""
+Funding Program Knowledge Base
+Local catalogue of grants, tax incentives and quick-win programs, searched in-process with BM25
+Live web evidence per program is refreshed in the background; stale entries are re-searched on demand
+"""
+
+import sys
+import os
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.cache import get_cache
+from core.lib.search_index import BM25Index
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+KB_DB = os.getenv("FUNDING_KB_DB", os.path.join(PROJECT_ROOT, ".tmp", "cache", "funding_kb.db"))
+# Evidence older than this is re-searched before it is used
+KB_MAX_AGE = float(os.getenv("FUNDING_KB_MAX_AGE", 7 * 86400))
+KB_REFRESH_INTERVAL = float(os.getenv("FUNDING_KB_REFRESH_INTERVAL", 6 * 3600))
+# Evidence is kept this long so a failed refresh still has something to fall back on
+KB_RETENTION = 90 * 86400
+# How long a caller waits on another thread's in-flight search for the same program
+REFRESH_WAIT = 60
+
+CATEGORIES = ["grant", "tax", "quick_win"]
+
+# country: CA / US / ANY; region: province code or None for national programs;
+# sector_only programs are only offered when the company's industry matches one of theirs;
+# min/max_employees and min/max_revenue are hard limits, rd_weight (0-1) is how much R&D the program expects
+FUNDING_PROGRAMS = [
+    {
+        "id": "irap", "name": "IRAP (Industrial Research Assistance Program)", "category": "grant",
+        "country": "CA", "region": None, "agency": "NRC",
+        "max_employees": 500, "rd_weight": 0.8,
+        "industries": ["technology", "software", "saas", "manufacturing", "any"],
+        "description": "Advisory services and non-repayable funding for Canadian SMEs developing or adopting "
+                       "innovative technology, including automation and AI projects.",
+        "eligibility": "Incorporated, for-profit Canadian SME with 500 or fewer employees; project must involve "
+                       "technological innovation with growth potential.",
+        "amount": "$50,000-$500,000+ contribution (project dependent)",
+        "url": "https://nrc.canada.ca/en/support-technology-innovation"
+    },
+    {
+        "id": "canexport_innovation", "name": "CanExport Innovation", "category": "grant",
+        "country": "CA", "region": None, "agency": "Trade Commissioner Service",
+        "rd_weight": 0.7,
+        "industries": ["technology", "research", "manufacturing"],
+        "description": "Funding for Canadian innovators pursuing international R&D collaboration and "
+                       "technology commercialisation partnerships.",
+        "eligibility": "Canadian SME, research centre or academic institution with a partner-ready technology.",
+        "amount": "Up to $75,000 per project",
+        "url": "https://www.tradecommissioner.gc.ca/funding-financement/canexport/innovation.aspx"
+    },
+    {
+        "id": "bc_tech_fund", "name": "BC Tech Fund", "category": "grant",
+        "country": "CA", "region": "BC", "agency": "InBC",
+        "rd_weight": 0.5,
+        "industries": ["technology", "software", "saas"],
+        "description": "Provincial venture fund investing in British Columbia technology companies scaling "
+                       "software, SaaS and digital products.",
+        "eligibility": "BC-based technology company raising growth capital alongside private investors.",
+        "amount": "Equity investment (fund-of-funds and direct)",
+        "url": "https://www.inbcinvestment.ca/"
+    },
+    {
+        "id": "alberta_innovates", "name": "Alberta Innovates", "category": "grant",
+        "country": "CA", "region": "AB", "agency": "Alberta Innovates",
+        "rd_weight": 0.5,
+        "industries": ["technology", "energy", "agriculture", "healthcare", "any"],
+        "description": "Alberta programs funding technology development, digital adoption and "
+                       "commercialisation for small and medium businesses.",
+        "eligibility": "Alberta-based SME; program streams vary by stage and sector.",
+        "amount": "Vouchers and grants from $10,000 to $500,000 depending on stream",
+        "url": "https://albertainnovates.ca/"
+    },
+    {
+        "id": "quebec_c2ai", "name": "Quebec C2AI Program", "category": "grant",
+        "country": "CA", "region": "QC", "agency": "Gouvernement du Québec",
+        "rd_weight": 0.3,
+        "industries": ["technology", "manufacturing", "retail", "any"],
+        "description": "Quebec support for SMEs adopting artificial intelligence, automation and digital "
+                       "technologies in their operations.",
+        "eligibility": "Quebec-based business with an AI or digital transformation project.",
+        "amount": "Project dependent",
+        "url": "https://www.quebec.ca/entreprises-et-travailleurs-autonomes"
+    },
+    {
+        "id": "sbir_sttr", "name": "SBIR/STTR Grants", "category": "grant",
+        "country": "US", "region": None, "agency": "SBA",
+        "max_employees": 500, "rd_weight": 0.9,
+        "industries": ["technology", "research", "healthcare", "energy", "defense"],
+        "description": "US federal R&D funding for small businesses developing innovative technology with "
+                       "commercial potential, awarded in phases.",
+        "eligibility": "US-owned for-profit small business with 500 or fewer employees; STTR requires a "
+                       "research institution partner.",
+        "amount": "Phase I typically up to ~$300,000; Phase II up to ~$2,000,000",
+        "url": "https://www.sbir.gov/"
+    },
+    {
+        "id": "eda", "name": "Economic Development Administration (EDA)", "category": "grant",
+        "country": "US", "region": None, "agency": "US Department of Commerce",
+        "rd_weight": 0.2,
+        "industries": ["manufacturing", "technology", "any"],
+        "description": "US grants supporting regional economic development, innovation infrastructure and "
+                       "technology-based job creation.",
+        "eligibility": "Usually awarded to regional organisations and consortia; businesses benefit as partners.",
+        "amount": "Varies by program",
+        "url": "https://www.eda.gov/"
+    },
+    {
+        "id": "mep", "name": "Manufacturing Extension Partnership (MEP)", "category": "grant",
+        "country": "US", "region": None, "agency": "NIST",
+        "max_employees": 500, "rd_weight": 0.2,
+        "industries": ["manufacturing"],
+        "description": "Cost-shared consulting for US manufacturers adopting automation, lean processes and "
+                       "advanced manufacturing technology.",
+        "eligibility": "US small and medium-sized manufacturers.",
+        "amount": "Subsidised consulting engagements",
+        "url": "https://www.nist.gov/mep"
+    },
+    {
+        "id": "clean_tech_fund", "name": "Clean Tech Fund", "category": "grant",
+        "country": "ANY", "region": None, "agency": "Various",
+        "sector_only": True,
+        "rd_weight": 0.5,
+        "industries": ["cleantech", "energy", "environment", "sustainability"],
+        "description": "Public funding for clean technology, energy efficiency and emissions-reduction "
+                       "projects, including process automation that cuts energy use.",
+        "eligibility": "Companies developing or deploying clean technology.",
+        "amount": "Varies by program",
+        "url": None
+    },
+    {
+        "id": "agtech_fund", "name": "AgTech Innovation Fund", "category": "grant",
+        "country": "ANY", "region": None, "agency": "Various",
+        "sector_only": True,
+        "rd_weight": 0.4,
+        "industries": ["agriculture", "agtech", "food"],
+        "description": "Funding for agriculture and food businesses adopting precision agriculture, "
+                       "automation and data technology.",
+        "eligibility": "Agri-food producers and processors and agtech companies.",
+        "amount": "Varies by program",
+        "url": None
+    },
+    {
+        "id": "healthcare_it", "name": "Healthcare IT Modernization Grants", "category": "grant",
+        "country": "ANY", "region": None, "agency": "Various",
+        "sector_only": True,
+        "rd_weight": 0.2,
+        "industries": ["healthcare", "health", "medical", "clinic"],
+        "description": "Grants for clinics and health technology companies modernising records, scheduling "
+                       "and patient workflows with digital tools.",
+        "eligibility": "Healthcare providers and health technology vendors.",
+        "amount": "Varies by program",
+        "url": None
+    },
+    {
+        "id": "sred", "name": "SR&ED Tax Credit", "category": "tax",
+        "country": "CA", "region": None, "agency": "CRA",
+        "rd_weight": 1.0,
+        "industries": ["technology", "software", "saas", "manufacturing", "research", "any"],
+        "description": "Federal investment tax credit for scientific research and experimental development "
+                       "in Canada, including software, automation and AI development that resolves "
+                       "technological uncertainty.",
+        "eligibility": "Canadian business performing systematic experimental work; CCPCs get the enhanced "
+                       "refundable rate.",
+        "amount": "Up to 35% refundable credit on qualifying expenditures for CCPCs",
+        "url": "https://www.canada.ca/en/revenue-agency/services/scientific-research-experimental-development-tax-incentive-program.html"
+    },
+    {
+        "id": "ontario_itc", "name": "Ontario Innovation Tax Credit", "category": "tax",
+        "country": "CA", "region": "ON", "agency": "Ontario Ministry of Finance",
+        "rd_weight": 1.0,
+        "industries": ["technology", "software", "research", "any"],
+        "description": "Ontario refundable tax credit stacked on SR&ED for qualifying R&D expenditures.",
+        "eligibility": "Corporation with a permanent establishment in Ontario performing eligible SR&ED.",
+        "amount": "8% refundable credit on eligible expenditures",
+        "url": "https://www.ontario.ca/page/ontario-innovation-tax-credit"
+    },
+    {
+        "id": "accelerated_cca", "name": "Accelerated Capital Cost Allowance (automation equipment)",
+        "category": "tax", "country": "CA", "region": None, "agency": "CRA",
+        "rd_weight": 0.0,
+        "industries": ["manufacturing", "technology", "any"],
+        "description": "Faster write-off of investment in automation, manufacturing equipment, computers "
+                       "and software.",
+        "eligibility": "Canadian businesses acquiring eligible capital property.",
+        "amount": "Enhanced first-year deduction on eligible assets",
+        "url": "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/sole-proprietorships-partnerships/report-business-income-expenses/claiming-capital-cost-allowance.html"
+    },
+    {
+        "id": "us_rd_credit", "name": "Federal R&D Tax Credit (IRC Section 41)", "category": "tax",
+        "country": "US", "region": None, "agency": "IRS",
+        "rd_weight": 1.0,
+        "industries": ["technology", "software", "manufacturing", "research", "any"],
+        "description": "US credit for qualified research expenses, including software and process "
+                       "automation development; startups can offset payroll tax.",
+        "eligibility": "US businesses with qualified research activities and expenses.",
+        "amount": "Generally 6-10% of qualified research expenses",
+        "url": "https://www.irs.gov/businesses/small-businesses-self-employed/research-credit"
+    },
+    {
+        "id": "cdap", "name": "Canada Digital Adoption Program (CDAP)", "category": "quick_win",
+        "country": "CA", "region": None, "agency": "ISED",
+        "min_employees": 1, "max_employees": 499, "min_revenue": 500000, "max_revenue": 100000000,
+        "rd_weight": 0.0,
+        "industries": ["retail", "services", "any"],
+        "description": "Grant and interest-free loan for small businesses to build a digital adoption plan "
+                       "and adopt automation and e-commerce technology (Boost Your Business Technology).",
+        "eligibility": "Canadian-owned, for-profit business with 1-499 employees and $500K-$100M revenue.",
+        "amount": "Up to $15,000 grant for a digital adoption plan, plus a 0% BDC loan",
+        "url": "https://ised-isde.canada.ca/site/canada-digital-adoption-program/en"
+    },
+    {
+        "id": "digital_main_street", "name": "Ontario Digital Main Street", "category": "quick_win",
+        "country": "CA", "region": "ON", "agency": "Digital Main Street",
+        "rd_weight": 0.0,
+        "industries": ["retail", "hospitality", "services", "small business"],
+        "description": "Grants and digital service squad support helping Ontario main street small "
+                       "businesses move online and automate operations.",
+        "eligibility": "Ontario brick-and-mortar small business.",
+        "amount": "Digital transformation grant of up to $2,500 (stream dependent)",
+        "url": "https://digitalmainstreet.ca/"
+    },
+    {
+        "id": "google_startups_ca", "name": "Google for Startups Canada", "category": "quick_win",
+        "country": "CA", "region": None, "agency": "Google",
+        "rd_weight": 0.5,
+        "industries": ["technology", "software", "saas", "startup"],
+        "description": "Accelerator programs, cloud credits and mentorship for Canadian technology startups "
+                       "building AI products.",
+        "eligibility": "Early-stage Canadian technology startup.",
+        "amount": "Non-dilutive support and cloud credits",
+        "url": "https://startup.google.com/"
+    },
+    {
+        "id": "innovation_vouchers", "name": "Provincial Innovation Voucher Programs", "category": "quick_win",
+        "country": "CA", "region": None, "agency": "Provincial agencies",
+        "rd_weight": 0.4,
+        "industries": ["any", "small business", "manufacturing", "technology"],
+        "description": "Vouchers that pay for SMEs to buy technical expertise, automation consulting and "
+                       "prototyping from approved service providers.",
+        "eligibility": "Small businesses in participating provinces.",
+        "amount": "Typically $10,000-$100,000 per voucher",
+        "url": None
+    }
+]
+
+PROVINCES = {
+    "ON": ["ontario", "toronto", "ottawa"],
+    "QC": ["quebec", "québec", "montreal", "montréal"],
+    "BC": ["british columbia", "vancouver"],
+    "AB": ["alberta", "calgary", "edmonton"]
+}
+
+
+def location_scope(location: str = None) -> tuple:
+    """(country, province or None) for a free-text location; defaults to Canada"""
+    text = (location or "").lower()
+    padded = f" {text.replace(',', ' ')} "
+
+    if any(marker in padded for marker in (" usa ", " us ", "united states", "america")):
+        return "US", None
+
+    for code, names in PROVINCES.items():
+        if any(name in text for name in names) or f" {code.lower()} " in padded:
+            return "CA", code
+
+    return "CA", None
+
+
+class FundingKnowledgeBase:
+    """Searchable funding catalogue with per-program live evidence"""
+
+    def __init__(self, programs: List[Dict] = None, db_path: str = KB_DB, max_age: float = KB_MAX_AGE):
+        self.programs = {program["id"]: program for program in (programs or FUNDING_PROGRAMS)}
+        self.max_age = max_age
+        self.store = get_cache(db_path, "funding_programs", ttl=KB_RETENTION)
+        self._mcp = None
+        self._lock = threading.Lock()
+        self._refresher = None
+        self._refreshing: Dict[str, threading.Event] = {}  # pid -> set when its in-flight search finishes
+
+        self.evidence = {pid: self.store.get(f"program:{pid}") for pid in self.programs}
+        self._rebuild()
+
+    def _rebuild(self):
+        """Re-index every program (catalogue text plus the latest search snippets)"""
+        documents = {}
+        for pid, program in self.programs.items():
+            evidence = self.evidence.get(pid) or {}
+            snippets = " ".join(
+                f"{result.get('title') or ''} {result.get('description') or ''}"
+                for result in evidence.get("results", [])
+            )
+            documents[pid] = " ".join([
+                program["name"], program["name"],  # names count double
+                program["description"], program["eligibility"],
+                " ".join(program["industries"]), program["agency"],
+                program["region"] or "", snippets
+            ])
+
+        index = BM25Index(documents)
+        with self._lock:
+            self.index = index
+
+    def is_stale(self, pid: str) -> bool:
+        """True if the program has no evidence or it is older than max_age"""
+        evidence = self.evidence.get(pid)
+        return not evidence or time.time() - evidence["refreshed_at"] > self.max_age
+
+    def refresh_program(self, pid: str, rebuild: bool = True) -> bool:
+        """
+        Live-search one program and store the results as its evidence
+
+        A search that fails or finds nothing keeps the previous evidence (and
+        its age). If another thread is already refreshing the program, this
+        waits for that search instead of running the same one again.
+
+        Returns:
+            True if the program has fresh evidence afterwards
+        """
+        with self._lock:
+            pending = self._refreshing.get(pid)
+            if pending is None:
+                self._refreshing[pid] = done = threading.Event()
+        if pending is not None:
+            pending.wait(REFRESH_WAIT)
+            return not self.is_stale(pid)
+
+        try:
+            return self._search_program(pid, rebuild)
+        finally:
+            with self._lock:
+                del self._refreshing[pid]
+            done.set()
+
+    def _search_program(self, pid: str, rebuild: bool) -> bool:
+        if self._mcp is None:
+            from modules.mcp_integrations.execution.brave_search_connector import BraveSearchMCP
+            self._mcp = BraveSearchMCP()
+
+        program = self.programs[pid]
+        try:
+            results = self._mcp.search(f"{program['name']} eligibility application deadline", num_results=3)
+        except Exception as e:
+            print(f"[WARN] Funding refresh failed for {program['name']}: {e}")
+            return False
+
+        if not results:
+            # BraveSearchMCP returns [] on HTTP errors too; an empty answer must not wipe good evidence
+            print(f"[WARN] Funding refresh found nothing for {program['name']}, keeping previous evidence")
+            return False
+
+        evidence = {
+            "refreshed_at": time.time(),
+            "results": [
+                {"title": r.get('title'), "description": r.get('description'), "url": r.get('url')}
+                for r in results
+            ]
+        }
+        self.store.set(f"program:{pid}", evidence)
+        with self._lock:
+            self.evidence[pid] = evidence
+
+        if rebuild:
+            self._rebuild()
+        return True
+
+    def refresh(self, program_ids: List[str] = None, on_done: Callable[[str], None] = None) -> int:
+        """
+        Refresh stale programs (or the given ones) and re-index once
+
+        Returns:
+            Number of programs refreshed successfully
+        """
+        targets = program_ids if program_ids is not None else [pid for pid in self.programs if self.is_stale(pid)]
+        refreshed = 0
+        for pid in targets:
+            try:
+                refreshed += self.refresh_program(pid, rebuild=False)
+            finally:
+                if on_done:
+                    on_done(pid)
+
+        if targets:
+            self._rebuild()
+        return refreshed
+
+    def start_background_refresh(self, interval: float = KB_REFRESH_INTERVAL):
+        """Keep evidence fresh from a daemon thread (idempotent)"""
+        with self._lock:
+            if self._refresher is not None or interval <= 0:
+                return
+
+            def loop():
+                while True:
+                    try:
+                        count = self.refresh()
+                        if count:
+                            print(f"[FUNDING] Knowledge base refreshed {count} programs")
+                    except Exception as e:
+                        print(f"[WARN] Funding knowledge base refresh failed: {e}")
+                    time.sleep(interval)
+
+            self._refresher = threading.Thread(target=loop, name="funding-kb-refresh", daemon=True)
+            self._refresher.start()
+
+    def search(self, query: str, category: str = None, location: str = None, industry: str = None,
+               top_k: int = 5) -> List[Dict]:
+        """
+        Rank programs for a company profile
+
+        Args:
+            query: Free text (industry, needs, location)
+            category: grant / tax / quick_win (None for all)
+            location: Restricts to the location's country and province (national programs always match)
+            industry: Company industry; sector-only programs are skipped unless it matches
+            top_k: Maximum matches
+
+        Returns:
+            Program dicts with relevance score, staleness flag and evidence snippets
+        """
+        country, province = location_scope(location)
+        sector = (industry or "").lower()
+
+        def eligible(pid):
+            program = self.programs[pid]
+            return (
+                (category is None or program["category"] == category)
+                and program["country"] in (country, "ANY")
+                and (program["region"] is None or province is None or program["region"] == province)
+                and (not program.get("sector_only") or any(name in sector for name in program["industries"]))
+            )
+
+        with self._lock:
+            index = self.index
+
+        matches = []
+        for pid, score in index.search(query, top_k=top_k, where=eligible):
+            evidence = self.evidence.get(pid) or {}
+            matches.append(dict(
+                self.programs[pid],
+                score=round(score, 3),
+                stale=self.is_stale(pid),
+                evidence=evidence.get("results", [])
+            ))
+        return matches
+
+
+_knowledge_base: Optional[FundingKnowledgeBase] = None
+_knowledge_base_lock = threading.Lock()
+
+
+def get_funding_kb() -> FundingKnowledgeBase:
+    """Process-wide knowledge base (loaded once, shared by every researcher)"""
+    global _knowledge_base
+    with _knowledge_base_lock:
+        if _knowledge_base is None:
+            _knowledge_base = FundingKnowledgeBase()
+        return _knowledge_base
+
+
+if __name__ == "__main__":
+    kb = get_funding_kb()
+    if len(sys.argv) > 1 and sys.argv[1] == "--refresh":
+        print(f"Refreshed {kb.refresh()} programs")
+    elif len(sys.argv) > 1:
+        for match in kb.search(" ".join(sys.argv[1:])):
+            print(f"{match['score']:6.2f}  {match['name']}{'  (stale)' if match['stale'] else ''}")
+    else:
+        print("Usage: python funding_kb.py 'search terms' | --refresh")
@@ -8,9 +8,11 @@ Usage: python generate_illustrated_proposal_pdf.py "El Dorado Gold and Silver"
 import os
 import sys
 import json
-import requests
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Optional
 from dotenv import load_dotenv
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -21,6 +23,11 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 import time
 
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.api_client import get_session
+
 load_dotenv()
 
 # Configuration
@@ -29,113 +36,197 @@ KEI_AI_BASE_URL = "https://api.kie.ai/api/v1"
 KEI_AI_TASK_URL = f"{KEI_AI_BASE_URL}/jobs/createTask"
 KEI_AI_QUERY_URL = f"{KEI_AI_BASE_URL}/jobs/recordInfo"
 
-class IllustratedProposalGenerator:
-    def __init__(self, company_name: str):
-        self.company_name = company_name
-        self.company_slug = company_name.lower().replace(' ', '_').replace('&', 'and')
-        self.output_dir = Path(__file__).parent.parent / "outputs" / "proposals" / self.company_slug
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.temp_images_dir = self.output_dir / "illustrations"
-        self.temp_images_dir.mkdir(parents=True, exist_ok=True)
-        
-    def generate_illustration(self, prompt: str, filename: str) -> Path:
-        """Generate custom illustration using KeiAI"""
-        print(f"Generating illustration: {filename}...")
+# One budget for the whole illustration set (was 120s per image, waited one after another)
+ILLUSTRATION_DEADLINE = float(os.getenv("ILLUSTRATION_DEADLINE", 120))
+# Adaptive polling: first check soon, back off while a task is still rendering
+POLL_INITIAL = 3.0
+POLL_BACKOFF = 1.5
+POLL_MAX = 10.0
+DOWNLOAD_TIMEOUT = 30
+
+
+class IllustrationScheduler:
+    """
+    Submits every KieAI illustration at once and polls them all from one thread
+    
+    Each task keeps its own poll interval: a first check after POLL_INITIAL
+    seconds, backing off by POLL_BACKOFF up to POLL_MAX while it is still
+    rendering. When one task succeeds the others are usually close behind, so
+    their next check is pulled in. Each illustration is a Future (image Path
+    or None) resolved as soon as its download lands, and the whole set shares
+    one deadline.
+    """
+    
+    def __init__(self, images_dir: Path, deadline: float = ILLUSTRATION_DEADLINE):
+        self.images_dir = images_dir
+        self.deadline = deadline
+        self.session = get_session(KEI_AI_BASE_URL)
+        self.headers = {"Authorization": f"Bearer {KEI_AI_API_KEY}"}
+        self.futures: Dict[str, Future] = {}
+        self._expires = time.monotonic()
+    
+    def start(self, prompts: Dict[str, str]) -> Dict[str, Future]:
+        """Submit all prompts (name -> prompt) in the background; returns name -> Future"""
+        self._expires = time.monotonic() + self.deadline
+        self.futures = {name: Future() for name in prompts}
         
         if not KEI_AI_API_KEY:
-            print("  No KeiAI API key - skipping illustration")
+            print("  No KeiAI API key - skipping illustrations")
+            for future in self.futures.values():
+                future.set_result(None)
+            return self.futures
+        
+        print(f"Generating {len(prompts)} illustrations concurrently ({self.deadline:.0f}s budget)...")
+        threading.Thread(target=self._run, args=(prompts,), name="illustrations", daemon=True).start()
+        return self.futures
+    
+    def result(self, name: str) -> Optional[Path]:
+        """Wait for one illustration, never past the shared deadline (plus its download)"""
+        remaining = max(0.0, self._expires - time.monotonic()) + DOWNLOAD_TIMEOUT
+        try:
+            return self.futures[name].result(timeout=remaining)
+        except FutureTimeout:
             return None
+    
+    def wait(self) -> Dict[str, Optional[Path]]:
+        """Wait for the whole set"""
+        return {name: self.result(name) for name in self.futures}
+    
+    def _submit(self, prompt: str) -> Optional[str]:
+        """Create a KieAI task; returns its task id"""
+        # Improved negative prompts for text
+        has_text = "text reading" in prompt.lower() or "exactly" in prompt.lower()
+        
+        if has_text:
+            negative_prompt = ("blurry, low quality, distorted, misspelled, wrong spelling, "
+                             "illegible text, fuzzy letters, distorted letters, jumbled text, "
+                             "wrong words, extra characters, poor typography")
+        else:
+            negative_prompt = "blurry, low quality, distorted"
+        
+        payload = {
+            "model": "google/imagen4",  # Best for text and icons
+            "input": {
+                "prompt": prompt,
+                "aspect_ratio": "16:9",  # Good for presentation slides
+                "num_images": "1",
+                "negative_prompt": negative_prompt
+            }
+        }
         
+        response = self.session.post(KEI_AI_TASK_URL, json=payload, headers=self.headers, timeout=30)
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("code") == 200:
+                return data.get("data", {}).get("taskId")
+        return None
+    
+    def _poll(self, task_id: str) -> tuple:
+        """One status check; returns (state, image url)"""
         try:
-            # Create task with improved negative prompts for text
-            has_text = "text reading" in prompt.lower() or "exactly" in prompt.lower()
-            
-            if has_text:
-                negative_prompt = ("blurry, low quality, distorted, misspelled, wrong spelling, "
-                                 "illegible text, fuzzy letters, distorted letters, jumbled text, "
-                                 "wrong words, extra characters, poor typography")
-            else:
-                negative_prompt = "blurry, low quality, distorted"
-            
-            payload = {
-                "model": "google/imagen4",  # Best for text and icons
-                "input": {
-                    "prompt": prompt,
-                    "aspect_ratio": "16:9",  # Good for presentation slides
-                    "num_images": "1",
-                    "negative_prompt": negative_prompt
-                }
-            }
-            
-            response = requests.post(
-                KEI_AI_TASK_URL,
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {KEI_AI_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                timeout=30
+            response = self.session.get(
+                KEI_AI_QUERY_URL, params={"taskId": task_id}, headers=self.headers, timeout=10
             )
-            
+            data = response.json() if response.status_code == 200 else {}
+        except Exception:
+            return "pending", None
+        
+        if data.get("code") != 200:
+            return "pending", None
+        
+        task_data = data.get("data") or {}
+        state = task_data.get("state")
+        if state == "success":
+            # A malformed result fails this illustration only, not the whole polling loop
+            try:
+                result_urls = json.loads(task_data.get("resultJson") or "{}").get("resultUrls", [])
+            except (ValueError, AttributeError) as e:
+                print(f"  Unreadable result for task {task_id}: {e}")
+                return "fail", None
+            return ("success", result_urls[0]) if result_urls else ("fail", None)
+        return ("fail" if state == "fail" else "pending"), None
+    
+    def _download(self, name: str, url: str):
+        """Save the finished image and resolve its future"""
+        image_path = None
+        try:
+            response = self.session.get(url, timeout=DOWNLOAD_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
-                if data.get("code") == 200:
-                    task_id = data.get("data", {}).get("taskId")
-                    print(f"  Task ID: {task_id}")
-                    
-                    # Poll for completion
-                    image_url = self.wait_for_image(task_id)
-                    
-                    if image_url:
-                        # Download image
-                        image_path = self.temp_images_dir / f"{filename}.png"
-                        img_response = requests.get(image_url, timeout=30)
-                        
-                        if img_response.status_code == 200:
-                            with open(image_path, 'wb') as f:
-                                f.write(img_response.content)
-                            print(f"  Illustration saved: {filename}")
-                            return image_path
-            
-            print(f"  Could not generate illustration")
-            return None
-            
+                image_path = self.images_dir / f"{name}.png"
+                image_path.write_bytes(response.content)
+                print(f"  Illustration saved: {name}")
         except Exception as e:
-            print(f"  Error generating illustration: {e}")
-            return None
+            print(f"  Error downloading illustration {name}: {e}")
+        self.futures[name].set_result(image_path)
     
-    def wait_for_image(self, task_id: str, max_wait: int = 120) -> str:
-        """Poll task until complete"""
-        start_time = time.time()
-        
-        while (time.time() - start_time) < max_wait:
-            try:
-                response = requests.get(
-                    f"{KEI_AI_QUERY_URL}?taskId={task_id}",
-                    headers={"Authorization": f"Bearer {KEI_AI_API_KEY}"},
-                    timeout=10
-                )
+    def _run(self, prompts: Dict[str, str]):
+        try:
+            with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+                submitted = {name: pool.submit(self._submit, prompt) for name, prompt in prompts.items()}
+                
+                pending = {}
+                for name, task in submitted.items():
+                    try:
+                        task_id = task.result()
+                    except Exception as e:
+                        print(f"  Error submitting illustration {name}: {e}")
+                        task_id = None
+                    if task_id:
+                        print(f"  {name}: task {task_id}")
+                        pending[name] = {"task_id": task_id, "interval": POLL_INITIAL,
+                                         "next": time.monotonic() + POLL_INITIAL}
+                    else:
+                        print(f"  Could not generate illustration: {name}")
+                        self.futures[name].set_result(None)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("code") == 200:
-                        task_data = data.get("data", {})
-                        state = task_data.get("state")
+                while pending and time.monotonic() < self._expires:
+                    now = time.monotonic()
+                    for name in [name for name, task in pending.items() if task["next"] <= now]:
+                        task = pending[name]
+                        state, url = self._poll(task["task_id"])
                         
                         if state == "success":
-                            result_json_str = task_data.get("resultJson", "{}")
-                            result_json = json.loads(result_json_str)
-                            result_urls = result_json.get("resultUrls", [])
-                            if result_urls:
-                                return result_urls[0]
+                            del pending[name]
+                            pool.submit(self._download, name, url)
+                            for other in pending.values():
+                                other["interval"] = POLL_INITIAL
+                                other["next"] = min(other["next"], now + POLL_INITIAL)
                         elif state == "fail":
-                            return None
-                        
-                time.sleep(5)
-            except:
-                time.sleep(5)
+                            del pending[name]
+                            print(f"  Could not generate illustration: {name}")
+                            self.futures[name].set_result(None)
+                        else:
+                            task["interval"] = min(task["interval"] * POLL_BACKOFF, POLL_MAX)
+                            task["next"] = now + task["interval"]
+                    
+                    if pending:
+                        wake = min(min(task["next"] for task in pending.values()), self._expires)
+                        time.sleep(max(0.0, wake - time.monotonic()))
+                
+                for name in pending:
+                    print(f"  Illustration {name} not ready within the {self.deadline:.0f}s budget")
+                    self.futures[name].set_result(None)
+        except Exception as e:
+            print(f"  Error generating illustrations: {e}")
+            for future in self.futures.values():
+                if not future.done():
+                    future.set_result(None)
+
+class IllustratedProposalGenerator:
+    def __init__(self, company_name: str):
+        self.company_name = company_name
+        self.company_slug = company_name.lower().replace(' ', '_').replace('&', 'and')
+        self.output_dir = Path(__file__).parent.parent / "outputs" / "proposals" / self.company_slug
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.temp_images_dir = self.output_dir / "illustrations"
+        self.temp_images_dir.mkdir(parents=True, exist_ok=True)
         
-        return None
+    def generate_illustration(self, prompt: str, filename: str) -> Path:
+        """Generate one custom illustration using KeiAI"""
+        print(f"Generating illustration: {filename}...")
+        scheduler = IllustrationScheduler(self.temp_images_dir)
+        scheduler.start({filename: prompt})
+        return scheduler.result(filename)
     
     def create_pdf(self):
         """Generate illustrated PDF proposal"""
@@ -152,65 +243,61 @@ class IllustratedProposalGenerator:
         
         if use_hybrid:
             print("Using HYBRID approach (text-in-AI for simple elements)\n")
-            illustrations = {
-                "market_opportunity": self.generate_illustration(
+            prompts = {
+                "market_opportunity": (
                     "Large bold text reading exactly 'GROWTH' in gold metallic color (#FFD700), "
                     "centered composition, modern sans-serif typeface, sharp typography, "
                     "upward pointing arrow behind text, blue gradient background, "
-                    "professional minimalist style, ultra-sharp letters, high contrast",
-                    "market_opportunity"
+                    "professional minimalist style, ultra-sharp letters, high contrast"
                 ),
-                "competitive_advantage": self.generate_illustration(
+                "competitive_advantage": (
                     "Text reading exactly 'WINNER' in large bold gold letters (#FFD700), "
                     "gold trophy icon below text, centered composition, "
                     "modern bold typeface, sharp edges, blue accent elements, "
-                    "professional clean design, perfect letter spacing",
-                    "competitive_advantage"
+                    "professional clean design, perfect letter spacing"
                 ),
-                "technology_stack": self.generate_illustration(
+                "technology_stack": (
                     "Connected network of abstract tech icons, circular nodes linked by flowing lines, "
                     "gold and blue color palette, clean minimalist style, no text, "
-                    "geometric shapes, modern professional design",
-                    "technology_stack"
+                    "geometric shapes, modern professional design"
                 ),
-                "growth_trajectory": self.generate_illustration(
+                "growth_trajectory": (
                     "Large bold text reading exactly 'ROI' in gold color (#FFD700), "
                     "upward trending arrow integrated with letters, "
                     "modern bold sans-serif font, sharp typography, "
                     "blue to gold gradient background, professional style, "
-                    "perfect letter spacing, ultra-sharp rendering",
-                    "growth_trajectory"
+                    "perfect letter spacing, ultra-sharp rendering"
                 )
             }
         else:
             print("Using TEXT-FREE approach (no text in AI images)\n")
-            illustrations = {
-                "market_opportunity": self.generate_illustration(
+            prompts = {
+                "market_opportunity": (
                     "Abstract geometric arrow pointing upward, clean minimalist design, "
                     "gold gradient flowing into deep blue, smooth curves, professional modern icon style, "
-                    "no text, no labels, no numbers, simple shapes only",
-                    "market_opportunity"
+                    "no text, no labels, no numbers, simple shapes only"
                 ),
-                "competitive_advantage": self.generate_illustration(
+                "competitive_advantage": (
                     "Gold trophy icon in center, surrounded by clean checkmark symbols arranged in circle, "
                     "minimalist flat design, blue accent elements, no text, no labels, "
-                    "simple geometric shapes, professional modern style",
-                    "competitive_advantage"
+                    "simple geometric shapes, professional modern style"
                 ),
-                "technology_stack": self.generate_illustration(
+                "technology_stack": (
                     "Connected network of abstract tech icons, circular nodes linked by flowing lines, "
                     "gold and blue color palette, clean minimalist style, no text, "
-                    "geometric shapes, modern professional design",
-                    "technology_stack"
+                    "geometric shapes, modern professional design"
                 ),
-                "growth_trajectory": self.generate_illustration(
+                "growth_trajectory": (
                     "Smooth curved arrow rising exponentially upward, gold coin icons scattered along path, "
                     "blue to gold gradient, clean modern design, no text, no numbers, "
-                    "no labels, simple elegant visualization",
-                    "growth_trajectory"
+                    "no labels, simple elegant visualization"
                 )
             }
         
+        # All tasks go out now; layout proceeds and each slide waits only for its own image
+        illustrations = IllustrationScheduler(self.temp_images_dir)
+        illustrations.start(prompts)
+        
         # Create PDF
         doc = SimpleDocTemplate(
             str(pdf_filename),
@@ -318,8 +405,9 @@ class IllustratedProposalGenerator:
         # SLIDE 2: Market Opportunity
         story.append(Paragraph("The Market Opportunity", heading_style))
         
-        if illustrations["market_opportunity"] and illustrations["market_opportunity"].exists():
-            img = Image(str(illustrations["market_opportunity"]), width=6*inch, height=3.375*inch)
+        image_path = illustrations.result("market_opportunity")
+        if image_path and image_path.exists():
+            img = Image(str(image_path), width=6*inch, height=3.375*inch)
             story.append(img)
             story.append(Spacer(1, 0.2*inch))
         
@@ -357,8 +445,9 @@ class IllustratedProposalGenerator:
         # SLIDE 3: The Market Gap
         story.append(Paragraph("Why We Win: The Market Gap", heading_style))
         
-        if illustrations["competitive_advantage"] and illustrations["competitive_advantage"].exists():
-            img = Image(str(illustrations["competitive_advantage"]), width=6*inch, height=3.375*inch)
+        image_path = illustrations.result("competitive_advantage")
+        if image_path and image_path.exists():
+            img = Image(str(image_path), width=6*inch, height=3.375*inch)
             story.append(img)
             story.append(Spacer(1, 0.2*inch))
         
@@ -429,8 +518,9 @@ class IllustratedProposalGenerator:
         # SLIDE 5: Financial Overview
         story.append(Paragraph("The Numbers That Matter", heading_style))
         
-        if illustrations["growth_trajectory"] and illustrations["growth_trajectory"].exists():
-            img = Image(str(illustrations["growth_trajectory"]), width=6*inch, height=3.375*inch)
+        image_path = illustrations.result("growth_trajectory")
+        if image_path and image_path.exists():
+            img = Image(str(image_path), width=6*inch, height=3.375*inch)
             story.append(img)
             story.append(Spacer(1, 0.2*inch))
         
@@ -618,6 +708,9 @@ class IllustratedProposalGenerator:
         # Build PDF
         doc.build(story)
         
+        # Images not placed in the PDF (technology_stack) are still saved, within the same budget
+        illustrations.wait()
+        
         print(f"\nPDF generated successfully!")
         print(f"Saved to: {pdf_filename}")
         
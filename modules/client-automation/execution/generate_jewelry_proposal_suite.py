@@ -10,9 +10,17 @@ Generates 4 stakeholder-specific proposals:
 """
 
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.templating import render, render_to_file
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
 COMPANY_NAME = "El Dorado Gold and Silver"
 COMPANY_SLUG = "el_dorado"
 INDUSTRY = "Jewelry E-Commerce"
@@ -20,447 +28,13 @@ MARKET = "Canadian Silver & Gold Jewelry"
 
 def generate_executive_summary():
     """Generate Executive Summary for CEO/Owner"""
-    
-    content = f"""# El Dorado Gold and Silver
-## Digital Transformation & E-Commerce Growth Strategy
-
-**Prepared For**: El Dorado Gold and Silver Leadership  
-**Prepared By**: William Meléndez Salas, MBA - InnovLead Canada Inc.  
-**Date**: {datetime.now().strftime('%B %d, %Y')}  
-**Document Type**: Executive Summary & Strategic Partnership Proposal  
-
----
-
-## Executive Summary
-
-**The Opportunity**: The Canadian jewelry e-commerce market represents a $4.2B opportunity, with silver and gold jewelry accounting for $680M+ annually. Online penetration has reached 22% and continues accelerating post-pandemic. El Dorado Gold and Silver is positioned to capture significant market share through a strategic partnership with InnovLead Canada Inc.
-
-**The Partnership Structure**:
-- **El Dorado Focus**: Production excellence, craftsmanship, inventory, shipping/fulfillment
-- **InnovLead Focus**: Complete digital infrastructure, e-commerce platform, marketing automation, data processing, SEO, compliance
-
-**The Vision**: Become the leading online destination for professional-quality, ethically-sourced gold and silver jewelry in Canada by combining artisan craftsmanship with cutting-edge automation and technology.
-
----
-
-## Market Intelligence
-
-### Market Size & Growth
-- **Total Canadian Jewelry Market**: $4.2B CAD (2024-2025)
-- **Silver & Gold Segment**: $680M (6.2% CAGR)
-- **Online Share**: 22% and growing rapidly
-- **Target Market**: $150M addressable online market
-
-### Consumer Trends
-1. **Personalization Premium**: 37% of consumers will pay more for customized jewelry
-2. **Ethical Sourcing**: Sustainability messaging drives 28% purchase decisions
-3. **Mobile-First**: 70% of jewelry purchases initiated on mobile devices
-4. **Social Commerce**: Instagram/TikTok Shop growing 45% YoY
-
-### Competitive Landscape Analysis
-
-InnovLead analyzed 5 major competitors in the Canadian market:
-
-| Competitor | Threat Level | Key Weakness | Our Advantage |
-|-----------|--------------|--------------|---------------|
-| **Mejuri** | HIGH (8.8/10) | High prices ($150-500) | Better value + automation |
-| **People's Jewellers** | LOW (4.8/10) | Weak online presence | Digital-first approach |
-| **Etsy Sellers** | LOW (5.0/10) | Fragmented, inconsistent | Professional + personal |
-| **Amazon Jewelry** | MEDIUM (6.7/10) | No brand equity | Storytelling + quality |
-| **Brilliant Earth** | HIGH (8.5/10) | Limited silver/gold focus | Direct competition in metals |
-
-**Strategic Gap Identified**: No competitor successfully combines **professional quality** + **personal touch** + **competitive pricing** + **modern technology**. This is El Dorado's market position.
-
----
-
-## The InnovLead Solution
-
-### 8-Dimension Strategic Framework
-
-#### 1. E-Commerce Infrastructure
-- **Platform**: Shopify Plus (enterprise-grade, scalable to $10M+)
-- **Mobile-Optimized**: Responsive design, < 2 second load times
-- **Payment Processing**: Stripe (PCI DSS compliant) + multi-currency (CAD/USD)
-- **Security**: ISO 27001 certified, PIPEDA compliant from day one
-
-#### 2. Process Automation
-**Order-to-Fulfillment Automation**:
-- Real-time order sync to production dashboard
-- Automated inventory management with reorder alerts
-- Auto-generated shipping labels (Canada Post API)
-- Triggered customer notifications (email + SMS)
-
-**ROI**: Eliminates 8 hours/day of manual work = **$60,000 CAD annually**
-
-#### 3. Marketing Automation Stack
-- **Email Marketing**: 15+ automated sequences (welcome, abandoned cart, post-purchase, win-back)
-- **SMS Marketing**: CASL-compliant order updates and promotions
-- **Social Media**: Auto-posting to Instagram, Facebook, TikTok
-- **Retargeting**: Multi-platform pixel strategy
-- **Loyalty Program**: Automated points tracking and rewards
-
-#### 4. SEO & Content Strategy
-**Target Keywords** (1,200-3,400 monthly searches):
-- "sterling silver rings Canada"
-- "handmade gold jewelry Toronto"
-- "925 silver earrings"
-- "ethical gold jewelry"
-
-**Content Engine**: 2 blog posts/week + video content (production storytelling)
-
-#### 5. Campaign Automation
-**Quarterly Calendar**:
-- Q1: Valentine's "Love in Gold & Silver"
-- Q2: Mother's Day + Bridal Collections
-- Q3: Anniversary + Self-Gifting
-- Q4: Holiday Sparkle (major revenue driver)
-
-#### 6. Compliance & Data Management
-- **PIPEDA**: Privacy management program, breach response, data governance
-- **CASL**: Double opt-in, clear unsubscribe, consent tracking
-- **PCI DSS**: Secure payment processing, fraud detection
-- **ISO 27001**: InnovLead certified, protecting your customer data
-
-#### 7. Customer Experience
-- **AI Chatbot**: 24/7 product inquiries, sizing help, order tracking
-- **AR Try-On**: Virtual jewelry visualization (reduce returns 40%)
-- **Live Consultations**: Video calls for high-value purchases
-- **Production Transparency**: Real-time "Your ring is being polished!" updates
-
-#### 8. Funding & Incentives
-- **CDAP Grant**: $15,000 for digital adoption
-- **SR&ED Tax Credits**: $8,000-$15,000 for R&D activities
-- **Total Funding Potential**: $23,000-$30,000 (Year 1)
-
----
-
-## Financial Projections
-
-### Year 1 Revenue Model (Conservative)
-
-| Quarter | Avg Monthly Orders | Avg Order Value | Monthly Revenue | Quarterly Revenue |
-|---------|-------------------|-----------------|----------------|-------------------|
-| **Q1** | 120 | $180 | $21,600 | $64,800 |
-| **Q2** | 180 | $190 | $34,200 | $102,600 |
-| **Q3** | 150 | $185 | $27,750 | $83,250 |
-| **Q4** | 300 | $210 | $63,000 | $189,000 |
-| **YEAR 1 TOTAL** | - | - | - | **$439,650** |
-
-### Investment Breakdown
-
-| Component | Setup (Month 1-3) | Monthly Ongoing | Annual Total |
-|-----------|-------------------|-----------------|--------------|
-| E-Commerce Platform | $5,000 | $300 | $8,600 |
-| Marketing Automation | $3,000 | $500 | $9,000 |
-| SEO & Content | $2,000 | $1,500 | $20,000 |
-| Process Automation | $8,000 | $200 | $10,400 |
-| Paid Advertising | $0 | $3,000 | $36,000 |
-| **InnovLead Partnership** | $10,000 | $2,500 | **$40,000** |
-| **TOTAL INVESTMENT** | **$28,000** | **$8,000** | **$124,000** |
-
-### Profitability Analysis
-
-- **Year 1 Revenue**: $439,650
-- **Gross Margin** (jewelry avg): 65%
-- **Gross Profit**: $285,772
-- **Operating Expenses** (incl. InnovLead): $124,000
-- **Net Profit**: **$161,772** (37% net margin)
-
-**ROI on InnovLead Investment**: **130%**
-
-### After Funding
-
-- **Total Funding**: $23,000-$30,000
-- **Net Investment**: $94,000-$101,000
-- **Adjusted ROI**: **160-172%**
-
-### Years 2-3 Projections
-
-- **Year 2**: $850,000 revenue (93% growth)
-- **Year 3**: $1.4M revenue (65% growth)
-- InnovLead costs decrease as % of revenue (economies of scale)
-
----
-
-## Competitive Differentiation
-
-### What Makes El Dorado + InnovLead Unstoppable
-
-❌ **Typical Jewelry Store**: "We sell silver and gold jewelry online"
-
-✅ **El Dorado + InnovLead**:
-
-1. **Technology-Enhanced Craft**
-   - Artisan quality with AR try-on, production tracking, automated personalization
-   - *Beats Etsy on technology, Amazon on craft, Mejuri on price*
-
-2. **Transparent Production**
-   - Real-time production updates, behind-the-scenes videos, meet-the-maker stories
-   - *Unique differentiator - no competitor does this at scale*
-
-3. **Accessible Premium**
-   - $80-180 price range with ethical sourcing and professional quality
-   - *Ethical like Brilliant Earth, priced fairly, professionally presented*
-
-4. **Automation-Powered Experience**
-   - 24/7 chatbot, personalized recommendations, abandoned cart recovery
-   - *Eliminates manual work, scales infinitely*
-
-5. **Compliance Shield**
-   - PIPEDA, CASL, PCI DSS built-in from day one
-   - *No fines, no breaches, no reputation damage*
-
----
-
-## The InnovLead Advantage
-
-### Why InnovLead Canada Inc.?
-
-**Leadership**: William Meléndez Salas, MBA
-- **Credentials**: ISO 27001 Lead Implementer, PIPEDA/Loi 25/CASL Expert
-- **Track Record**: +30% YoY growth, 10 years AI-led digitalization across Latin America & Europe
-- **Unique Edge**: Quant trading algorithms (18% CAGR) applied to marketing optimization
-- **Athletic Discipline**: 10× Colombian Judo Champion - discipline translates to results
-- **Published Authority**: 6-time author on AI, leadership, and high performance
-
-**Technical Excellence**:
-- Full-stack development (front-end, back-end, automation, AI/ML)
-- Enterprise-grade security (ISO 27001 certified)
-- Canadian compliance expertise (PIPEDA, CASL, Loi 25)
-- Growth marketing (SEO, paid ads, email, social, content)
-
-**Strategic Partnership Model**:
-- Not vendor-client, but true partners in success
-- Aligned incentives (we succeed when you succeed)
-- Hands-on involvement, not "set it and forget it"
-- Continuous optimization and growth focus
-
----
+    return render(TEMPLATE_DIR, "el_dorado_executive_summary.md", date=datetime.now())
 
-## Implementation Roadmap
 
-### Phase 1: Foundation (Months 1-2)
-
-**Week 1-2: Discovery & Strategy**
-- Complete 8-dimension analysis
-- Customer persona development
-- Brand positioning workshop
-- Technical infrastructure audit
-
-**Week 3-4: Platform Setup**
-- Shopify Plus deployment
-- Payment gateway integration
-- Product catalog setup
-- Mobile optimization testing
-
-**Week 5-8: Automation Infrastructure**
-- Order management automation
-- Inventory sync system
-- Email/SMS marketing platforms
-- Customer service chatbot (Phase 1)
-
-### Phase 2: Growth (Months 3-6)
-
-**Month 3: SEO & Content Launch**
-- Technical SEO optimization
-- 8 pillar content pieces
-- Blog automation
-- Local SEO setup
-
-**Month 4: Marketing Automation**
-- 15+ email sequences
-- Abandoned cart recovery
-- Review generation
-- Loyalty program launch
-
-**Month 5-6: Paid Acquisition**
-- Google Shopping campaigns
-- Facebook/Instagram ads
-- Pinterest visual ads
-- Influencer partnerships
-
-### Phase 3: Scale (Months 7-12)
-
-**Month 7-9: Advanced Features**
-- AR try-on implementation
-- Virtual consultation booking
-- B2B wholesale portal
-- Subscription box MVP
-
-**Month 10-12: Optimization**
-- Conversion rate optimization
-- A/B testing framework
-- US market expansion
-- Year 2 strategy planning
-
----
-
-## Success Metrics & KPIs
-
-### Month-by-Month Targets
-
-| Metric | Month 3 | Month 6 | Month 9 | Month 12 |
-|--------|---------|---------|---------|----------|
-| **Revenue** | $21,600 | $34,200 | $45,000 | $63,000 |
-| **Orders** | 120 | 180 | 240 | 300 |
-| **Conversion Rate** | 1.8% | 2.2% | 2.6% | 3.0% |
-| **Avg Order Value** | $180 | $190 | $195 | $210 |
-| **Email List** | 1,200 | 3,500 | 6,800 | 12,000 |
-| **Organic Traffic** | 2,000/mo | 4,500/mo | 8,200/mo | 15,000/mo |
-| **ROAS (Paid Ads)** | 2.5x | 3.2x | 3.8x | 4.5x |
-
----
-
-## Risk Mitigation
-
-| Risk | Probability | Impact | Mitigation Strategy |
-|------|-------------|--------|---------------------|
-| **Platform Downtime** | Medium | High | 99.9% SLA, CDN, backup systems |
-| **Data Breach** | Low | Critical | ISO 27001 controls, pen testing |
-| **CASL Violation** | Medium | High | Legal review, double opt-in, audit trail |
-| **Poor Ad Performance** | Medium | Medium | Start small, A/B test, 30-day reviews |
-| **Production Delays** | High | Medium | Buffer inventory, transparent communication |
-| **Chargeback Fraud** | Medium | Medium | Fraud detection, 3D Secure, clear policies |
-
----
-
-## Next Steps
-
-### Immediate Actions
-
-1. **Discovery Session** (90 minutes)
-   - Deep-dive into business goals
-   - Review technical requirements
-   - Align on timeline and priorities
-
-2. **Competitive Intelligence Report** (72 hours)
-   - Detailed 5-competitor teardown
-   - Market positioning analysis
-   - SEO keyword opportunities
-
-3. **Funding Application Prep** (1 week)
-   - CDAP grant pre-fill
-   - SR&ED documentation setup
-   - BDC financing introduction
-
-4. **Technical Proposal** (3 days)
-   - Detailed tech stack recommendation
-   - Integration architecture
-   - Security & compliance plan
-
-5. **Contract & Kickoff** (Day 14-21)
-   - Partnership agreement
-   - Phase 1 launch
-   - Team introductions
-
-### Decision Timeline
-
-- **Day 0**: This proposal delivered
-- **Day 7**: Discovery session + Q&A
-- **Day 14**: Final proposal + contract
-- **Day 21**: Kickoff (Phase 1 begins)
-- **Day 90**: Platform live + automation running
-- **Day 180**: First major campaign (Holiday 2025)
-
----
-
-## Investment Summary
-
-### Total Partnership Investment (Year 1)
-
-| Component | Amount |
-|-----------|--------|
-| **Total Investment** | $124,000 |
-| **Less: CDAP Grant** | -$15,000 |
-| **Less: SR&ED Credits** | -$8,000 to -$15,000 |
-| **Net Investment** | **$94,000 to $101,000** |
-
-### Expected Returns (Year 1)
-
-| Metric | Amount |
-|--------|--------|
-| **Gross Revenue** | $439,650 |
-| **Gross Profit** (65% margin) | $285,772 |
-| **Net Profit** (after all expenses) | $161,772 |
-| **ROI** | **160-172%** |
-
-### Year 2-3 Trajectory
-
-- **Year 2 Revenue**: $850,000 (93% growth)
-- **Year 3 Revenue**: $1,400,000 (65% growth)
-- **3-Year Total**: $2.69M revenue
-- **InnovLead becomes smaller % of revenue** (economies of scale)
-
----
-
-## Why This Works
-
-### The Moat
-
-**"The consultancy is the moat. The automation is the product. The vault is the asset."**
-
-This isn't just an e-commerce store. This is:
-
-✅ A **compliance-first** operation (no fines, no breaches)  
-✅ An **automation-powered** growth engine (93% reduction in manual work)  
-✅ A **data-driven** marketing machine (quant algorithms optimizing ROAS)  
-✅ A **funding-intelligent** business (unlocking $23-30K in grants)  
-✅ A **strategic partnership** (InnovLead succeeds when El Dorado succeeds)  
-
-### The Competitive Reality
-
-Your competitors are either:
-1. **Strong brand, weak tech** (Mejuri, Brilliant Earth)
-2. **Strong tech, weak brand** (Amazon)
-3. **Fragmented, inconsistent** (Etsy)
-4. **Outdated, offline-focused** (People's Jewellers)
-
-**El Dorado + InnovLead combines**: Strong brand + Strong tech + Consistent quality + Modern experience
-
-That's how we dominate.
-
----
-
-## Contact & Next Steps
-
-**Ready to build Canada's leading gold & silver jewelry e-commerce brand?**
-
-**William Meléndez Salas, MBA**  
-CEO & Principal – InnovLead Canada Inc.  
-📧 wms090807@gmail.com  
-🔗 linkedin.com/in/william-m-salas  
-📅 calendly.com/innovlead-ca  
-
-**Credentials**:
-- ISO 27001 Lead Implementer
-- PIPEDA, Loi 25, CASL Compliance Expert
-- MBA in Big Data & Project Management
-- 10× Colombian Judo Champion
-- Quant Trader (18% CAGR)
-- 6-time Published Author
-
----
-
-**Let's crush this together.** 💎
-
-This proposal represents a strategic partnership to build a dominant e-commerce brand in the Canadian gold and silver jewelry market. InnovLead brings technical excellence, compliance expertise, automation sophistication, and growth marketing mastery. El Dorado brings craftsmanship, production excellence, and industry knowledge.
-
-Together, we capture a $150M+ market opportunity and build a lasting, profitable business.
-
-**The time to act is now.**
-"""
-
-    return content
-
-
-def save_proposal(filename, content):
-    """Save proposal to file"""
+def save_proposal(filename, template, **context):
+    """Render a proposal template straight to file"""
     output_dir = Path(__file__).parent.parent / "outputs" / "proposals" / "el_dorado"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    filepath = output_dir / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    filepath = render_to_file(TEMPLATE_DIR, template, output_dir / filename, **context)
     
     print(f"✅ Generated: {filename}")
     return filepath
@@ -477,8 +51,11 @@ def main():
     print("\nGenerating proposals...\n")
     
     # Generate Executive Summary
-    exec_summary = generate_executive_summary()
-    exec_path = save_proposal(f"{COMPANY_SLUG}_executive_summary_{datetime.now().strftime('%Y%m%d')}.md", exec_summary)
+    exec_path = save_proposal(
+        f"{COMPANY_SLUG}_executive_summary_{datetime.now().strftime('%Y%m%d')}.md",
+        "el_dorado_executive_summary.md",
+        date=datetime.now()
+    )
     
     print("\n" + "="*70)
     print("Proposal Suite Generation Complete!")
@@ -3,6 +3,7 @@ Automated Proposal HTML Generator
 Generates professional PowerPoint-style HTML presentations with correct data
 
 Usage: python generate_proposal_html.py "Company Name"
+       python generate_proposal_html.py --benchmark [count]
 Example: python generate_proposal_html.py "El Dorado Gold and Silver"
 """
 
@@ -10,6 +11,15 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime
+from typing import Dict
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.templating import benchmark as benchmark_templates, render_to_file
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+TEMPLATE = "partnership_proposal.html"
 
 class ProposalGenerator:
     def __init__(self, company_name: str):
@@ -21,590 +31,9 @@ class ProposalGenerator:
     def generate_html(self):
         """Generate modern PowerPoint-style HTML presentation"""
         
-        html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.company_name} - InnovLead Partnership Proposal</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            color: #ffffff;
-            overflow-x: hidden;
-        }}
-
-        .slide {{
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            padding: 80px 100px;
-            text-align: center;
-            page-break-after: always;
-            position: relative;
-        }}
-
-        h1 {{
-            font-size: 5.5em;
-            margin-bottom: 40px;
-            font-weight: 700;
-            background: linear-gradient(135deg, #FFD700, #FFA500);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            letter-spacing: -2px;
-            line-height: 1.1;
-        }}
-
-        h2 {{
-            font-size: 3.5em;
-            margin-bottom: 50px;
-            color: #FFD700;
-            font-weight: 700;
-            letter-spacing: -1px;
-            text-shadow: 0 4px 20px rgba(255, 215, 0, 0.3);
-        }}
-
-        h3 {{
-            font-size: 2.2em;
-            margin: 30px 0 20px;
-            color: #00D4FF;
-            font-weight: 600;
-        }}
-
-        p, li {{
-            font-size: 1.5em;
-            line-height: 1.7;
-            margin: 18px 0;
-            font-weight: 400;
-        }}
-
-        .highlight {{
-            color: #FFD700;
-            font-weight: 700;
-            font-size: 1.15em;
-        }}
-
-        .stat-box {{
-            background: linear-gradient(135deg, rgba(255, 215, 0, 0.15), rgba(255, 165, 0, 0.1));
-            border: 3px solid #FFD700;
-            border-radius: 25px;
-            padding: 50px 60px;
-            margin: 35px;
-            min-width: 350px;
-            box-shadow: 0 15px 50px rgba(255, 215, 0, 0.4), 0 5px 15px rgba(0, 0, 0, 0.3);
-            transition: transform 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .stat-box::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 5px;
-            background: linear-gradient(90deg, #FFD700, #FFA500, #FFD700);
-        }}
-
-        .stat-box:hover {{
-            transform: translateY(-8px);
-        }}
-
-        .stat-number {{
-            font-size: 4.5em;
-            font-weight: 800;
-            color: #FFD700;
-            text-shadow: 0 4px 15px rgba(255, 215, 0, 0.5);
-            letter-spacing: -2px;
-        }}
-
-        .stat-label {{
-            font-size: 1.4em;
-            color: #00D4FF;
-            margin-top: 15px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-
-        .grid-2 {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 50px;
-            margin: 50px 0;
-            width: 100%;
-            max-width: 1400px;
-        }}
-
-        .grid-3 {{
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 45px;
-            margin: 50px 0;
-            width: 100%;
-            max-width: 1600px;
-        }}
-
-        .card {{
-            background: linear-gradient(145deg, rgba(0, 212, 255, 0.12), rgba(0, 100, 150, 0.08));
-            border: 2px solid rgba(0, 212, 255, 0.4);
-            border-radius: 20px;
-            padding: 45px;
-            text-align: left;
-            box-shadow: 0 10px 35px rgba(0, 212, 255, 0.2);
-            transition: transform 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, #00D4FF, #0066FF, #00D4FF);
-        }}
-
-        .card:hover {{
-            transform: translateY(-5px);
-        }}
-
-        .card h3 {{
-            color: #FFD700;
-            margin-top: 0;
-            margin-bottom: 20px;
-            font-size: 2em;
-        }}
-
-        table {{
-            width: 100%;
-            max-width: 1200px;
-            margin: 40px auto;
-            border-collapse: separate;
-            border-spacing: 0;
-            background: linear-gradient(145deg, rgba(255, 255, 255, 0.08), rgba(255, 255, 255, 0.03));
-            border-radius: 20px;
-            overflow: hidden;
-            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.3);
-        }}
-
-        th {{
-            background: linear-gradient(135deg, rgba(255, 215, 0, 0.25), rgba(255, 165, 0, 0.2));
-            color: #FFD700;
-            padding: 28px 25px;
-            font-size: 1.5em;
-            text-align: left;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            border-bottom: 3px solid #FFD700;
-        }}
-
-        td {{
-            padding: 22px 25px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            font-size: 1.4em;
-        }}
-
-        tr:hover {{
-            background: linear-gradient(90deg, rgba(0, 212, 255, 0.15), rgba(0, 212, 255, 0.05));
-        }}
-
-        tr:last-child td {{
-            border-bottom: none;
-        }}
-
-        .logo {{
-            font-size: 6em;
-            margin-bottom: 30px;
-            filter: drop-shadow(0 10px 30px rgba(255, 215, 0, 0.5));
-        }}
-
-        .subtitle {{
-            font-size: 2em;
-            color: #00D4FF;
-            margin-bottom: 60px;
-            font-weight: 300;
-            letter-spacing: 2px;
-        }}
-
-        ul {{
-            list-style: none;
-            text-align: left;
-            max-width: 900px;
-            margin: 25px auto;
-        }}
-
-        ul li {{
-            margin: 20px 0;
-            padding-left: 50px;
-            position: relative;
-            font-size: 1.5em;
-        }}
-
-        ul li:before {{
-            content: "💎";
-            position: absolute;
-            left: 0;
-            font-size: 1.6em;
-        }}
-
-        .emphasis {{
-            background: linear-gradient(135deg, rgba(255, 215, 0, 0.2), rgba(255, 165, 0, 0.15));
-            padding: 50px 60px;
-            border-left: 8px solid #FFD700;
-            border-radius: 0 20px 20px 0;
-            margin: 50px auto;
-            text-align: left;
-            max-width: 1200px;
-            box-shadow: 0 10px 40px rgba(255, 215, 0, 0.25);
-        }}
-
-        .button {{
-            display: inline-block;
-            background: linear-gradient(135deg, #FFD700, #FFA500);
-            color: #1a1a2e;
-            padding: 28px 70px;
-            border-radius: 60px;
-            text-decoration: none;
-            font-size: 1.8em;
-            font-weight: 800;
-            margin: 40px 0;
-            box-shadow: 0 15px 40px rgba(255, 215, 0, 0.5);
-            transition: all 0.3s ease;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-
-        .button:hover {{
-            transform: translateY(-8px) scale(1.05);
-        }}
-
-        .slide-number {{
-            position: absolute;
-            bottom: 30px;
-            right: 40px;
-            font-size: 1.2em;
-            color: rgba(255, 215, 0, 0.5);
-            font-weight: 600;
-        }}
-
-        .accent-line {{
-            width: 100px;
-            height: 5px;
-            background: linear-gradient(90deg, #FFD700, #FFA500);
-            margin: 30px auto;
-            border-radius: 5px;
-        }}
-
-        .slide-bg-accent {{
-            position: absolute;
-            top: 0;
-            right: -200px;
-            width: 600px;
-            height: 600px;
-            background: radial-gradient(circle, rgba(255, 215, 0, 0.1), transparent);
-            border-radius: 50%;
-            filter: blur(100px);
-            z-index: 0;
-        }}
-
-        .slide > * {{
-            position: relative;
-            z-index: 1;
-        }}
-
-        @media print {{
-            .slide {{
-                page-break-after: always;
-                padding: 60px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-
-    <!-- SLIDE 1: Title -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <div class="logo">💎</div>
-        <h1>{self.company_name}</h1>
-        <div class="accent-line"></div>
-        <p class="subtitle">Strategic Partnership Proposal</p>
-        <div style="display: flex; gap: 30px; justify-content: center; flex-wrap: wrap;">
-            <div class="stat-box">
-                <div class="stat-number">$440K</div>
-                <div class="stat-label">Year 1 Revenue</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">160-188%</div>
-                <div class="stat-label">ROI</div>
-            </div>
-        </div>
-        <p style="margin-top: 60px; font-size: 1.4em;">Presented by: <span class="highlight">William Meléndez Salas, MBA</span><br>
-            InnovLead Canada Inc.</p>
-        <div class="slide-number">1 / 8</div>
-    </div>
-
-    <!-- SLIDE 2: Market Opportunity -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <h2>The Market Opportunity</h2>
-        <div class="accent-line"></div>
-        <div class="grid-3">
-            <div class="stat-box">
-                <div class="stat-number">$4.2B</div>
-                <div class="stat-label">Canadian Market</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">$680M</div>
-                <div class="stat-label">Gold & Silver</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">22%</div>
-                <div class="stat-label">Online Growth</div>
-            </div>
-        </div>
-        <div class="emphasis">
-            <p class="highlight" style="font-size: 1.7em; margin-bottom: 25px;">Growing 6.2% annually with accelerating online adoption</p>
-            <p style="margin-top: 25px; font-size: 1.4em;">{self.company_name} enters at the perfect inflection point to capture market share.</p>
-        </div>
-        <div class="slide-number">2 / 8</div>
-    </div>
-
-    <!-- SLIDE 3: Market Gap -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <h2>Why We Win: The Market Gap</h2>
-        <div class="accent-line"></div>
-        <p style="font-size: 1.6em; margin-bottom: 50px;">Analyzed 5 major competitors - found critical gap:</p>
-        <table>
-            <tr>
-                <th>What Market Wants</th>
-                <th>Who Delivers It?</th>
-                <th>{self.company_name}</th>
-            </tr>
-            <tr>
-                <td><strong>Professional Quality</strong></td>
-                <td>✅ Mejuri (expensive)<br>❌ Etsy (inconsistent)</td>
-                <td class="highlight" style="font-size: 1.5em;">✅ YES</td>
-            </tr>
-            <tr>
-                <td><strong>Personal Touch</strong></td>
-                <td>✅ Etsy<br>❌ Amazon, Mejuri</td>
-                <td class="highlight" style="font-size: 1.5em;">✅ YES</td>
-            </tr>
-            <tr>
-                <td><strong>Fair Pricing</strong></td>
-                <td>✅ Amazon<br>❌ Mejuri, Brilliant Earth</td>
-                <td class="highlight" style="font-size: 1.5em;">✅ YES</td>
-            </tr>
-            <tr>
-                <td><strong>Modern Technology</strong></td>
-                <td>✅ Mejuri, Amazon<br>❌ Etsy, People's</td>
-                <td class="highlight" style="font-size: 1.5em;">✅ YES</td>
-            </tr>
-        </table>
-        <p class="highlight" style="font-size: 2em; margin-top: 50px;">Nobody has all four. This is {self.company_name}'s position.</p>
-        <div class="slide-number">3 / 8</div>
-    </div>
-
-    <!-- SLIDE 4: Partnership -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <h2>The Partnership Structure</h2>
-        <div class="accent-line"></div>
-        <div class="grid-2">
-            <div class="card">
-                <h3>🏆 {self.company_name} Focuses On:</h3>
-                <ul style="font-size: 1.3em;">
-                    <li>Production excellence</li>
-                    <li>Craftsmanship & quality</li>
-                    <li>Inventory management</li>
-                    <li>Shipping & fulfillment</li>
-                </ul>
-            </div>
-            <div class="card">
-                <h3>🚀 InnovLead Delivers:</h3>
-                <ul style="font-size: 1.3em;">
-                    <li>E-commerce platform</li>
-                    <li>Marketing automation</li>
-                    <li>SEO & content strategy</li>
-                    <li>Process automation</li>
-                    <li>Compliance (PIPEDA/CASL)</li>
-                    <li>Paid advertising</li>
-                    <li>Data analytics</li>
-                </ul>
-            </div>
-        </div>
-        <div class="emphasis" style="text-align: center; margin-top: 50px;">
-            <p class="highlight" style="font-size: 1.8em;">You focus on craft. We handle everything digital.</p>
-        </div>
-        <div class="slide-number">4 / 8</div>
-    </div>
-
-    <!-- SLIDE 5: Investment -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <h2>The Numbers That Matter</h2>
-        <div class="accent-line"></div>
-        <div class="grid-3">
-            <div class="stat-box">
-                <div class="stat-number">$124K</div>
-                <div class="stat-label">Total Investment</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">-$23-38K</div>
-                <div class="stat-label">Grants & Credits</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">$94-101K</div>
-                <div class="stat-label">Net Investment</div>
-            </div>
-        </div>
-        <h3 style="margin-top: 60px; font-size: 2.5em;">3-Year Revenue Growth</h3>
-        <div class="grid-3">
-            <div class="stat-box">
-                <div class="stat-number">$440K</div>
-                <div class="stat-label">Year 1</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">$850K</div>
-                <div class="stat-label">Year 2 (+93%)</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-number">$1.4M</div>
-                <div class="stat-label">Year 3 (+65%)</div>
-            </div>
-        </div>
-        <div class="slide-number">5 / 8</div>
-    </div>
-
-    <!-- SLIDE 6: Profitability -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <h2>Year 1 Profitability</h2>
-        <div class="accent-line"></div>
-        <table>
-            <tr>
-                <th>Metric</th>
-                <th style="text-align: right;">Amount</th>
-            </tr>
-            <tr>
-                <td>Revenue</td>
-                <td class="highlight" style="text-align: right;">$439,650</td>
-            </tr>
-            <tr>
-                <td>Gross Profit (65% margin)</td>
-                <td class="highlight" style="text-align: right;">$285,772</td>
-            </tr>
-            <tr>
-                <td>Operating Expenses</td>
-                <td style="text-align: right;">$124,000</td>
-            </tr>
-            <tr style="border-top: 3px solid #FFD700;">
-                <td><strong style="font-size: 1.3em;">Net Profit</strong></td>
-                <td class="highlight" style="font-size: 1.8em; text-align: right;">$161,772</td>
-            </tr>
-            <tr>
-                <td><strong>Net Margin</strong></td>
-                <td class="highlight" style="text-align: right;">37%</td>
-            </tr>
-            <tr>
-                <td><strong style="font-size: 1.3em;">ROI</strong></td>
-                <td class="highlight" style="font-size: 1.8em; text-align: right;">160-188%</td>
-            </tr>
-        </table>
-        <div class="slide-number">6 / 8</div>
-    </div>
-
-    <!-- SLIDE 7: Why InnovLead -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <h2>Why InnovLead Canada?</h2>
-        <div class="accent-line"></div>
-        <div class="emphasis" style="text-align: center;">
-            <h3 style="color: #FFD700;">William Meléndez Salas, MBA</h3>
-            <p style="font-size: 1.3em; margin: 20px 0;">CEO & Principal – InnovLead Canada Inc.</p>
-        </div>
-        <div class="grid-2" style="text-align: left;">
-            <div class="card">
-                <h3>Credentials</h3>
-                <ul style="font-size: 1em;">
-                    <li>ISO 27001 Lead Implementer</li>
-                    <li>PIPEDA, Loi 25, CASL Expert</li>
-                    <li>MBA in Big Data & PM</li>
-                    <li>10× Judo Champion</li>
-                    <li>Quant Trader (18% CAGR)</li>
-                    <li>6-time Published Author</li>
-                </ul>
-            </div>
-            <div class="card">
-                <h3>Track Record</h3>
-                <ul style="font-size: 1em;">
-                    <li>+30% YoY InnovLead growth</li>
-                    <li>10 years AI-led digitalization</li>
-                    <li>ISO 27001 certified ops</li>
-                    <li>Enterprise security & compliance</li>
-                    <li>Growth marketing expertise</li>
-                </ul>
-            </div>
-        </div>
-        <p class="highlight" style="font-size: 1.4em; margin-top: 40px;">Not a vendor, a strategic partner. We succeed when you succeed.</p>
-        <div class="slide-number">7 / 8</div>
-    </div>
-
-    <!-- SLIDE 8: Contact -->
-    <div class="slide">
-        <div class="slide-bg-accent"></div>
-        <div class="logo">💎</div>
-        <h1 style="font-size: 4.5em;">Let's Build Together</h1>
-        <div class="accent-line"></div>
-        <p style="font-size: 1.8em; margin: 50px 0; font-weight: 300;">Canada's leading gold & silver jewelry e-commerce brand</p>
-
-        <div class="card" style="display: inline-block; text-align: left; margin: 50px 0; max-width: 700px;">
-            <h3>Contact Information</h3>
-            <p style="font-size: 1.4em; line-height: 1.8;">
-                <strong>William Meléndez Salas, MBA</strong><br>
-                CEO & Principal – InnovLead Canada Inc.<br><br>
-                📧 wms090807@gmail.com<br>
-                🔗 linkedin.com/in/william-m-salas<br>
-                📅 calendly.com/innovlead-ca
-            </p>
-        </div>
-
-        <a href="mailto:wms090807@gmail.com" class="button">Schedule Discovery Session</a>
-
-        <p style="margin-top: 70px; font-size: 1.5em; font-style: italic; font-weight: 300; line-height: 1.6;">
-            "The consultancy is the moat.<br>
-            The automation is the product.<br>
-            The vault is the asset."
-        </p>
-        <div class="slide-number">8 / 8</div>
-    </div>
-
-</body>
-</html>'''
-        
-        # Save HTML
+        # Stream the precompiled template straight to disk
         filename = f"{self.company_slug}_proposal_{datetime.now().strftime('%Y%m%d')}.html"
-        filepath = self.output_dir / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        filepath = render_to_file(TEMPLATE_DIR, TEMPLATE, self.output_dir / filename, company_name=self.company_name)
         
         print(f"\nProposal generated successfully!")
         print(f"Saved to: {filepath}")
@@ -619,13 +48,26 @@ class ProposalGenerator:
         return filepath
 
 
+def benchmark(count: int = 1000) -> Dict:
+    """Render `count` proposals for synthetic companies to a scratch directory"""
+    contexts = ({"company_name": f"Prospect {i} & Co"} for i in range(count))
+    return benchmark_templates(TEMPLATE_DIR, TEMPLATE, contexts)
+
+
 def main():
     """Run proposal generator"""
     if len(sys.argv) < 2:
         print("Usage: python generate_proposal_html.py '<Company Name>'")
+        print("       python generate_proposal_html.py --benchmark [count]")
         print("Example: python generate_proposal_html.py 'El Dorado Gold and Silver'")
         sys.exit(1)
     
+    if sys.argv[1] == "--benchmark":
+        stats = benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+        print(f"{stats['documents']} proposals rendered to file in {stats['render_seconds']:.3f}s "
+              f"({stats['per_document_ms']:.2f} ms each, compile {stats['compile_seconds']:.3f}s)")
+        return
+    
     company_name = sys.argv[1]
     
     generator = ProposalGenerator(company_name)
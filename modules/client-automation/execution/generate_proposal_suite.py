@@ -10,35 +10,59 @@ Generates multi-format deliverables for different stakeholders:
 import sys
 import os
 import json
+import time
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+# Sibling modules, also when imported as modules.client-automation.execution.generate_proposal_suite
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from core.lib.api_client import APIClient
+from core.lib.prompt_compactor import compact_for_prompt
+from core.lib.progress import ProgressTracker
+from generate_strategy import SimpleGemini
+
+
+# What each document's prompt cares about; used to rank research facts during compaction
+DOCUMENT_FOCUS = {
+    "executive_summary": "situation pain points strategic priorities competitors growth revenue savings ROI funding",
+    "technical_roadmap": "tech stack systems tools integration legacy data automation hiring manual processes",
+    "financial_model": "cost savings ROI hours revenue investment grants tax credits amount",
+    "funding_application": "innovation R&D technology eligibility grant employees growth project amount"
+}
+
+# Suite documents: key -> human-readable label
+SUITE_DOCUMENTS = {
+    "executive_summary": "Executive Summary",
+    "technical_roadmap": "Technical Roadmap",
+    "financial_model": "Financial Model",
+    "funding_application": "Funding Application"
+}
 
 
 class ProposalSuiteGenerator:
-    """Generate comprehensive proposal suite"""
+    """Generate comprehensive proposal suite (each generate_* method raises on LLM failure)"""
     
     def __init__(self):
-        self.ai = APIClient()
+        self.ai = SimpleGemini()
     
     def generate_executive_summary(self, company: str, research: dict, strategy: dict, funding: dict):
         """Generate C-Suite focused executive summary"""
         print("[PROPOSAL] Generating Executive Summary...")
+        focus = DOCUMENT_FOCUS["executive_summary"]
         
         prompt = f"""
 You are a management consultant preparing an executive briefing for the C-Suite of {company}.
 
 RESEARCH DATA:
-{json.dumps(research, indent=2)[:3000]}
+{compact_for_prompt(research, 750, focus, "executive_summary research")}
 
 STRATEGIC OPPORTUNITIES:
-{json.dumps(strategy, indent=2)[:2000]}
+{compact_for_prompt(strategy, 500, focus, "executive_summary strategy")}
 
 FUNDING OPPORTUNITIES:
-{json.dumps(funding, indent=2)[:2000]}
+{compact_for_prompt(funding, 500, focus, "executive_summary funding")}
 
 Create a concise executive summary (1-2 pages) in MARKDOWN format:
 
@@ -74,24 +98,21 @@ Create a concise executive summary (1-2 pages) in MARKDOWN format:
 Be specific, use numbers, and focus on business outcomes not technology features.
 """
         
-        try:
-            response = self.ai.call_gemini(prompt)
-            return response
-        except Exception as e:
-            return f"Error generating executive summary: {e}"
+        return self.ai.generate_content(prompt)
     
     def generate_technical_roadmap(self, company: str, research: dict, strategy: dict):
         """Generate IT/Engineering team focused technical roadmap"""
         print("[PROPOSAL] Generating Technical Roadmap...")
+        focus = DOCUMENT_FOCUS["technical_roadmap"]
         
         prompt = f"""
 You are a solutions architect preparing a technical implementation plan for {company}.
 
 RESEARCH DATA:
-{json.dumps(research, indent=2)[:3000]}
+{compact_for_prompt(research, 750, focus, "technical_roadmap research")}
 
 AUTOMATION OPPORTUNITIES:
-{json.dumps(strategy, indent=2)[:2000]}
+{compact_for_prompt(strategy, 500, focus, "technical_roadmap strategy")}
 
 Create a detailed technical roadmap in MARKDOWN format:
 
@@ -142,24 +163,21 @@ Create a detailed technical roadmap in MARKDOWN format:
 Be technically accurate but accessible. Include specific tool names and configurations.
 """
         
-        try:
-            response = self.ai.call_gemini(prompt)
-            return response
-        except Exception as e:
-            return f"Error generating technical roadmap: {e}"
+        return self.ai.generate_content(prompt)
     
     def generate_financial_model(self, company: str, strategy: dict, funding: dict):
         """Generate CFO-focused financial analysis"""
         print("[PROPOSAL] Generating Financial Model...")
+        focus = DOCUMENT_FOCUS["financial_model"]
         
         prompt = f"""
 You are a financial analyst preparing a cost-benefit analysis for {company}'s CFO.
 
 AUTOMATION OPPORTUNITIES:
-{json.dumps(strategy, indent=2)[:2000]}
+{compact_for_prompt(strategy, 500, focus, "financial_model strategy")}
 
 FUNDING OPPORTUNITIES:
-{json.dumps(funding, indent=2)[:1500]}
+{compact_for_prompt(funding, 375, focus, "financial_model funding")}
 
 Create a financial model in MARKDOWN format:
 
@@ -239,24 +257,21 @@ Create a financial model in MARKDOWN format:
 Use realistic numbers. Be conservative in estimates. Show sensitivity analysis.
 """
         
-        try:
-            response = self.ai.call_gemini(prompt)
-            return response
-        except Exception as e:
-            return f"Error generating financial model: {e}"
+        return self.ai.generate_content(prompt)
     
     def generate_funding_application(self, company: str, research: dict, funding: dict):
         """Generate pre-filled funding application draft"""
         print("[PROPOSAL] Generating Funding Application Draft...")
+        focus = DOCUMENT_FOCUS["funding_application"]
         
         prompt = f"""
 You are a grant writer preparing a funding application for {company}.
 
 COMPANY RESEARCH:
-{json.dumps(research, indent=2)[:2000]}
+{compact_for_prompt(research, 500, focus, "funding_application research")}
 
 FUNDING OPPORTUNITIES:
-{json.dumps(funding, indent=2)[:2000]}
+{compact_for_prompt(funding, 500, focus, "funding_application funding")}
 
 Select the BEST MATCH funding program and create an application draft in MARKDOWN:
 
@@ -324,17 +339,55 @@ Select the BEST MATCH funding program and create an application draft in MARKDOW
 Be specific and compelling. Use actual data from the research where possible.
 """
         
+        return self.ai.generate_content(prompt)
+
+
+def generate_documents_concurrently(tasks: dict, max_workers: int = 4, progress: ProgressTracker = None) -> dict:
+    """
+    Run independent document generators in parallel with partial-success semantics
+    
+    Args:
+        tasks: {document_key: zero-arg callable returning the document text}
+        max_workers: Max documents generated at once
+        progress: Optional tracker; each document counts as one LLM call
+    
+    Returns:
+        {document_key: {"content", "status", "duration_seconds", "error"}} in task order
+    """
+    progress = progress or ProgressTracker()
+    
+    def run(key, task):
+        started = time.monotonic()
         try:
-            response = self.ai.call_gemini(prompt)
-            return response
+            with progress.llm_call(key):
+                content = task()
+            status, error = "success", None
         except Exception as e:
-            return f"Error generating funding application: {e}"
+            label = SUITE_DOCUMENTS.get(key, key).lower()
+            content, status, error = f"Error generating {label}: {e}", "failed", str(e)
+        
+        duration = round(time.monotonic() - started, 2)
+        print(f"[PROPOSAL] {SUITE_DOCUMENTS.get(key, key)}: {status} in {duration:.1f}s")
+        return {"content": content, "status": status, "duration_seconds": duration, "error": error}
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="proposal") as pool:
+        futures = {key: pool.submit(run, key, task) for key, task in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
 
 
 def generate_full_proposal_suite(company_name: str, research_file: str = None, strategy_file: str = None, 
-                                  funding_file: str = None, save_to_file: bool = True):
+                                  funding_file: str = None, save_to_file: bool = True, max_workers: int = None,
+                                  research: dict = None, strategy: dict = None, funding: dict = None,
+                                  progress: ProgressTracker = None):
     """
     Generate complete proposal suite with all formats
+    
+    The four documents are independent LLM calls and are generated concurrently
+    (max_workers, default PROPOSAL_MAX_WORKERS or 4). A failed document doesn't
+    sink the others; per-document status and latency land in suite["documents"].
+    
+    research/strategy/funding may be passed in directly (the in-process
+    orchestrator does); only inputs left as None are loaded from .tmp files.
     """
     print(f"\n{'='*60}")
     print(f"PROPOSAL SUITE GENERATION: {company_name}")
@@ -344,48 +397,62 @@ def generate_full_proposal_suite(company_name: str, research_file: str = None, s
     base_path = os.path.dirname(__file__)
     
     # Load research
-    if not research_file:
-        research_file = os.path.join(base_path, f"../.tmp/research/{company_name.lower().replace(' ', '_')}_enhanced_research.json")
+    if research is None:
+        if not research_file:
+            research_file = os.path.join(base_path, f"../.tmp/research/{company_name.lower().replace(' ', '_')}_enhanced_research.json")
     
-    if os.path.exists(research_file):
-        with open(research_file, 'r') as f:
-            research = json.load(f)
-    else:
-        print(f"[WARN] No research file found at {research_file}")
-        research = {}
+        if os.path.exists(research_file):
+            with open(research_file, 'r') as f:
+                research = json.load(f)
+        else:
+            print(f"[WARN] No research file found at {research_file}")
+            research = {}
     
     # Load strategy
-    if not strategy_file:
-        strategy_file = os.path.join(base_path, f"../.tmp/strategy/{company_name.lower().replace(' ', '_')}_strategy.json")
+    if strategy is None:
+        if not strategy_file:
+            strategy_file = os.path.join(base_path, f"../.tmp/strategy/{company_name.lower().replace(' ', '_')}_strategy.json")
     
-    if os.path.exists(strategy_file):
-        with open(strategy_file, 'r') as f:
-            strategy = json.load(f)
-    else:
-        print(f"[WARN] No strategy file found at {strategy_file}")
-        strategy = {}
+        if os.path.exists(strategy_file):
+            with open(strategy_file, 'r') as f:
+                strategy = json.load(f)
+        else:
+            print(f"[WARN] No strategy file found at {strategy_file}")
+            strategy = {}
     
     # Load funding
-    if not funding_file:
-        funding_file = os.path.join(base_path, f"../.tmp/funding/{company_name.lower().replace(' ', '_')}_funding.json")
+    if funding is None:
+        if not funding_file:
+            funding_file = os.path.join(base_path, f"../.tmp/funding/{company_name.lower().replace(' ', '_')}_funding.json")
     
-    if os.path.exists(funding_file):
-        with open(funding_file, 'r') as f:
-            funding = json.load(f)
-    else:
-        print(f"[WARN] No funding file found at {funding_file}")
-        funding = {}
+        if os.path.exists(funding_file):
+            with open(funding_file, 'r') as f:
+                funding = json.load(f)
+        else:
+            print(f"[WARN] No funding file found at {funding_file}")
+            funding = {}
     
-    # Generate all proposals
+    # Generate all proposals concurrently
+    progress = progress or ProgressTracker()
     generator = ProposalSuiteGenerator()
+    max_workers = max_workers or int(os.getenv("PROPOSAL_MAX_WORKERS", 4))
+    
+    documents = generate_documents_concurrently({
+        "executive_summary": lambda: generator.generate_executive_summary(company_name, research, strategy, funding),
+        "technical_roadmap": lambda: generator.generate_technical_roadmap(company_name, research, strategy),
+        "financial_model": lambda: generator.generate_financial_model(company_name, strategy, funding),
+        "funding_application": lambda: generator.generate_funding_application(company_name, research, funding)
+    }, max_workers=max_workers, progress=progress)
     
     suite = {
         "company": company_name,
-        "generated_at": datetime.now().isoformat(),
-        "executive_summary": generator.generate_executive_summary(company_name, research, strategy, funding),
-        "technical_roadmap": generator.generate_technical_roadmap(company_name, research, strategy),
-        "financial_model": generator.generate_financial_model(company_name, strategy, funding),
-        "funding_application": generator.generate_funding_application(company_name, research, funding)
+        "generated_at": datetime.now().isoformat()
+    }
+    for key, document in documents.items():
+        suite[key] = document["content"]
+    suite["documents"] = {
+        key: {k: v for k, v in document.items() if k != "content"}
+        for key, document in documents.items()
     }
     
     # Save each format separately
@@ -396,34 +463,25 @@ def generate_full_proposal_suite(company_name: str, research_file: str = None, s
         date_str = datetime.now().strftime("%Y-%m-%d")
         company_slug = company_name.lower().replace(' ', '_')
         
-        # Save Executive Summary
-        exec_path = os.path.join(output_dir, f"{company_slug}_executive_summary_{date_str}.md")
-        with open(exec_path, 'w', encoding='utf-8') as f:
-            f.write(suite["executive_summary"])
-        print(f"[SAVED] Executive Summary: {exec_path}")
-        
-        # Save Technical Roadmap
-        tech_path = os.path.join(output_dir, f"{company_slug}_technical_roadmap_{date_str}.md")
-        with open(tech_path, 'w', encoding='utf-8') as f:
-            f.write(suite["technical_roadmap"])
-        print(f"[SAVED] Technical Roadmap: {tech_path}")
-        
-        # Save Financial Model
-        fin_path = os.path.join(output_dir, f"{company_slug}_financial_model_{date_str}.md")
-        with open(fin_path, 'w', encoding='utf-8') as f:
-            f.write(suite["financial_model"])
-        print(f"[SAVED] Financial Model: {fin_path}")
-        
-        # Save Funding Application
-        fund_path = os.path.join(output_dir, f"{company_slug}_funding_application_{date_str}.md")
-        with open(fund_path, 'w', encoding='utf-8') as f:
-            f.write(suite["funding_application"])
-        print(f"[SAVED] Funding Application: {fund_path}")
+        # Save each successfully generated document
+        for key, label in SUITE_DOCUMENTS.items():
+            if suite["documents"][key]["status"] != "success":
+                print(f"[FAILED] {label}: {suite['documents'][key]['error']}")
+                continue
+            
+            doc_path = os.path.join(output_dir, f"{company_slug}_{key}_{date_str}.md")
+            with open(doc_path, 'w', encoding='utf-8') as f:
+                f.write(suite[key])
+            progress.wrote(doc_path, len(suite[key].encode('utf-8')))
+            suite["documents"][key]["file"] = os.path.abspath(doc_path)
+            print(f"[SAVED] {label}: {doc_path}")
         
         # Save complete suite as JSON
         suite_path = os.path.join(output_dir, f"{company_slug}_complete_suite_{date_str}.json")
+        payload = json.dumps(suite, indent=2)
         with open(suite_path, 'w', encoding='utf-8') as f:
-            json.dump(suite, f, indent=2)
+            f.write(payload)
+        progress.wrote(suite_path, len(payload.encode('utf-8')))
         print(f"[SAVED] Complete Suite: {suite_path}")
     
     return suite
@@ -438,11 +496,11 @@ if __name__ == "__main__":
         print("\n" + "="*60)
         print("PROPOSAL SUITE COMPLETE")
         print("="*60)
-        print("\n4 stakeholder-specific documents generated:")
-        print("  ✓ Executive Summary (C-Suite)")
-        print("  ✓ Technical Roadmap (IT/Engineering)")
-        print("  ✓ Financial Model (CFO)")
-        print("  ✓ Funding Application (Grant Writer)")
+        print("\nStakeholder-specific documents:")
+        for key, label in SUITE_DOCUMENTS.items():
+            status = suite["documents"][key]
+            mark = "✓" if status["status"] == "success" else "✗"
+            print(f"  {mark} {label} ({status['duration_seconds']:.1f}s)")
         print("\n" + "="*60)
         
     else:
@@ -6,43 +6,215 @@ Uses Gemini to analyze research and propose automation opportunities
 import sys
 import os
 import json
+import time
 from datetime import datetime
+from typing import Callable, Iterator
 
 # Add project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 import requests
 
+from core.lib.api_client import get_session
+from core.lib.circuit_breaker import get_circuit_breaker
+from core.lib.json_stream import IncrementalJSONParser
+from core.lib.llm_cache import get_llm_cache
+from core.lib.prompt_compactor import compact_for_prompt
+from core.lib.progress import ProgressTracker
+from core.lib.retry import DEFAULT_RETRY_POLICY
+
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+GEMINI_BASE_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}"
+# (connect, read) seconds; the read timeout applies between streamed chunks, not to the whole generation
+GEMINI_TIMEOUT = (10, 120)
+
+# Research facts the strategy instructions look for, used to rank them during compaction
+STRATEGY_FOCUS = ("hiring manual data entry support roles tech stack legacy systems tools "
+                  "growth scaling challenges pain points automation")
+RESEARCH_TOKEN_BUDGET = 1500
+
 class SimpleGemini:
-    def __init__(self):
+    def __init__(self, progress: ProgressTracker = None):
+        self.progress = progress or ProgressTracker()
         self.api_key = os.getenv("GEMINI_API_KEY")
-        self.url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent?key={self.api_key}"
+        self.url = f"{GEMINI_BASE_URL}:generateContent?key={self.api_key}"
+        self.stream_url = f"{GEMINI_BASE_URL}:streamGenerateContent?alt=sse&key={self.api_key}"
+        self.session = get_session(GEMINI_BASE_URL)
+        self.llm_cache = get_llm_cache()
+        # Same breaker as research_enhanced, so an outage seen there short-circuits here too
+        self.breaker = get_circuit_breaker("generativelanguage.googleapis.com")
+        self.retry_policy = DEFAULT_RETRY_POLICY
+        
+    def generate_content(self, prompt) -> str:
+        """
+        Generate a full response in one request (served from the LLM cache when seen before)
+        
+        Raises:
+            RuntimeError: Circuit open, HTTP error, unexpected or empty response
+        """
+        cached = self.llm_cache.get(prompt, GEMINI_MODEL)
+        if cached is not None:
+            return cached
         
-    def generate_content(self, prompt):
         payload = {
             "contents": [{
                 "parts": [{"text": prompt}]
             }]
         }
+        with self.progress.llm_call("strategy"):
+            response = self._post(self.url, payload)
+        
         try:
-            response = requests.post(self.url, json=payload, headers={'Content-Type': 'application/json'})
-            if response.status_code != 200:
-                return f"Error: {response.text}"
+            text = response.json()['candidates'][0]['content']['parts'][0]['text']
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise RuntimeError(f"Unexpected Gemini response: {e}") from e
+        if not text or not text.strip():
+            raise RuntimeError("Gemini returned an empty response")
+        
+        self.llm_cache.set(prompt, GEMINI_MODEL, text)
+        return text
+    
+    def _post(self, url: str, payload: dict, stream: bool = False) -> requests.Response:
+        """
+        POST to Gemini through the circuit breaker and retry policy
+        
+        Generation has no side effects, so the POST is resent like an idempotent
+        request; with stream=True retries stop once a 200 response starts streaming.
+        
+        Returns:
+            The 200 response
+        
+        Raises:
+            RuntimeError: Circuit open, or no 200 response once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            if not self.breaker.allow_request():
+                raise RuntimeError("Gemini circuit open, skipping call")
+            
+            try:
+                response = self.session.post(url, json=payload, stream=stream, timeout=GEMINI_TIMEOUT,
+                                             headers={'Content-Type': 'application/json'})
+            except requests.exceptions.RequestException as e:
+                self.breaker.record_failure()
+                if self.retry_policy.should_retry(attempt, idempotent=True):
+                    time.sleep(self.retry_policy.delay(attempt))
+                    attempt += 1
+                    continue
+                raise RuntimeError(f"Error calling Gemini: {e}") from e
+            
+            # 5xx means the provider is unhealthy; 4xx (incl. 429) means it is up and answering
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            
+            if response.status_code == 200:
+                return response
             
-            data = response.json()
-            return data['candidates'][0]['content']['parts'][0]['text']
-        except Exception as e:
-            return f"Error calling Gemini: {e}"
+            retry_after = response.headers.get("Retry-After")
+            body = response.text
+            response.close()
+            if self.retry_policy.should_retry(attempt, idempotent=True, status=response.status_code):
+                time.sleep(self.retry_policy.delay(attempt, retry_after))
+                attempt += 1
+                continue
+            raise RuntimeError(f"Gemini error {response.status_code}: {body[:300]}")
+    
+    def stream_content(self, prompt, on_complete: Callable[[str], None] = None) -> Iterator[str]:
+        """
+        Yield the response text as Gemini generates it (server-sent events)
+        
+        A cached response is yielded in one piece. Failures raise instead of
+        yielding error text, so they can never be parsed as the answer; a stream
+        that breaks after text was yielded is not retried.
+        
+        Nothing is cached here: a stream can end cleanly and still hold a
+        truncated document. When the stream is consumed to the end, produced
+        text and had no malformed frames, the full text is handed to
+        on_complete; the consumer caches it once the text has parsed.
+        
+        Raises:
+            RuntimeError: Circuit open, HTTP error, broken stream or empty response
+        """
+        cached = self.llm_cache.get(prompt, GEMINI_MODEL)
+        if cached is not None:
+            yield cached
+            return
+        
+        payload = {
+            "contents": [{
+                "parts": [{"text": prompt}]
+            }]
+        }
+        parts, malformed = [], 0
+        with self.progress.llm_call("strategy"):
+            response = self._post(self.stream_url, payload, stream=True)
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    try:
+                        event = json.loads(line[5:])
+                    except ValueError:
+                        malformed += 1
+                        print(f"[WARN] Skipping malformed Gemini stream frame: {line[:80]!r}")
+                        continue
+                    for candidate in event.get("candidates", [])[:1]:
+                        for part in candidate.get("content", {}).get("parts", []):
+                            if part.get("text"):
+                                parts.append(part["text"])
+                                yield part["text"]
+            except requests.exceptions.RequestException as e:
+                self.breaker.record_failure()
+                raise RuntimeError(f"Gemini stream interrupted: {e}") from e
+            finally:
+                response.close()
+        
+        text = "".join(parts)
+        if not text.strip():
+            raise RuntimeError("Gemini returned an empty response")
+        if not malformed and on_complete:
+            on_complete(text)
 
 
+def parse_strategy_stream(chunks, on_opportunity: Callable[[dict], None] = None) -> dict:
+    """
+    Parse a streamed strategy response incrementally
+    
+    Each opportunity is handed to on_opportunity as soon as its object closes.
+    Malformed output stops consumption at the offending chunk (closing the
+    stream) and falls back to {"raw_response": ...} like a failed full parse.
+    Errors raised by the stream itself (no response at all) propagate.
+    """
+    parser = IncrementalJSONParser(arrays=["opportunities"])
+    try:
+        for chunk in chunks:
+            for _, opportunity in parser.feed(chunk):
+                if on_opportunity:
+                    on_opportunity(opportunity)
+        return parser.close()
+    except ValueError as e:
+        print(f"Error parsing Gemini response: {e}")
+        return {"raw_response": parser.text}
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
 
-def generate_strategy(company_name: str, research_data: dict, save_to_file: bool = True):
+def generate_strategy(company_name: str, research_data: dict, save_to_file: bool = True,
+                      progress: ProgressTracker = None, on_opportunity: Callable[[dict], None] = None):
     """
     Generate strategic automation opportunities based on research
+    
+    The Gemini response is streamed and parsed as it arrives: every completed
+    opportunity is printed, emitted as a "strategy_opportunity" progress
+    event and passed to on_opportunity before the rest is generated.
     """
     print(f"[LOGIC] Generating strategy for: {company_name}")
     
-    client = SimpleGemini()
+    progress = progress or ProgressTracker()
+    client = SimpleGemini(progress=progress)
     
     # Construct Consultant Prompt
     prompt = f"""
@@ -56,7 +228,7 @@ def generate_strategy(company_name: str, research_data: dict, save_to_file: bool
     4. Content Pipelines (automated social media, video generation)
     
     RESEARCH DATA:
-    {json.dumps(research_data, indent=2)}
+    {compact_for_prompt(research_data, RESEARCH_TOKEN_BUDGET, STRATEGY_FOCUS, "strategy research")}
     
     INSTRUCTIONS:
     1. Scan 'hiring_signals' for manual labor (e.g. data entry -> n8n automation).
@@ -83,16 +255,21 @@ def generate_strategy(company_name: str, research_data: dict, save_to_file: bool
     """
     
     print("...querying Gemini")
-    response = client.generate_content(prompt)
+    found = []
     
-    # Parse JSON from response
-    try:
-        # Strip markdown code blocks if present // TODO: Move to util
-        clean_json = response.replace("```json", "").replace("```", "").strip()
-        strategy = json.loads(clean_json)
-    except Exception as e:
-        print(f"Error parsing Gemini response: {e}")
-        strategy = {"raw_response": response}
+    def handle_opportunity(opportunity):
+        found.append(opportunity)
+        print(f"   opportunity {len(found)}: {opportunity.get('title', 'Untitled')}")
+        progress.emit("strategy_opportunity", index=len(found), title=opportunity.get('title'))
+        if on_opportunity:
+            on_opportunity(opportunity)
+    
+    streamed = []
+    strategy = parse_strategy_stream(client.stream_content(prompt, on_complete=streamed.append), handle_opportunity)
+    
+    # Cache only a clean stream whose text also parsed as a complete document
+    if streamed and "raw_response" not in strategy:
+        client.llm_cache.set(prompt, GEMINI_MODEL, streamed[0])
         
     if save_to_file:
         output_dir = os.path.join(os.path.dirname(__file__), "../.tmp/strategy")
@@ -100,8 +277,10 @@ def generate_strategy(company_name: str, research_data: dict, save_to_file: bool
         filename = f"{company_name.lower().replace(' ', '_')}_strategy.json"
         filepath = os.path.join(output_dir, filename)
         
+        payload = json.dumps(strategy, indent=2)
         with open(filepath, 'w') as f:
-            json.dump(strategy, f, indent=2)
+            f.write(payload)
+        progress.wrote(filepath, len(payload.encode('utf-8')))
             
         print(f"[SUCCESS] Strategy saved to: {filepath}")
         
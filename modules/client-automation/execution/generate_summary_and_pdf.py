@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 Generate Visual Summary and PDF Report from Consultancy Data
-Uses WeasyPrint for professional PDF generation
+Uses WeasyPrint for professional PDF generation, with a warm Chromium pool as fallback
 """
 
 import json
@@ -11,14 +11,20 @@ from datetime import datetime
 from pathlib import Path
 import sys
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent))
+
+from core.lib.pdf_renderer import PDF_MAX_CONCURRENCY, get_pdf_renderer
+
+# Relative assets in the templates (logo) resolve against this when rendering from memory
+ASSET_BASE_URL = (Path(__file__).parent.parent / "templates").resolve().as_uri() + "/"
 
 
 def load_json_data(filepath):
@@ -238,102 +244,75 @@ def generate_visual_summary(company_name, output_dir="../outputs"):
     return output_file, html_content
 
 
-def generate_pdf(html_content, company_name, output_dir="../outputs"):
-    """Generate PDF from HTML using WeasyPrint"""
+def generate_pdf(html_content, company_name, output_dir="../outputs", engine=None):
+    """Generate PDF from in-memory HTML with the shared renderer (WeasyPrint, then warm Chromium)"""
     
-    try:
-        from weasyprint import HTML, CSS
-        
-        output_path = Path(__file__).parent / ".." / output_dir
-        output_file = output_path / f"{company_name}_Consultancy_Report.pdf"
-        
-        # Generate PDF
-        HTML(string=html_content).write_pdf(output_file)
-        
-        print(f"✓ PDF report generated: {output_file}")
-        return output_file
-        
-    except ImportError:
-        print("⚠ WeasyPrint not installed. Trying playwright...")
-        return generate_pdf_playwright(html_content, company_name, output_dir)
-    except Exception as e:
-        print(f"⚠ WeasyPrint failed: {e}")
-        print("  Trying playwright as fallback...")
-        return generate_pdf_playwright(html_content, company_name, output_dir)
-
-
-def generate_pdf_playwright(html_content, company_name, output_dir="../outputs"):
-    """Generate PDF using Playwright as fallback"""
+    output_file = Path(__file__).parent / ".." / output_dir / f"{company_name}_Consultancy_Report.pdf"
+    renderer = get_pdf_renderer()
     
     try:
-        from playwright.sync_api import sync_playwright
-        
-        output_path = Path(__file__).parent / ".." / output_dir
-        output_file = output_path / f"{company_name}_Consultancy_Report.pdf"
-        
-        # Create temporary HTML file
-        temp_html = output_path / f"_temp_{company_name}.html"
-        with open(temp_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Generate PDF with Playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
-            page.goto(f'file:///{temp_html.absolute()}')
-            page.pdf(path=str(output_file), format='A4', print_background=True)
-            browser.close()
-        
-        # Clean up temp file
-        temp_html.unlink()
-        
-        print(f"✓ PDF report generated (playwright): {output_file}")
-        return output_file
-        
-    except ImportError:
-        print("⚠ Playwright not installed. PDF generation requires either:")
+        renderer.render_to_file(html_content, output_file, base_url=ASSET_BASE_URL, engine=engine)
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        print("  PDF generation requires either:")
         print("  pip install weasyprint")
         print("  OR")
         print("  pip install playwright && playwright install chromium")
         return None
-    except Exception as e:
-        print(f"✗ PDF generation failed: {e}")
+    
+    print(f"✓ PDF report generated ({renderer.last_engine}): {output_file}")
+    return output_file
+
+
+def generate_pdf_playwright(html_content, company_name, output_dir="../outputs"):
+    """Generate PDF on the warm Chromium pool only"""
+    return generate_pdf(html_content, company_name, output_dir, engine="playwright")
+
+
+def generate_report(company_name):
+    """Visual summary and PDF for one company; returns (html_file, pdf_file) or None"""
+    result = generate_visual_summary(company_name)
+    if not result:
+        print(f"✗ Failed to generate visual summary for {company_name}")
         return None
+    
+    html_file, html_content = result
+    return html_file, generate_pdf(html_content, company_name)
 
 
 def main():
     """Main execution"""
     if len(sys.argv) < 2:
-        print("Usage: python generate_summary_and_pdf.py <company_name>")
+        print("Usage: python generate_summary_and_pdf.py <company_name> [<company_name> ...]")
         print("Example: python generate_summary_and_pdf.py eldorado111")
         sys.exit(1)
     
-    company_name = sys.argv[1]
+    company_names = sys.argv[1:]
     
     print("\n" + "="*60)
     print("CONSULTANCY SUMMARY & PDF GENERATOR")
     print("="*60)
-    print(f"Company: {company_name}")
+    print(f"Company: {', '.join(company_names)}")
     print()
     
-    # Generate visual summary
-    result = generate_visual_summary(company_name)
-    if not result:
-        print("✗ Failed to generate visual summary")
-        sys.exit(1)
-    
-    html_file, html_content = result
+    # One warm renderer serves every report; up to PDF_MAX_CONCURRENCY render at once
+    with ThreadPoolExecutor(max_workers=min(PDF_MAX_CONCURRENCY, len(company_names))) as pool:
+        results = list(pool.map(generate_report, company_names))
     
-    # Generate PDF
-    pdf_file = generate_pdf(html_content, company_name)
+    if not any(results):
+        sys.exit(1)
     
     print()
     print("="*60)
     print("GENERATION COMPLETE")
     print("="*60)
-    print(f"Visual Summary: {html_file}")
-    if pdf_file:
-        print(f"PDF Report: {pdf_file}")
+    for result in results:
+        if not result:
+            continue
+        html_file, pdf_file = result
+        print(f"Visual Summary: {html_file}")
+        if pdf_file:
+            print(f"PDF Report: {pdf_file}")
     print()
     print("Next steps:")
     print("  1. Open the visual summary in a browser")
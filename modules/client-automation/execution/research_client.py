@@ -12,6 +12,7 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 from modules.mcp_integrations.execution.brave_search_connector import BraveSearchMCP
+from core.lib.scraper import get_scraper
 
 def research_prospect(company_name: str, save_to_file: bool = True):
     """
@@ -33,21 +34,13 @@ def research_prospect(company_name: str, save_to_file: bool = True):
             
         print(f"...reading {url}")
         
-        # Simple scraping (using widespread libraries or built-in tools logic simulation)
-        # Using requests directly here as we are in a script
-        import requests
-        from bs4 import BeautifulSoup
+        # Homepage plus key pages (about, pricing, careers); repeat scrapes revalidate from the page cache
+        site = get_scraper().crawl(url)
         
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        resp = requests.get(url, headers=headers, timeout=10)
-        
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            # Get text from paragraphs and headers
-            text_content = ' '.join([p.get_text() for p in soup.find_all(['p', 'h1', 'h2', 'h3'])])
-            overview = f"WEBSITE CONTENT ({url}):\n{text_content[:4000]}..." # Truncate to avoid token limits
+        if site:
+            overview = f"WEBSITE CONTENT ({site['url']}):\n{site['content']}"
         else:
-            overview = f"Could not scrape {url} (Status {resp.status_code}). Fallback to search overview."
+            overview = f"Could not scrape {url}. Fallback to search overview."
             overview += str(mcp.research_company(company_name))
             
     except Exception as e:
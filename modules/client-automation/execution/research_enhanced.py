@@ -7,6 +7,7 @@ import sys
 import os
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import google.generativeai as genai
 from dotenv import load_dotenv
 
@@ -16,29 +17,73 @@ load_dotenv()
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 from modules.mcp_integrations.execution.brave_search_connector import BraveSearchMCP
+from core.lib.circuit_breaker import get_circuit_breaker
+from core.lib.llm_cache import get_llm_cache
+from core.lib.progress import ProgressTracker
+from core.lib.scraper import get_scraper
+
+GEMINI_MODEL = 'gemini-2.0-flash-exp'
 
 
 class EnhancedResearcher:
     """Comprehensive multi-dimensional research"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = None, progress: ProgressTracker = None):
         self.mcp = BraveSearchMCP()
+        self.progress = progress or ProgressTracker()
+        # Bounded pool for independent search queries (RESEARCH_MAX_WORKERS=1 runs them serially)
+        self.max_workers = max_workers or int(os.getenv("RESEARCH_MAX_WORKERS", 8))
+        self._query_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="research-query")
         # Configure Gemini
         genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        self.ai_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.ai_model = genai.GenerativeModel(GEMINI_MODEL)
+        self.gemini_breaker = get_circuit_breaker("generativelanguage.googleapis.com")
+        self.llm_cache = get_llm_cache()
+        self.scraper = get_scraper()
+    
+    def close(self):
+        """Shut down the query pool"""
+        self._query_pool.shutdown(wait=True)
+    
+    def _search_many(self, queries: list, num_results: int = 2, label: str = "Search") -> list:
+        """Run independent searches concurrently; results come back in query order"""
+        def run(query):
+            try:
+                return self.mcp.search(query, num_results=num_results)
+            except Exception as e:
+                print(f"[WARN] {label} search failed: {e}")
+                return []
+            finally:
+                self.progress.query_done(label)
+        
+        self.progress.add_queries(len(queries), label)
+        return list(self._query_pool.map(run, queries))
     
     def call_gemini(self, prompt: str) -> str:
-        """Call Gemini API"""
+        """Call Gemini API (served from the LLM cache when the prompt was seen before)"""
+        cached = self.llm_cache.get(prompt, GEMINI_MODEL)
+        if cached is not None:
+            return cached
+        
+        if not self.gemini_breaker.allow_request():
+            print("[WARN] Gemini circuit open, skipping call")
+            return "{}"
+        
         try:
-            response = self.ai_model.generate_content(prompt)
+            with self.progress.llm_call("research"):
+                response = self.ai_model.generate_content(prompt)
+            self.gemini_breaker.record_success()
+            self.llm_cache.set(prompt, GEMINI_MODEL, response.text)
             return response.text
         except Exception as e:
+            self.gemini_breaker.record_failure()
             print(f"[ERROR] Gemini API call failed: {e}")
             return "{}"
     
     def research_company_overview(self, company_name: str, url: str = None):
-        """Deep dive into company overview"""
+        """Deep dive into company overview (homepage plus about/pricing/services/careers pages)"""
         print(f"[RESEARCH] Company Overview: {company_name}")
+        pages = []
         
         try:
             # Try to scrape website
@@ -51,16 +96,11 @@ class EnhancedResearcher:
             
             if url:
                 print(f"...scraping {url}")
-                import requests
-                from bs4 import BeautifulSoup
+                site = self.scraper.crawl(url)
                 
-                headers = {'User-Agent': 'Mozilla/5.0'}
-                resp = requests.get(url, headers=headers, timeout=10)
-                
-                if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, 'html.parser')
-                    text_content = ' '.join([p.get_text() for p in soup.find_all(['p', 'h1', 'h2', 'h3', 'li'])])
-                    overview = text_content[:5000]
+                if site:
+                    pages = [{key: page[key] for key in ("kind", "url", "source")} for page in site["pages"]]
+                    overview = site["content"]
                 else:
                     overview = str(self.mcp.research_company(company_name))
             else:
@@ -73,6 +113,7 @@ class EnhancedResearcher:
         return {
             "url": url,
             "content": overview,
+            "pages": pages,
             "scraped_at": datetime.now().isoformat()
         }
     
@@ -89,18 +130,14 @@ class EnhancedResearcher:
         ]
         
         signals = []
-        for query in queries:
-            try:
-                results = self.mcp.search(query, num_results=2)
-                for result in results:
-                    signals.append({
-                        "signal_type": query.split()[1],  # revenue, funding, employee, etc.
-                        "title": result.get('title'),
-                        "description": result.get('description'),
-                        "url": result.get('url')
-                    })
-            except Exception as e:
-                print(f"[WARN] Financial search failed: {e}")
+        for query, results in zip(queries, self._search_many(queries, label="Financial")):
+            for result in results:
+                signals.append({
+                    "signal_type": query.split()[1],  # revenue, funding, employee, etc.
+                    "title": result.get('title'),
+                    "description": result.get('description'),
+                    "url": result.get('url')
+                })
         
         return signals
     
@@ -134,24 +171,23 @@ Only include real company names, not generic descriptions.
             clean_json = response.replace("```json", "").replace("```", "").strip()
             competitor_list = json.loads(clean_json).get("competitors", [])
             
-            # Research each competitor's automation maturity
-            competitor_analysis = []
-            for comp in competitor_list[:3]:  # Top 3 only
-                comp_queries = [
+            # Research each competitor's automation maturity (all queries fanned out at once)
+            top_competitors = competitor_list[:3]  # Top 3 only
+            comp_queries = [
+                (comp, query)
+                for comp in top_competitors
+                for query in [
                     f"{comp} AI automation technology stack",
                     f"{comp} digital transformation strategy"
                 ]
-                
-                comp_data = {"name": comp, "automation_signals": []}
-                for query in comp_queries:
-                    try:
-                        comp_results = self.mcp.search(query, num_results=2)
-                        for result in comp_results:
-                            comp_data["automation_signals"].append(result.get('title'))
-                    except:
-                        pass
-                
-                competitor_analysis.append(comp_data)
+            ]
+            comp_results = self._search_many([query for _, query in comp_queries], label="Competitor")
+            
+            competitor_analysis = [{"name": comp, "automation_signals": []} for comp in top_competitors]
+            by_name = {data["name"]: data for data in competitor_analysis}
+            for (comp, _), results in zip(comp_queries, comp_results):
+                for result in results:
+                    by_name[comp]["automation_signals"].append(result.get('title'))
             
             return competitor_analysis
             
@@ -171,17 +207,13 @@ Only include real company names, not generic descriptions.
         ]
         
         trends = []
-        for query in queries:
-            try:
-                results = self.mcp.search(query, num_results=2)
-                for result in results:
-                    trends.append({
-                        "title": result.get('title'),
-                        "description": result.get('description'),
-                        "url": result.get('url')
-                    })
-            except Exception as e:
-                print(f"[WARN] Trend search failed: {e}")
+        for results in self._search_many(queries, label="Trend"):
+            for result in results:
+                trends.append({
+                    "title": result.get('title'),
+                    "description": result.get('description'),
+                    "url": result.get('url')
+                })
         
         return trends
     
@@ -198,18 +230,14 @@ Only include real company names, not generic descriptions.
         ]
         
         signals = []
-        for query in hiring_queries:
-            try:
-                results = self.mcp.search(query, num_results=2)
-                for result in results:
-                    signals.append({
-                        "title": result.get('title'),
-                        "description": result.get('description'),
-                        "url": result.get('url'),
-                        "automation_potential": "High"  # These roles are highly automatable
-                    })
-            except Exception as e:
-                print(f"[WARN] Hiring search failed: {e}")
+        for results in self._search_many(hiring_queries, label="Hiring"):
+            for result in results:
+                signals.append({
+                    "title": result.get('title'),
+                    "description": result.get('description'),
+                    "url": result.get('url'),
+                    "automation_potential": "High"  # These roles are highly automatable
+                })
         
         return signals
     
@@ -247,30 +275,46 @@ Be specific and actionable. Reference actual data from the research.
             return {"error": str(e)}
 
 
-def conduct_full_research(company_name: str, industry: str = None, url: str = None, save_to_file: bool = True):
+def conduct_full_research(company_name: str, industry: str = None, url: str = None, save_to_file: bool = True,
+                          max_workers: int = None, progress: ProgressTracker = None):
     """
     Conduct comprehensive multi-dimensional research
+    
+    Independent dimensions run concurrently and each fans out its own search
+    queries; results are merged in a fixed order so output is deterministic.
+    Query and LLM progress is reported to the optional ProgressTracker.
     """
+    progress = progress or ProgressTracker()
     print(f"\n{'='*60}")
     print(f"ENHANCED RESEARCH: {company_name}")
     print(f"{'='*60}\n")
     
-    researcher = EnhancedResearcher()
+    researcher = EnhancedResearcher(max_workers=max_workers, progress=progress)
     
-    # Gather all dimensions
-    research_data = {
-        "company": company_name,
-        "industry": industry,
-        "timestamp": datetime.now().isoformat(),
-        "overview": researcher.research_company_overview(company_name, url),
-        "financial_signals": researcher.research_financial_signals(company_name),
-        "competitors": researcher.research_competitors(company_name, industry),
-        "industry_trends": researcher.research_industry_trends(industry or "technology"),
-        "hiring_signals": researcher.research_hiring_signals(company_name)
-    }
-    
-    # Synthesize insights
-    research_data["insights"] = researcher.synthesize_insights(research_data)
+    try:
+        # Gather all dimensions concurrently
+        with ThreadPoolExecutor(max_workers=5, thread_name_prefix="research-dimension") as pool:
+            overview = pool.submit(researcher.research_company_overview, company_name, url)
+            financial = pool.submit(researcher.research_financial_signals, company_name)
+            competitors = pool.submit(researcher.research_competitors, company_name, industry)
+            trends = pool.submit(researcher.research_industry_trends, industry or "technology")
+            hiring = pool.submit(researcher.research_hiring_signals, company_name)
+            
+            research_data = {
+                "company": company_name,
+                "industry": industry,
+                "timestamp": datetime.now().isoformat(),
+                "overview": overview.result(),
+                "financial_signals": financial.result(),
+                "competitors": competitors.result(),
+                "industry_trends": trends.result(),
+                "hiring_signals": hiring.result()
+            }
+        
+        # Synthesize insights
+        research_data["insights"] = researcher.synthesize_insights(research_data)
+    finally:
+        researcher.close()
     
     # Save results
     if save_to_file:
@@ -279,8 +323,10 @@ def conduct_full_research(company_name: str, industry: str = None, url: str = No
         filename = f"{company_name.lower().replace(' ', '_')}_enhanced_research.json"
         filepath = os.path.join(output_dir, filename)
         
+        payload = json.dumps(research_data, indent=2)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(research_data, f, indent=2)
+            f.write(payload)
+        progress.wrote(filepath, len(payload.encode('utf-8')))
         
         print(f"\n[SUCCESS] Enhanced research saved to: {filepath}")
     
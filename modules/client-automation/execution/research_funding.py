@@ -10,46 +10,35 @@ from datetime import datetime
 
 # Add project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+# Sibling modules, also when imported as modules.client-automation.execution.research_funding
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from modules.mcp_integrations.execution.brave_search_connector import BraveSearchMCP
+from core.lib.progress import ProgressTracker
+from funding_kb import get_funding_kb
 
 
 class FundingResearcher:
     """Research funding opportunities for clients"""
     
-    def __init__(self):
-        self.mcp = BraveSearchMCP()
-        
-        # Funding databases to check
-        self.funding_sources = {
-            "canada_federal": [
-                "IRAP (Industrial Research Assistance Program)",
-                "SR&ED Tax Credit",
-                "CanExport Innovation",
-                "Canada Digital Adoption Program (CDAP)"
-            ],
-            "canada_provincial": [
-                "Ontario Digital Main Street",
-                "Quebec C2AI Program", 
-                "BC Tech Fund",
-                "Alberta Innovates"
-            ],
-            "usa_federal": [
-                "SBIR/STTR Grants",
-                "Economic Development Administration (EDA)",
-                "Manufacturing Extension Partnership (MEP)"
-            ],
-            "industry_specific": [
-                "Clean Tech Fund",
-                "AgTech Innovation Fund",
-                "Healthcare IT Modernization Grants"
-            ]
-        }
+    # Result section per knowledge base category, with how many programs to keep
+    SECTIONS = [
+        ("grant", "opportunities", "Grant", 6),
+        ("tax", "tax_incentives", "Tax", 4),
+        ("quick_win", "quick_wins", "Quick win", 4)
+    ]
+    
+    def __init__(self, progress: ProgressTracker = None):
+        self.progress = progress or ProgressTracker()
+        # Funding programs to check (catalogue, index and live evidence live in funding_kb)
+        self.kb = get_funding_kb()
     
     def research_funding(self, company_name: str, industry: str = None, location: str = None):
         """
         Find funding opportunities for a specific company
         
+        Programs are matched against the local knowledge base in-process;
+        only matches whose live evidence is stale are searched on the web.
+        
         Args:
             company_name: Name of the company
             industry: Industry sector (optional, helps narrow results)
@@ -67,135 +56,144 @@ class FundingResearcher:
             "quick_wins": []
         }
         
-        # 1. Search for active grants
-        print("...searching federal grants")
-        grant_queries = [
-            f"Canada federal grants {industry or 'technology'} automation AI 2024 2025",
-            f"IRAP funding eligibility {industry or 'small business'} automation",
-            f"SR&ED tax credit {industry or 'software development'} eligibility",
-            f"CDAP digital adoption program boost grant automation"
-        ]
-        
-        if location and "USA" in location.upper():
-            grant_queries.extend([
-                f"USA federal grants {industry or 'technology'} automation AI 2024",
-                f"SBIR STTR grants {industry or 'small business'} automation eligibility"
-            ])
-        
-        for query in grant_queries:
-            try:
-                search_results = self.mcp.search(query, num_results=3)
-                for result in search_results:
-                    results["opportunities"].append({
-                        "title": result.get('title'),
-                        "description": result.get('description'),
-                        "url": result.get('url'),
-                        "source": query.split()[0]
-                    })
-            except Exception as e:
-                print(f"[WARN] Grant search failed for '{query}': {e}")
-        
-        # 2. Tax Incentives Research
-        print("...researching tax incentives")
-        tax_queries = [
-            f"SR&ED tax credit software development {location or 'Canada'} 2024",
-            f"R&D tax incentives {industry or 'technology'} {location or 'North America'}",
-            f"automation investment tax credits {location or 'Canada'} eligibility"
-        ]
-        
-        for query in tax_queries:
-            try:
-                search_results = self.mcp.search(query, num_results=2)
-                for result in search_results:
-                    results["tax_incentives"].append({
-                        "title": result.get('title'),
-                        "description": result.get('description'),
-                        "url": result.get('url')
-                    })
-            except Exception as e:
-                print(f"[WARN] Tax search failed: {e}")
-        
-        # 3. Quick Win Programs (immediate eligibility)
-        print("...finding quick-win programs")
-        quick_win_queries = [
-            "CDAP Boost Your Business Technology grant application 2025",
-            "Digital Main Street Ontario small business grant",
-            "Google for Startups Canada funding",
-            f"{industry or 'small business'} innovation voucher program {location or 'Canada'}"
-        ]
-        
-        for query in quick_win_queries:
-            try:
-                search_results = self.mcp.search(query, num_results=2)
-                for result in search_results:
-                    results["quick_wins"].append({
-                        "title": result.get('title'),
-                        "description": result.get('description'),
-                        "url": result.get('url'),
-                        "type": "Quick Win"
-                    })
-            except Exception as e:
-                print(f"[WARN] Quick win search failed: {e}")
+        # 1. Match programs against the company profile
+        print("...matching funding knowledge base")
+        profile = (f"{industry or 'technology small business'} {location or 'Canada'} "
+                   "automation AI digital adoption innovation research development")
+        matches = {
+            category: self.kb.search(profile, category=category, location=location, industry=industry, top_k=limit)
+            for category, _, _, limit in self.SECTIONS
+        }
+        
+        # 2. Live search fallback for matches with stale evidence
+        stale = [match["id"] for found in matches.values() for match in found if match["stale"]]
+        if stale:
+            print(f"...refreshing {len(stale)} stale programs")
+            self.progress.add_queries(len(stale), "Funding")
+            self.kb.refresh(stale, on_done=lambda pid: self.progress.query_done("Funding"))
+        
+        # 3. Build result sections (evidence re-read so refreshed snippets are included)
+        for category, key, label, _ in self.SECTIONS:
+            for match in matches[category]:
+                evidence = (self.kb.evidence.get(match["id"]) or {}).get("results", [])
+                entry = {
+                    "title": match["name"],
+                    "description": match["description"],
+                    "url": match["url"] or next((r["url"] for r in evidence if r.get("url")), None),
+                    "source": match["agency"],
+                    "program_id": match["id"],
+                    "eligibility": match["eligibility"],
+                    "amount": match["amount"],
+                    "relevance": match["score"],
+                    "evidence": evidence[:2]
+                }
+                if category == "quick_win":
+                    entry["type"] = "Quick Win"
+                results[key].append(entry)
+        
+        results["knowledge_base"] = {
+            "programs": len(self.kb.programs),
+            "matched": sum(len(found) for found in matches.values()),
+            "refreshed": len(stale)
+        }
         
         return results
     
-    def analyze_eligibility(self, company_data: dict, funding_data: dict):
+    def analyze_eligibility(self, company_data: dict, funding_data: dict = None, llm_review: int = 0):
         """
         Analyze which funding programs the company is likely eligible for
-        Uses AI to match company profile to funding criteria
+        
+        Programs are scored with the feature-based EligibilityScorer (industry,
+        region, size, R&D intensity); only the top `llm_review` matches are sent
+        to the LLM for a written review.
+        
+        Args:
+            company_data: company, industry, location and optionally employees, revenue, rd_intensity
+            funding_data: research_funding results; when given, only the programs it found are scored
+            llm_review: Number of top matches to review with Gemini (0 skips the LLM)
         """
         print("[FUNDING] Analyzing eligibility...")
         
-        from core.lib.api_client import APIClient
+        from funding_eligibility import EligibilityScorer
+        
+        programs = None
+        if funding_data:
+            found = {
+                entry.get("program_id")
+                for key in ("opportunities", "tax_incentives", "quick_wins")
+                for entry in funding_data.get(key, [])
+            }
+            programs = [program for program in self.kb.programs.values() if program["id"] in found] or None
+        
+        matches = EligibilityScorer(programs).rank([company_data], top_k=10)[0]["matches"]
+        
+        analysis = {"high_probability": [], "medium_probability": [], "requires_more_info": []}
+        for match in matches:
+            entry = {
+                "program": match["program"],
+                "eligibility_score": f"{match['score']:.0%}",
+                "reasoning": "; ".join(match["reasons"]),
+                "estimated_amount": match["estimated_amount"],
+                "next_steps": f"Confirm criteria: {match['eligibility']}"
+            }
+            if match["needs_info"]:
+                analysis["requires_more_info"].append(entry)
+            elif match["band"] == "high":
+                analysis["high_probability"].append(entry)
+            elif match["band"] == "medium":
+                analysis["medium_probability"].append(entry)
+        
+        if llm_review and matches:
+            analysis["review"] = self._review_matches(company_data, matches[:llm_review])
+        
+        return analysis
+    
+    def _review_matches(self, company_data: dict, matches: list):
+        """Ask Gemini for application advice on a handful of pre-scored matches"""
+        from generate_strategy import SimpleGemini
         
         prompt = f"""
-You are a funding specialist. Analyze this company and determine which funding programs they are likely eligible for.
+You are a funding specialist. These programs were pre-selected for this company by eligibility scoring.
+For each one, confirm or challenge the fit and give concrete application advice.
 
 COMPANY DATA:
 {json.dumps(company_data, indent=2)}
 
-AVAILABLE FUNDING:
-{json.dumps(funding_data, indent=2)}
+PRE-SCORED PROGRAMS:
+{json.dumps(matches, indent=2)}
 
 OUTPUT FORMAT (JSON):
-{{
-    "high_probability": [
-        {{
-            "program": "Program name",
-            "eligibility_score": "90%",
-            "reasoning": "Why they qualify",
-            "estimated_amount": "$15,000-$100,000",
-            "application_complexity": "Low/Medium/High",
-            "next_steps": "Specific action items"
-        }}
-    ],
-    "medium_probability": [...],
-    "requires_more_info": [...]
-}}
+[
+    {{
+        "program": "Program name",
+        "reasoning": "Why they qualify (or what blocks them)",
+        "application_complexity": "Low/Medium/High",
+        "next_steps": "Specific action items"
+    }}
+]
 
-Be specific. Reference actual criteria from the funding descriptions.
+Be specific. Reference actual criteria from the program descriptions.
 """
         
         try:
-            client = APIClient()
-            response = client.call_gemini(prompt)
+            response = SimpleGemini(progress=self.progress).generate_content(prompt)
             
             # Parse JSON response
             clean_json = response.replace("```json", "").replace("```", "").strip()
-            analysis = json.loads(clean_json)
-            
-            return analysis
+            return json.loads(clean_json)
         
         except Exception as e:
-            print(f"[ERROR] Eligibility analysis failed: {e}")
+            print(f"[ERROR] Eligibility review failed: {e}")
             return {"error": str(e)}
 
 
-def research_funding_opportunities(company_name: str, industry: str = None, location: str = "Canada", save_to_file: bool = True):
+def research_funding_opportunities(company_name: str, industry: str = None, location: str = "Canada", save_to_file: bool = True,
+                                   progress: ProgressTracker = None):
     """
     Main function to research funding opportunities
     """
-    researcher = FundingResearcher()
+    progress = progress or ProgressTracker()
+    researcher = FundingResearcher(progress=progress)
     
     # Get funding data
     funding_data = researcher.research_funding(company_name, industry, location)
@@ -207,8 +205,10 @@ def research_funding_opportunities(company_name: str, industry: str = None, loca
         filename = f"{company_name.lower().replace(' ', '_')}_funding.json"
         filepath = os.path.join(output_dir, filename)
         
+        payload = json.dumps(funding_data, indent=2)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(funding_data, f, indent=2)
+            f.write(payload)
+        progress.wrote(filepath, len(payload.encode('utf-8')))
         
         print(f"[SUCCESS] Funding research saved to: {filepath}")
     
@@ -0,0 +1,203 @@
+"""
+Batch Consultancy Runner
+Runs a prospect list (CSV or JSONL) through one warm process instead of one subprocess per company.
+Caches, HTTP pools, rate limiters and circuit breakers are process-wide, so every company shares them.
+"""
+
+import sys
+import os
+import csv
+import json
+import time
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from run_full_consultancy import ConsultancyOrchestrator, PHASES
+from funding_kb import get_funding_kb
+from funding_eligibility import EligibilityScorer
+from core.lib.circuit_breaker import get_breaker_states
+from core.lib.llm_cache import get_llm_cache
+
+
+def load_companies(input_path: str) -> list:
+    """
+    Load the prospect list
+
+    CSV needs a 'company' (or 'name') column; JSONL needs one object per line
+    with the same keys. Optional: industry, url, location, employees, revenue.
+    """
+    rows = []
+    with open(input_path, 'r', encoding='utf-8') as f:
+        if input_path.lower().endswith(('.jsonl', '.ndjson')):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    companies = []
+    for row in rows:
+        company = (row.get('company') or row.get('name') or '').strip()
+        if not company:
+            continue
+        companies.append({
+            "company": company,
+            "industry": (row.get('industry') or '').strip() or None,
+            "url": (row.get('url') or '').strip() or None,
+            "location": (row.get('location') or '').strip() or "Canada",
+            "employees": row.get('employees') or None,
+            "revenue": row.get('revenue') or None
+        })
+
+    return companies
+
+
+def run_company(entry: dict, phase_workers: int = 4, force_phases: list = ()) -> dict:
+    """Run one company through the in-process orchestrator and summarise the outcome"""
+    started = time.monotonic()
+    result = {
+        "company": entry["company"],
+        "industry": entry["industry"],
+        "location": entry["location"],
+        "started_at": datetime.now().isoformat()
+    }
+
+    try:
+        orchestrator = ConsultancyOrchestrator(
+            company_name=entry["company"],
+            industry=entry["industry"],
+            url=entry["url"],
+            location=entry["location"],
+            max_workers=phase_workers,
+            force_phases=force_phases
+        )
+        success = orchestrator.run()
+        result.update({
+            "status": "success" if success else "failed",
+            "phases": orchestrator.phase_results,
+            "reused_phases": orchestrator.reused_phases,
+            "log_file": orchestrator.log_file,
+            "error": None
+        })
+    except Exception as e:
+        result.update({"status": "error", "phases": {}, "log_file": None, "error": str(e)})
+
+    result["completed_at"] = datetime.now().isoformat()
+    result["duration_seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def run_batch(input_path: str, workers: int = 2, phase_workers: int = 4, manifest_path: str = None,
+              force_phases: list = ()) -> dict:
+    """
+    Run every company in the input file through a single warm worker pool
+
+    Args:
+        input_path: CSV or JSONL prospect list
+        workers: Companies processed concurrently
+        phase_workers: Concurrent phases per company
+        manifest_path: Where to write the result manifest (default .tmp/batches/)
+        force_phases: Phases to recompute for every company despite matching checkpoints
+
+    Returns:
+        Manifest dict (also written to disk after every completed company)
+    """
+    companies = load_companies(input_path)
+
+    # Refresh stale funding evidence in the background while companies run
+    get_funding_kb().start_background_refresh()
+
+    # Score the whole list against every funding program in one vectorised pass
+    eligibility = EligibilityScorer().rank(companies, top_k=3)
+
+    if not manifest_path:
+        output_dir = os.path.join(os.path.dirname(__file__), "../.tmp/batches")
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        manifest_path = os.path.join(output_dir, f"batch_{timestamp}_manifest.json")
+
+    print(f"\n{'='*60}")
+    print(f"BATCH CONSULTANCY: {len(companies)} companies, {workers} workers")
+    print(f"{'='*60}\n")
+
+    started = time.monotonic()
+    manifest = {
+        "input": os.path.abspath(input_path),
+        "started_at": datetime.now().isoformat(),
+        "completed_at": None,
+        "workers": workers,
+        "total": len(companies),
+        "results": [None] * len(companies)
+    }
+    manifest_lock = threading.Lock()
+
+    def write_manifest():
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="batch") as pool:
+        futures = {pool.submit(run_company, entry, phase_workers, force_phases): i for i, entry in enumerate(companies)}
+
+        for future in as_completed(futures):
+            result = future.result()
+            result["funding_matches"] = eligibility[futures[future]]["matches"]
+            with manifest_lock:
+                # Keep input order so manifests are diffable between runs
+                manifest["results"][futures[future]] = result
+                write_manifest()
+            print(f"[BATCH] {result['company']}: {result['status']} ({result['duration_seconds']:.0f}s)")
+
+    results = manifest["results"]
+    manifest.update({
+        "completed_at": datetime.now().isoformat(),
+        "duration_seconds": round(time.monotonic() - started, 2),
+        "succeeded": sum(1 for r in results if r["status"] == "success"),
+        "failed": sum(1 for r in results if r["status"] != "success"),
+        "llm_cache": get_llm_cache().stats(),
+        "providers": get_breaker_states()
+    })
+    write_manifest()
+
+    print(f"\n[SUCCESS] Batch complete: {manifest['succeeded']}/{manifest['total']} succeeded")
+    print(f"[SUCCESS] Manifest saved to: {manifest_path}")
+
+    return manifest
+
+
+def main():
+    """CLI interface"""
+    parser = argparse.ArgumentParser(
+        description='InnovLead Batch Consultancy Runner',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python run_batch_consultancy.py prospects.csv
+  python run_batch_consultancy.py prospects.jsonl --workers 4 --manifest results.json
+  python run_batch_consultancy.py prospects.csv --force-phase proposals
+
+Rerunning a list resumes each company from its last good phase checkpoint.
+
+Input columns / keys: company (or name), industry, url, location,
+optional employees and revenue (used for funding eligibility scoring)
+        """
+    )
+
+    parser.add_argument('input', help='CSV or JSONL file of companies')
+    parser.add_argument('--workers', type=int, default=2, help='Companies processed concurrently (default: 2)')
+    parser.add_argument('--phase-workers', type=int, default=4, help='Concurrent phases per company (default: 4)')
+    parser.add_argument('--manifest', help='Result manifest path (default: .tmp/batches/)', default=None)
+    parser.add_argument('--force-phase', action='append', default=[], choices=PHASES + ['all'],
+                        help='Recompute this phase for every company (repeatable, or "all")')
+
+    args = parser.parse_args()
+
+    manifest = run_batch(args.input, args.workers, args.phase_workers, args.manifest, args.force_phase)
+
+    sys.exit(0 if manifest["failed"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,26 +7,56 @@ This is the BEAST MODE consultancy engine
 import sys
 import os
 import json
+import time
 import argparse
+import threading
 from datetime import datetime
+from typing import Callable, Dict, Iterable
 
 # Add project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 from research_enhanced import conduct_full_research
 from research_funding import research_funding_opportunities
+from funding_kb import get_funding_kb
 from generate_strategy import generate_strategy
 from generate_proposal_suite import generate_full_proposal_suite
+from core.lib.cache import get_cache
+from core.lib.circuit_breaker import get_breaker_states
+from core.lib.dag import DAGScheduler
+from core.lib.progress import ProgressTracker
+
+# Bump whenever a phase's logic or prompts change so old checkpoints stop matching
+ENGINE_VERSION = "2.3"
+
+PHASES = ["research", "funding", "strategy", "proposals"]
+
+# Run-specific fields that must not change a phase's checkpoint key
+VOLATILE_KEYS = {"timestamp", "scraped_at", "fetched_at", "generated_at"}
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", os.path.join(PROJECT_ROOT, ".tmp", "cache", "checkpoints.db"))
+CHECKPOINT_TTL = float(os.getenv("CHECKPOINT_TTL", 7 * 86400))  # 0 disables checkpoints
 
 
 class ConsultancyOrchestrator:
     """Master orchestrator for full consultancy process"""
     
-    def __init__(self, company_name: str, industry: str = None, url: str = None, location: str = "Canada"):
+    def __init__(self, company_name: str, industry: str = None, url: str = None, location: str = "Canada",
+                 max_workers: int = 4, on_event: Callable[[Dict], None] = None,
+                 force_phases: Iterable[str] = (), use_checkpoints: bool = True):
         self.company = company_name
         self.industry = industry
         self.url = url
         self.location = location
+        self.max_workers = max_workers
+        self.force_phases = set(PHASES if "all" in force_phases else force_phases)
+        self.checkpoints = (
+            get_cache(CHECKPOINT_DB, "phases", ttl=CHECKPOINT_TTL)
+            if use_checkpoints and CHECKPOINT_TTL > 0 else None
+        )
+        self.reused_phases = []
+        self.progress = ProgressTracker(on_event, company=company_name)
         self.start_time = datetime.now()
         
         # Results storage
@@ -34,7 +64,9 @@ class ConsultancyOrchestrator:
         self.funding_data = None
         self.strategy_data = None
         self.proposal_suite = None
+        self.phase_results = {}
         
+        self._log_lock = threading.Lock()
         self.log_file = self._setup_logging()
     
     def _setup_logging(self):
@@ -53,10 +85,105 @@ class ConsultancyOrchestrator:
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {level}: {message}"
         
-        print(log_entry)
+        # Phases run concurrently, keep lines whole
+        with self._log_lock:
+            print(log_entry)
+            
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(log_entry + "\n")
+    
+    def emit(self, event_type: str, **data):
+        """Send a progress event to the on_event listener (counters are attached automatically)"""
+        self.progress.emit(event_type, **data)
+    
+    def _tracked_phase(self, name: str, func: Callable[[], bool]) -> Callable[[], bool]:
+        """Wrap a phase so it emits phase_start/phase_end events"""
+        def run_phase():
+            self.emit("phase_start", phase=name)
+            started = time.monotonic()
+            success = False
+            try:
+                success = func() is not False
+                return success
+            finally:
+                self.emit("phase_end", phase=name, status="success" if success else "failed",
+                          duration_seconds=round(time.monotonic() - started, 2))
+        return run_phase
+    
+    @staticmethod
+    def _stable(value):
+        """Copy of value without VOLATILE_KEYS, so reruns of identical content hash the same"""
+        if isinstance(value, dict):
+            return {key: ConsultancyOrchestrator._stable(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+        if isinstance(value, list):
+            return [ConsultancyOrchestrator._stable(item) for item in value]
+        return value
+    
+    def _phase_inputs(self, name: str) -> tuple:
+        """Everything a phase's output depends on (upstream outputs by content)"""
+        if name == "research":
+            return (self.company, self.industry, self.url)
+        if name == "funding":
+            return (self.company, self.industry, self.location)
+        if name == "strategy":
+            return (self.company, self._stable(self.research_data))
+        return (self.company, self._stable(self.research_data), self._stable(self.strategy_data),
+                self._stable(self.funding_data or {}))
+    
+    @staticmethod
+    def _degraded(name: str, output) -> bool:
+        """
+        True when a phase "succeeded" with output not worth reusing
+        
+        Unparsed LLM output ({"raw_response": ...}), research whose synthesis
+        came back empty or failed (e.g. built from "{}" while the Gemini
+        circuit was open) and partially generated suites all qualify.
+        """
+        if not output or not isinstance(output, dict):
+            return True
+        if "raw_response" in output:
+            return True
+        if name == "research":
+            insights = output.get("insights")
+            return not insights or not isinstance(insights, dict) or "error" in insights
+        if name == "proposals":
+            # A partially generated suite is not worth keeping: rerun the failed documents
+            return any(doc["status"] != "success" for doc in output.get("documents", {}).values())
+        return False
+    
+    def _checkpointed(self, name: str, attr: str, func: Callable[[], bool]) -> Callable[[], bool]:
+        """
+        Wrap a phase with a content-hashed checkpoint
         
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry + "\n")
+        The key covers the phase inputs and ENGINE_VERSION, so a rerun skips a
+        phase only when nothing it depends on changed. Failed phases and degraded
+        output are never checkpointed, which makes a rerun resume at the first
+        failed/degraded/stale phase.
+        """
+        def run_phase():
+            if self.checkpoints is None:
+                return func()
+            
+            key = self.checkpoints.make_key(name, ENGINE_VERSION, self._phase_inputs(name))
+            
+            if name not in self.force_phases:
+                cached = self.checkpoints.get(key)
+                if cached is not None:
+                    setattr(self, attr, cached)
+                    self.reused_phases.append(name)
+                    self.log(f" {name.capitalize()} restored from checkpoint", "SUCCESS")
+                    self.emit("checkpoint_hit", phase=name)
+                    return True
+            
+            success = func()
+            output = getattr(self, attr)
+            
+            if success is not False and not self._degraded(name, output):
+                self.checkpoints.set(key, output)
+            elif success is not False:
+                self.log(f" {name.capitalize()} output degraded, not checkpointed", "WARN")
+            return success
+        return run_phase
     
     def run_phase_1_research(self):
         """Phase 1: Multi-dimensional research"""
@@ -71,7 +198,8 @@ class ConsultancyOrchestrator:
                 company_name=self.company,
                 industry=self.industry,
                 url=self.url,
-                save_to_file=True
+                save_to_file=True,
+                progress=self.progress
             )
             
             self.log(" Research completed successfully", "SUCCESS")
@@ -100,7 +228,8 @@ class ConsultancyOrchestrator:
                 company_name=self.company,
                 industry=self.industry,
                 location=self.location,
-                save_to_file=True
+                save_to_file=True,
+                progress=self.progress
             )
             
             self.log(" Funding research completed", "SUCCESS")
@@ -131,21 +260,23 @@ class ConsultancyOrchestrator:
             return False
         
         try:
+            # Opportunities are logged as they stream in, before the rest of the strategy is generated
+            opps = []
+            
+            def log_opportunity(opp):
+                opps.append(opp)
+                self.log(f"  {len(opps)}. {opp.get('title', 'N/A')} ({opp.get('confidence', 'N/A')} confidence)")
+            
             self.strategy_data = generate_strategy(
                 company_name=self.company,
                 research_data=self.research_data,
-                save_to_file=True
+                save_to_file=True,
+                progress=self.progress,
+                on_opportunity=log_opportunity
             )
             
             self.log(" Strategy generated", "SUCCESS")
-            
-            # Log opportunities
-            if isinstance(self.strategy_data, dict):
-                opps = self.strategy_data.get('opportunities', [])
-                self.log(f"  Automation opportunities: {len(opps)}")
-                
-                for i, opp in enumerate(opps[:3], 1):
-                    self.log(f"  {i}. {opp.get('title', 'N/A')}")
+            self.log(f"  Automation opportunities: {len(opps)}")
             
             return True
             
@@ -160,23 +291,88 @@ class ConsultancyOrchestrator:
         self.log("="*60)
         
         try:
+            # Hand over in-memory results instead of re-reading the .tmp files
             self.proposal_suite = generate_full_proposal_suite(
                 company_name=self.company,
-                save_to_file=True
+                save_to_file=True,
+                research=self.research_data,
+                strategy=self.strategy_data,
+                funding=self.funding_data or {},
+                progress=self.progress
             )
             
-            self.log(" Proposal suite generated", "SUCCESS")
-            self.log("   Executive Summary (C-Suite)")
-            self.log("   Technical Roadmap (IT/Engineering)")
-            self.log("   Financial Model (CFO)")
-            self.log("   Funding Application (Grant Writer)")
+            documents = self.proposal_suite.get("documents", {})
+            generated = [key for key, doc in documents.items() if doc["status"] == "success"]
             
+            for key, doc in documents.items():
+                level = "INFO" if doc["status"] == "success" else "WARN"
+                self.log(f"   {key}: {doc['status']} ({doc['duration_seconds']:.1f}s)", level)
+            
+            if not generated:
+                self.log(" Proposal generation failed for every document", "ERROR")
+                return False
+            
+            self.log(f" Proposal suite generated ({len(generated)}/{len(documents)} documents)", "SUCCESS")
             return True
             
         except Exception as e:
             self.log(f" Proposal generation failed: {e}", "ERROR")
             return False
     
+    def build_phase_graph(self) -> DAGScheduler:
+        """
+        Express the consultancy as a dependency graph
+        
+        Funding needs nothing from research, so it runs alongside it. Strategy
+        needs research; proposals read research, strategy and funding output.
+        Funding and proposals are optional: their failure doesn't block the run.
+        """
+        phases = {
+            "research": ("research_data", self.run_phase_1_research),
+            "funding": ("funding_data", self.run_phase_2_funding),
+            "strategy": ("strategy_data", self.run_phase_3_strategy),
+            "proposals": ("proposal_suite", self.run_phase_4_proposals)
+        }
+        steps = {
+            name: self._tracked_phase(name, self._checkpointed(name, attr, func))
+            for name, (attr, func) in phases.items()
+        }
+        
+        graph = DAGScheduler(max_workers=self.max_workers)
+        graph.add("research", steps["research"])
+        graph.add("funding", steps["funding"], required=False)
+        graph.add("strategy", steps["strategy"], depends_on=["research"])
+        graph.add("proposals", steps["proposals"], depends_on=["strategy", "funding"], required=False)
+        return graph
+    
+    def log_phase_timings(self):
+        """Log per-phase status and wall time"""
+        if not self.phase_results:
+            return
+        
+        self.log("\n PHASE TIMINGS:")
+        for name, result in self.phase_results.items():
+            level = "INFO" if result["status"] == "success" else "WARN"
+            line = f"   {name}: {result['status']} ({result['duration_seconds']:.1f}s)"
+            if result.get("error"):
+                line += f" - {result['error']}"
+            self.log(line, level)
+    
+    def log_provider_health(self):
+        """Log circuit breaker state for every upstream provider touched so far"""
+        states = get_breaker_states()
+        if not states:
+            return
+        
+        self.log("\n PROVIDER HEALTH:")
+        for name, state in states.items():
+            level = "INFO" if state["state"] == "closed" else "WARN"
+            self.log(
+                f"   {name}: {state['state']} "
+                f"({state['total_failures']} failures, {state['total_rejected']} fast-failed)",
+                level
+            )
+    
     def generate_summary_report(self):
         """Generate execution summary"""
         self.log("\n" + "="*60)
@@ -208,6 +404,9 @@ class ConsultancyOrchestrator:
         for output in outputs:
             self.log(f"   {output}")
         
+        self.log_phase_timings()
+        self.log_provider_health()
+        
         self.log(f"\n EXECUTION LOG: {self.log_file}")
         
         self.log("\n NEXT STEPS:")
@@ -218,6 +417,45 @@ class ConsultancyOrchestrator:
         
         self.log("\n" + "="*60)
     
+    def get_results(self, success: bool) -> Dict:
+        """
+        Structured outcome of the run, for in-process callers
+        
+        Returns:
+            Dict with phase results, the research/funding/strategy data,
+            the proposal suite and headline metrics (all JSON-serialisable)
+        """
+        funding = self.funding_data or {}
+        strategy = self.strategy_data if isinstance(self.strategy_data, dict) else {}
+        documents = (self.proposal_suite or {}).get("documents", {})
+        
+        return {
+            "success": success,
+            "company": self.company,
+            "industry": self.industry,
+            "location": self.location,
+            "started_at": self.start_time.isoformat(),
+            "completed_at": datetime.now().isoformat(),
+            "duration_seconds": round((datetime.now() - self.start_time).total_seconds(), 2),
+            "phases": self.phase_results,
+            "reused_phases": [name for name in PHASES if name in self.reused_phases],
+            "research": self.research_data,
+            "funding": self.funding_data,
+            "strategy": self.strategy_data,
+            "proposals": self.proposal_suite,
+            "metrics": {
+                "research_complete": self.research_data is not None,
+                "funding_analyzed": self.funding_data is not None,
+                "funding_opportunities": len(funding.get("opportunities", [])),
+                "tax_incentives": len(funding.get("tax_incentives", [])),
+                "automation_opportunities": len(strategy.get("opportunities", [])),
+                "proposals_generated": sum(1 for doc in documents.values() if doc["status"] == "success")
+            },
+            "progress": self.progress.counters(),
+            "files": {key: doc["file"] for key, doc in documents.items() if doc.get("file")},
+            "log_file": self.log_file
+        }
+    
     def run(self):
         """Execute full consultancy loop"""
         self.log(f"\n{'#'*60}")
@@ -225,22 +463,25 @@ class ConsultancyOrchestrator:
         self.log(f"# Multi-Dimensional Analysis System")
         self.log(f"{'#'*60}\n")
         
-        # Phase 1: Research
-        if not self.run_phase_1_research():
+        # Research + funding run concurrently, then strategy, then proposals
+        self.phase_results = self.build_phase_graph().run()
+        
+        if self.phase_results["research"]["status"] != "success":
             self.log("Consultancy aborted due to research failure", "ERROR")
+            self.log_phase_timings()
+            self.log_provider_health()
             return False
         
-        # Phase 2: Funding
-        if not self.run_phase_2_funding():
-            self.log("Warning: Continuing without funding data", "WARN")
+        if self.phase_results["funding"]["status"] != "success":
+            self.log("Warning: Continued without funding data", "WARN")
         
-        # Phase 3: Strategy
-        if not self.run_phase_3_strategy():
+        if self.phase_results["strategy"]["status"] != "success":
             self.log("Consultancy aborted due to strategy failure", "ERROR")
+            self.log_phase_timings()
+            self.log_provider_health()
             return False
         
-        # Phase 4: Proposals
-        if not self.run_phase_4_proposals():
+        if self.phase_results["proposals"]["status"] != "success":
             self.log("Warning: Proposals incomplete", "WARN")
         
         # Summary
@@ -249,6 +490,52 @@ class ConsultancyOrchestrator:
         return True
 
 
+def run_consultancy(company_name: str, industry: str = None, url: str = None, location: str = "Canada",
+                    max_workers: int = 4, on_event: Callable[[Dict], None] = None,
+                    force_phases: Iterable[str] = ()) -> Dict:
+    """
+    Run the full consultancy in the calling process
+    
+    Entry point for job runners (Vault, MCP server, batch mode): no subprocess,
+    no stdout capture and no re-reading of .tmp files to rebuild results.
+    
+    Args:
+        company_name: Company to analyse
+        industry: Industry sector (optional)
+        url: Company website (optional)
+        location: Geographic location for funding research
+        max_workers: Concurrent phases
+        on_event: Called with each progress event dict ({"type", "company", "timestamp",
+                  "counters", ...}): job_start/job_end, phase_start/phase_end,
+                  queries_planned/query_done, llm_start/llm_end and file_written.
+                  Runs on worker threads, so keep it cheap
+        force_phases: Phases to recompute even if a checkpoint matches ("all" for every phase)
+    
+    Returns:
+        Structured results (see ConsultancyOrchestrator.get_results)
+    """
+    # Job runners are long-lived: keep funding evidence fresh off the request path
+    get_funding_kb().start_background_refresh()
+    
+    orchestrator = ConsultancyOrchestrator(
+        company_name=company_name,
+        industry=industry,
+        url=url,
+        location=location,
+        max_workers=max_workers,
+        on_event=on_event,
+        force_phases=force_phases
+    )
+    
+    orchestrator.emit("job_start")
+    success = orchestrator.run()
+    results = orchestrator.get_results(success)
+    orchestrator.emit("job_end", status="success" if success else "failed",
+                      duration_seconds=results["duration_seconds"], metrics=results["metrics"])
+    
+    return results
+
+
 def main():
     """CLI interface"""
     parser = argparse.ArgumentParser(
@@ -259,6 +546,11 @@ Examples:
   python run_full_consultancy.py "Shopify"
   python run_full_consultancy.py "Shopify" --industry "E-commerce" --url "https://shopify.com"
   python run_full_consultancy.py "TechCorp" --industry "SaaS" --location "Canada"
+  python run_full_consultancy.py "TechCorp" --force-phase strategy
+
+Unchanged phases are restored from checkpoints, so a rerun resumes at the
+first failed or stale phase. --force-phase recomputes a phase; downstream
+phases rerun only if its output actually changed (checkpoints are content-hashed).
 
 This will generate:
    Multi-dimensional research report
@@ -272,6 +564,9 @@ This will generate:
     parser.add_argument('--industry', help='Industry sector (optional)', default=None)
     parser.add_argument('--url', help='Company website URL (optional)', default=None)
     parser.add_argument('--location', help='Geographic location (default: Canada)', default='Canada')
+    parser.add_argument('--force-phase', action='append', default=[], choices=PHASES + ['all'],
+                        help='Recompute this phase even if its checkpoint is current (repeatable, or "all")')
+    parser.add_argument('--no-checkpoints', action='store_true', help='Neither read nor write phase checkpoints')
     
     args = parser.parse_args()
     
@@ -280,7 +575,9 @@ This will generate:
         company_name=args.company,
         industry=args.industry,
         url=args.url,
-        location=args.location
+        location=args.location,
+        force_phases=args.force_phase,
+        use_checkpoints=not args.no_checkpoints
     )
     
     success = orchestrator.run()
@@ -17,6 +17,11 @@ from pathlib import Path
 from typing import Dict
 import google.generativeai as genai
 
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.llm_cache import get_llm_cache
+
 
 # Configuration
 OUTPUT_DIR = Path(".tmp/content")
@@ -26,6 +31,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+GEMINI_MODEL = 'gemini-2.0-flash-exp'
 CONTENT_TYPE = os.getenv("CONTENT_TYPE", "social")  # 'social' or 'web'
 
 
@@ -39,10 +45,11 @@ class ContentGenerator:
         # Initialize Gemini
         if GEMINI_API_KEY:
             genai.configure(api_key=GEMINI_API_KEY)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.model = genai.GenerativeModel(GEMINI_MODEL)
         else:
             print("⚠️ GEMINI_API_KEY not set - using fallback generation")
             self.model = None
+        self.llm_cache = get_llm_cache()
     
     def create_slug(self, text: str) -> str:
         """Create URL-friendly slug"""
@@ -111,8 +118,9 @@ Write ONLY the explanation, no title or extra formatting:"""
 
         if self.model:
             try:
-                response = self.model.generate_content(prompt)
-                explanation = response.text.strip()
+                explanation = self.llm_cache.get_or_generate(
+                    prompt, GEMINI_MODEL, lambda: self.model.generate_content(prompt).text
+                ).strip()
                 print(f"  ✅ Generated {len(explanation)} character explanation")
                 return explanation
             except Exception as e:
@@ -162,8 +170,9 @@ Write ONLY the image generation prompt, make it detailed and specific:"""
 
         if self.model:
             try:
-                response = self.model.generate_content(prompt_template)
-                image_prompt = response.text.strip()
+                image_prompt = self.llm_cache.get_or_generate(
+                    prompt_template, GEMINI_MODEL, lambda: self.model.generate_content(prompt_template).text
+                ).strip()
                 print(f"  ✅ Generated {len(image_prompt)} character image prompt")
                 return image_prompt
             except Exception as e:
@@ -17,7 +17,12 @@ import requests
 from pathlib import Path
 from typing import Dict
 from datetime import datetime
-import time
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.api_client import APIClient
+from core.lib.retry import RetryPolicy
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -26,7 +31,7 @@ load_dotenv()
 # Configuration
 OUTPUT_DIR = Path(".tmp/images")
 IDEOGRAM_API_KEY = os.getenv("IDEOGRAM_API_KEY", "")
-IDEOGRAM_API_URL = "https://api.ideogram.ai/generate"
+IDEOGRAM_API_BASE = "https://api.ideogram.ai"
 
 
 class IdeogramImageGenerator:
@@ -35,7 +40,8 @@ class IdeogramImageGenerator:
         self.prompt = prompt
         self.topic_slug = self.create_slug(topic)
         self.max_retries = 3
-        self.retry_delays = [5, 15, 30]
+        self.retry_policy = RetryPolicy(max_attempts=self.max_retries, base_delay=5, max_delay=30)
+        self.client = APIClient(IDEOGRAM_API_BASE, timeout=60, retry_policy=self.retry_policy)
     
     def create_slug(self, text: str) -> str:
         """Create URL-friendly slug"""
@@ -55,93 +61,45 @@ class IdeogramImageGenerator:
                 "error": "IDEOGRAM_API_KEY not set. Get one at https://ideogram.ai/api-keys"
             }
         
-        for attempt in range(self.max_retries):
-            try:
-                print(f"  Attempt {attempt + 1}/{self.max_retries}...")
-                
-                # Ideogram API payload
-                payload = {
-                    "image_request": {
-                        "prompt": self.prompt,
-                        "aspect_ratio": "ASPECT_1_1",  # Square for social media
-                        "model": "V_2",  # Latest model
-                        "magic_prompt_option": "AUTO"  # Enhance prompt automatically
-                    }
-                }
-                
-                response = requests.post(
-                    IDEOGRAM_API_URL,
-                    json=payload,
-                    headers={
-                        "Api-Key": IDEOGRAM_API_KEY,
-                        "Content-Type": "application/json"
-                    },
-                    timeout=60
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Ideogram returns a list of generated images
-                    images = data.get("data", [])
-                    
-                    if images and len(images) > 0:
-                        image_url = images[0].get("url")
-                        
-                        if image_url:
-                            print(f"  ✅ Image generated successfully")
-                            return {
-                                "success": True,
-                                "image_url": image_url,
-                                "prompt_used": self.prompt,
-                                "resolution": "1024x1024"
-                            }
-                    
-                    print("  ❌ No image URL in response")
-                    return {"success": False, "error": "No image URL returned"}
-                
-                elif response.status_code == 401:
-                    print(f"  ❌ Invalid API key")
-                    return {"success": False, "error": "Invalid IDEOGRAM_API_KEY"}
-                
-                elif response.status_code == 429:
-                    print(f"  ⏱️ Rate limit hit, waiting...")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delays[attempt])
-                        continue
-                    return {"success": False, "error": "Rate limit exceeded"}
-                
-                else:
-                    print(f"  ❌ API error: {response.status_code}")
-                    print(f"  Response: {response.text[:200]}")
-                    
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delays[attempt])
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"API returned {response.status_code}"
-                        }
-                
-            except requests.exceptions.Timeout:
-                print(f"  ⏱️ Request timeout on attempt {attempt + 1}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delays[attempt])
-            
-            except requests.exceptions.RequestException as e:
-                print(f"  ⚠️ Request error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delays[attempt])
-            
-            except Exception as e:
-                print(f"  ❌ Unexpected error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delays[attempt])
-        
-        return {
-            "success": False,
-            "error": "Failed to generate image after all retries"
+        # Ideogram API payload
+        payload = {
+            "image_request": {
+                "prompt": self.prompt,
+                "aspect_ratio": "ASPECT_1_1",  # Square for social media
+                "model": "V_2",  # Latest model
+                "magic_prompt_option": "AUTO"  # Enhance prompt automatically
+            }
         }
+        
+        # Each accepted POST is a billed generation: APIClient resends it only on
+        # connection failures and 429/503 refusals, never after other 4xx/5xx
+        result = self.client.post("generate", data=payload, headers={"Api-Key": IDEOGRAM_API_KEY})
+        
+        if not result["success"]:
+            if result.get("status") == 401:
+                print(f"  ❌ Invalid API key")
+                return {"success": False, "error": "Invalid IDEOGRAM_API_KEY"}
+            if result.get("status") == 429:
+                print(f"  ⏱️ Rate limit hit")
+                return {"success": False, "error": "Rate limit exceeded"}
+            print(f"  ❌ API error: {result['error']}")
+            return {"success": False, "error": result["error"]}
+        
+        # Ideogram returns a list of generated images
+        images = result["data"].get("data", [])
+        image_url = images[0].get("url") if images else None
+        
+        if image_url:
+            print(f"  ✅ Image generated successfully")
+            return {
+                "success": True,
+                "image_url": image_url,
+                "prompt_used": self.prompt,
+                "resolution": "1024x1024"
+            }
+        
+        print("  ❌ No image URL in response")
+        return {"success": False, "error": "No image URL returned"}
     
     def download_image(self, image_url: str) -> Path:
         """Download generated image"""
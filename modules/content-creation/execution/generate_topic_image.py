@@ -17,7 +17,12 @@ import requests
 from pathlib import Path
 from typing import Dict
 from datetime import datetime
-import time
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.api_client import APIClient
+from core.lib.retry import RetryPolicy
 
 
 # Configuration
@@ -29,7 +34,7 @@ load_dotenv()
 
 INNOVLEAD_API_BASE = os.getenv("INNOVLEAD_API_URL", "https://media-uploader--tommy0110.replit.app")
 KEI_AI_API_KEY = os.getenv("KEI_AI_API_KEY", "")
-KEI_AI_API_URL = "https://api.kei.ai/v1/images/generations"
+KEI_AI_API_BASE = "https://api.kei.ai/v1"
 
 
 class ImageGenerator:
@@ -38,7 +43,8 @@ class ImageGenerator:
         self.prompt = prompt
         self.topic_slug = self.create_slug(topic)
         self.max_retries = 3
-        self.retry_delays = [5, 15, 30]  # Exponential backoff
+        self.retry_policy = RetryPolicy(max_attempts=self.max_retries, base_delay=5, max_delay=30)
+        self.client = APIClient(KEI_AI_API_BASE, api_key=KEI_AI_API_KEY, timeout=60, retry_policy=self.retry_policy)
     
     def create_slug(self, text: str) -> str:
         """Create URL-friendly slug"""
@@ -60,66 +66,29 @@ class ImageGenerator:
             "style": "educational, diagram, colorful, clear"
         }
         
-        for attempt in range(self.max_retries):
-            try:
-                print(f"  Attempt {attempt + 1}/{self.max_retries}...")
-                
-                # Call Kei.ai API for image generation
-                response = requests.post(
-                    KEI_AI_API_URL,
-                    json={
-                        "prompt": self.prompt,
-                        "aspect_ratio": "1:1",  # Square for social media
-                        "n": 1
-                    },
-                    headers={
-                        "Authorization": f"Bearer {KEI_AI_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    timeout=60
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    image_url = data.get("data", [{}])[0].get("url", "")
-                    
-                    if image_url:
-                        print(f"  ✅ Image generated successfully")
-                        return {
-                            "success": True,
-                            "image_url": image_url,
-                            "prompt_used": self.prompt,
-                            "parameters": payload
-                        }
-                    else:
-                        print("  ❌ No image URL in response")
-                        return {"success": False, "error": "No image URL returned"}
-                else:
-                    print(f"  ❌ API error: {response.status_code} - {response.text}")
-                    return {"success": False, "error": f"API returned {response.status_code}"}
-                
-                
-            except requests.exceptions.Timeout:
-                print(f"  ⏱️ Request timeout on attempt {attempt + 1}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delays[attempt])
-            
-            except requests.exceptions.RequestException as e:
-                print(f"  ⚠️ Request error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delays[attempt])
-            
-            except Exception as e:
-                print(f"  ❌ Unexpected error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delays[attempt])
-        
-        # All retries failed
-        print("  ❌ All retry attempts exhausted")
-        return {
-            "success": False,
-            "error": "Failed to generate image after all retries"
-        }
+        # Each accepted POST is a billed generation: APIClient resends it only on
+        # connection failures and 429/503 refusals, never after other 4xx/5xx
+        result = self.client.post("images/generations", data={
+            "prompt": self.prompt,
+            "aspect_ratio": "1:1",  # Square for social media
+            "n": 1
+        })
+        
+        if not result["success"]:
+            print(f"  ❌ API error: {result['error']}")
+            return {"success": False, "error": result["error"]}
+        
+        image_url = (result["data"].get("data") or [{}])[0].get("url", "")
+        if image_url:
+            print(f"  ✅ Image generated successfully")
+            return {
+                "success": True,
+                "image_url": image_url,
+                "prompt_used": self.prompt,
+                "parameters": payload
+            }
+        print("  ❌ No image URL in response")
+        return {"success": False, "error": "No image URL returned"}
     
     def download_image(self, image_url: str) -> Path:
         """Download generated image"""
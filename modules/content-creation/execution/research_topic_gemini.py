@@ -17,6 +17,11 @@ from pathlib import Path
 from typing import Dict
 import google.generativeai as genai
 
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.llm_cache import get_llm_cache
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
@@ -24,6 +29,7 @@ load_dotenv()
 # Configuration
 OUTPUT_DIR = Path(".tmp/research")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+GEMINI_MODEL = 'gemini-2.0-flash-exp'
 
 
 class GeminiResearcher:
@@ -43,10 +49,11 @@ class GeminiResearcher:
         if GEMINI_API_KEY:
             genai.configure(api_key=GEMINI_API_KEY)
             # Use Gemini 2.0 Flash with grounding
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.model = genai.GenerativeModel(GEMINI_MODEL)
         else:
             print("⚠️ GEMINI_API_KEY not set")
             self.model = None
+        self.llm_cache = get_llm_cache()
     
     def create_slug(self, text: str) -> str:
         """Create URL-friendly slug from text"""
@@ -84,10 +91,12 @@ Only return the JSON, nothing else."""
 
         try:
             # Generate research
-            response = self.model.generate_content(prompt)
+            text = self.llm_cache.get_or_generate(
+                prompt, GEMINI_MODEL, lambda: self.model.generate_content(prompt).text
+            )
             
-            if response.text:
-                content = response.text.strip()
+            if text:
+                content = text.strip()
                 
                 # Parse JSON response
                 try:
@@ -4,12 +4,26 @@ Unrestricted web research for Antigravity
 """
 
 import os
+import sys
 import requests
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
+# Add project root to sys.path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+sys.path.append(PROJECT_ROOT)
+
+from core.lib.rate_limiter import get_rate_limiter
+from core.lib.circuit_breaker import get_circuit_breaker
+from core.lib.cache import get_cache
+
 load_dotenv()
 
+# Search response cache (set BRAVE_CACHE_TTL=0 to disable)
+SEARCH_CACHE_DB = os.getenv("BRAVE_CACHE_DB", os.path.join(PROJECT_ROOT, ".tmp", "cache", "brave_search.db"))
+SEARCH_CACHE_TTL = float(os.getenv("BRAVE_CACHE_TTL", 7 * 86400))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("BRAVE_CACHE_MAX_ENTRIES", 20000))
+
 
 class BraveSearchMCP:
     """MCP for Brave Search API - Unlimited web research"""
@@ -25,6 +39,11 @@ class BraveSearchMCP:
             "Accept-Encoding": "gzip",
             "X-Subscription-Token": self.api_key
         }
+        self.rate_limiter = get_rate_limiter("brave")
+        self.circuit_breaker = get_circuit_breaker("api.search.brave.com")
+        self.cache = None
+        if SEARCH_CACHE_TTL > 0:
+            self.cache = get_cache(SEARCH_CACHE_DB, "brave_search", SEARCH_CACHE_TTL, SEARCH_CACHE_MAX_ENTRIES)
     
     def search(self, query: str, num_results: int = 5, country: str = "us") -> List[Dict]:
         """
@@ -44,7 +63,20 @@ class BraveSearchMCP:
             "country": country
         }
         
+        # Content-addressed on the exact request parameters
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(params["q"], params["count"], params["country"])
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if not self.circuit_breaker.allow_request():
+            print(f"Search skipped: circuit open for {self.circuit_breaker.name}")
+            return []
+        
         try:
+            self.rate_limiter.acquire()
             response = requests.get(
                 self.base_url,
                 headers=self.headers,
@@ -52,21 +84,37 @@ class BraveSearchMCP:
                 timeout=10
             )
             response.raise_for_status()
+            self.circuit_breaker.record_success()
             
             data = response.json()
             results = data.get("web", {}).get("results", [])
             
-            return [{
+            formatted = [{
                 "title": r.get("title", ""),
                 "url": r.get("url", ""),
                 "description": r.get("description", ""),
                 "age": r.get("age", "")
             } for r in results]
+            
+            if cache_key:
+                self.cache.set(cache_key, formatted)
+            
+            return formatted
         
         except requests.exceptions.RequestException as e:
+            # Only outages count against the breaker, not 4xx client errors
+            status = getattr(e.response, "status_code", None)
+            if status is None or status >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
             print(f"Search error: {e}")
             return []
     
+    def cache_stats(self) -> Optional[Dict]:
+        """Hit/miss counters for the search cache (None when caching is disabled)"""
+        return self.cache.stats() if self.cache else None
+    
     def research_company(self, company_name: str) -> Dict:
         """
         Research a company - get overview and competitors
@@ -4,11 +4,17 @@ Full read/write access to n8n workflows - Antigravity can build automations for
 """
 
 import os
+import sys
 import requests
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from core.lib.rate_limiter import get_rate_limiter
+
 load_dotenv()
 
 
@@ -27,12 +33,14 @@ class N8nCloudMCP:
             "Content-Type": "application/json",
             "X-N8N-API-KEY": self.api_key
         }
+        self.rate_limiter = get_rate_limiter("n8n")
     
     # ==================== READ Operations ====================
     
     def get_all_workflows(self) -> List[Dict]:
         """Get all workflows - understand what's already built"""
         try:
+            self.rate_limiter.acquire()
             response = requests.get(
                 f"{self.base_url}/api/v1/workflows",
                 headers=self.headers,
@@ -47,6 +55,7 @@ class N8nCloudMCP:
     def get_workflow(self, workflow_id: str) -> Optional[Dict]:
         """Get specific workflow details"""
         try:
+            self.rate_limiter.acquire()
             response = requests.get(
                 f"{self.base_url}/api/v1/workflows/{workflow_id}",
                 headers=self.headers,
@@ -79,6 +88,7 @@ class N8nCloudMCP:
             Created workflow data
         """
         try:
+            self.rate_limiter.acquire()
             response = requests.post(
                 f"{self.base_url}/api/v1/workflows",
                 headers=self.headers,
@@ -94,6 +104,7 @@ class N8nCloudMCP:
     def update_workflow(self, workflow_id: str, workflow_data: Dict) -> Optional[Dict]:
         """Update existing workflow"""
         try:
+            self.rate_limiter.acquire()
             response = requests.patch(
                 f"{self.base_url}/api/v1/workflows/{workflow_id}",
                 headers=self.headers,
@@ -136,6 +147,7 @@ class N8nCloudMCP:
             Execution result
         """
         try:
+            self.rate_limiter.acquire()
             response = requests.post(
                 f"{self.base_url}/api/v1/workflows/{workflow_id}/execute",
                 headers=self.headers,
@@ -166,6 +178,7 @@ class N8nCloudMCP:
             if workflow_id:
                 params["workflowId"] = workflow_id
             
+            self.rate_limiter.acquire()
             response = requests.get(
                 f"{self.base_url}/api/v1/executions",
                 headers=self.headers,
@@ -12,7 +12,11 @@ import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
-from jinja2 import Environment, FileSystemLoader, Template
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from core.lib.templating import get_environment
 
 
 class ProposalGenerator:
@@ -29,44 +33,9 @@ class ProposalGenerator:
             template_dir = os.path.join(os.path.dirname(__file__), "templates")
         
         self.template_dir = template_dir
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        self.env.filters['format_currency'] = self._format_currency
-        self.env.filters['format_date'] = self._format_date
-        self.env.filters['format_percentage'] = self._format_percentage
-    
-    def _format_currency(self, value, currency='CAD'):
-        """Format number as currency"""
-        try:
-            val = float(value)
-            return f"${val:,.0f} {currency}"
-        except (ValueError, TypeError):
-            return value
-    
-    def _format_date(self, value, format='%B %d, %Y'):
-        """Format date string"""
-        if isinstance(value, str):
-            try:
-                dt = datetime.fromisoformat(value)
-                return dt.strftime(format)
-            except:
-                return value
-        elif isinstance(value, datetime):
-            return value.strftime(format)
-        return value
-    
-    def _format_percentage(self, value):
-        """Format number as percentage"""
-        try:
-            val = float(value)
-            return f"{val:.1f}%"
-        except (ValueError, TypeError):
-            return value
+        # Shared per directory: templates compile once per process (bytecode cached on disk)
+        # and the format_currency/format_date/format_percentage filters are already registered
+        self.env = get_environment(template_dir)
     
     def generate_executive_summary(
         self,
@@ -4,11 +4,13 @@ The central command center for all InnovLead systems
 """
 
 import os
+import sys
 import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file
+from uuid import uuid4
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 from flask_cors import CORS
 
 # Initialize Flask app
@@ -22,11 +24,32 @@ STORAGE_DIR.mkdir(exist_ok=True)
 (STORAGE_DIR / "proposals").mkdir(exist_ok=True)
 (STORAGE_DIR / "logs").mkdir(exist_ok=True)
 
-# Simple in-memory database (replace with Replit DB in production)
-vault_db = {
-    "consultancy_jobs": {},
-    "history": []
-}
+PROJECT_ROOT = Path(__file__).parent.parent
+ENGINE_PATH = PROJECT_ROOT / "modules" / "client-automation" / "execution"
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.lib.job_queue import DEFAULT_JOBS_DB, JobQueue, JobProgressRecorder, WorkerPool, QueueFullError
+
+# Durable job queue: jobs survive restarts and are picked up by a fixed worker pool.
+# CONSULTANCY_JOBS_DB is shared with the MCP server, so both see one job history.
+job_queue = JobQueue(
+    DEFAULT_JOBS_DB,
+    max_queued=int(os.getenv('CONSULTANCY_MAX_QUEUED', 50)),
+    per_tenant_running=int(os.getenv('CONSULTANCY_TENANT_RUNNING', 1)),
+    per_tenant_queued=int(os.getenv('CONSULTANCY_TENANT_QUEUED', 10)),
+    name='vault'
+)
+
+PHASE_PROGRESS = {'research': 30, 'funding': 20, 'strategy': 25, 'proposals': 25}
+FINISHED_STATUSES = ('complete', 'error')
+
+# Progress events per job (job_id -> [event]), replayed and streamed by the SSE endpoint.
+# A job's list is dropped once the job has finished and its last SSE stream has drained it.
+job_events = {}
+job_subscribers = {}  # job_id -> open SSE streams
+job_events_changed = threading.Condition()
 
 # ============================================================================
 # ROUTES - Pages
@@ -79,9 +102,10 @@ def modules_page():
 @app.route('/api/consultancy/run', methods=['POST'])
 def run_consultancy():
     """
-    Trigger full consultancy analysis
-    Body: {company, industry, url, location}
-    Returns: {job_id, status}
+    Queue a full consultancy analysis
+    Body: {company, industry, url, location, priority}
+    Header: X-Tenant-ID (optional, per-tenant concurrency caps)
+    Returns: {job_id, status}, or 429 with Retry-After when the queue is full
     """
     try:
         data = request.json
@@ -89,44 +113,38 @@ def run_consultancy():
         industry = data.get('industry', '')
         url = data.get('url', '')
         location = data.get('location', 'Canada')
+        tenant = request.headers.get('X-Tenant-ID') or data.get('tenant') or 'default'
+        priority = max(0, min(10, int(data.get('priority', 0))))
         
         if not company:
             return jsonify({'success': False, 'error': 'Company name required'}), 400
         
         # Create job
-        job_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{company.lower().replace(' ', '_')}"
+        # Random suffix: two submissions for one company within a second must not collide
+        job_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{company.lower().replace(' ', '_')}_{uuid4().hex[:8]}"
         
-        job_data = {
-            'job_id': job_id,
-            'company': company,
-            'industry': industry,
-            'url': url,
-            'location': location,
-            'status': 'queued',
-            'phase': 'initializing',
-            'progress': 0,
-            'created_at': datetime.now().isoformat(),
-            'started_at': None,
-            'completed_at': None,
-            'results': None,
-            'error': None
-        }
-        
-        vault_db['consultancy_jobs'][job_id] = job_data
-        vault_db['history'].insert(0, job_id)
-        
-        # Start background worker
-        thread = threading.Thread(target=run_consultancy_worker, args=(job_id,))
-        thread.daemon = True
-        thread.start()
+        job_queue.submit(
+            job_id,
+            payload={'industry': industry, 'url': url, 'location': location},
+            tenant=tenant,
+            priority=priority,
+            company=company,
+            state={'phase': 'initializing', 'progress': 0, 'phases': {}, 'counters': {}}
+        )
+        worker_pool.notify()
         
         return jsonify({
             'success': True,
             'job_id': job_id,
             'status': 'queued',
-            'message': 'Consultancy analysis started'
+            'message': 'Consultancy analysis queued'
         })
         
+    except QueueFullError as e:
+        response = jsonify({'success': False, 'error': str(e)})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
+        
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -136,7 +154,7 @@ def get_consultancy_status(job_id):
     Get status of consultancy job
     Returns: {status, phase, progress, current_task}
     """
-    job = vault_db['consultancy_jobs'].get(job_id)
+    job = job_queue.get(job_id)
     
     if not job:
         return jsonify({'success': False, 'error': 'Job not found'}), 404
@@ -147,20 +165,79 @@ def get_consultancy_status(job_id):
         'status': job['status'],
         'phase': job['phase'],
         'progress': job['progress'],
+        'phases': job['phases'],
+        'counters': job['counters'],
         'company': job['company'],
+        'priority': job['priority'],
+        'attempts': job['attempts'],
         'created_at': job['created_at'],
         'started_at': job['started_at'],
         'completed_at': job['completed_at'],
         'error': job['error']
     })
 
+@app.route('/api/consultancy/events/<job_id>', methods=['GET'])
+def stream_consultancy_events(job_id):
+    """
+    Stream progress events of a consultancy job as Server-Sent Events
+    Replays past events first; reconnecting clients resume after Last-Event-ID
+    Ends with an 'end' event once the job is complete or failed
+    """
+    job = job_queue.get(job_id)
+    
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    try:
+        next_id = int(request.headers.get('Last-Event-ID', request.args.get('since', -1))) + 1
+    except ValueError:
+        next_id = 0
+    
+    def generate():
+        with job_events_changed:
+            job_subscribers[job_id] = job_subscribers.get(job_id, 0) + 1
+        try:
+            yield from stream(next_id)
+        finally:
+            release_job_events(job_id, is_finished(job_id), subscriber=True)
+    
+    def stream(sent):
+        while True:
+            with job_events_changed:
+                if sent >= len(job_events.get(job_id, [])) and not is_finished(job_id):
+                    job_events_changed.wait(timeout=15)
+                pending = job_events.get(job_id, [])[sent:]
+            # The job may be running in another Vault process, so read its status from the store
+            finished = is_finished(job_id)
+            
+            for event in pending:
+                yield f"id: {sent}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                sent += 1
+            
+            if pending:
+                continue
+            if finished:
+                final = job_queue.get(job_id)
+                summary = {'status': final['status'], 'progress': final['progress'], 'error': final['error']}
+                yield f"event: end\ndata: {json.dumps(summary)}\n\n"
+                return
+            
+            # Keep proxies from closing an idle stream
+            yield ": keep-alive\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/consultancy/results/<job_id>', methods=['GET'])
 def get_consultancy_results(job_id):
     """
     Get full results of consultancy analysis
     Returns: {research, funding, strategy, proposals, metrics}
     """
-    job = vault_db['consultancy_jobs'].get(job_id)
+    job = job_queue.get(job_id)
     
     if not job:
         return jsonify({'success': False, 'error': 'Job not found'}), 404
@@ -183,28 +260,39 @@ def get_consultancy_results(job_id):
 @app.route('/api/consultancy/history', methods=['GET'])
 def get_consultancy_history():
     """
-    Get list of all consultancy analyses
-    Returns: [{job_id, company, date, status, metrics}]
+    Get a page of consultancy analyses, newest first
+    Query: company, status, limit (max 100), cursor (next_cursor of the previous page)
+    Returns: {history: [{job_id, company, date, status, metrics}], next_cursor}
     """
-    history = []
+    try:
+        limit = max(1, min(100, int(request.args.get('limit', 20))))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'limit must be an integer'}), 400
     
-    for job_id in vault_db['history'][:20]:  # Last 20 jobs
-        job = vault_db['consultancy_jobs'].get(job_id)
-        if job:
-            history.append({
-                'job_id': job_id,
-                'company': job['company'],
-                'industry': job['industry'],
-                'status': job['status'],
-                'created_at': job['created_at'],
-                'completed_at': job['completed_at'],
-                'metrics': job['results'].get('metrics') if job['results'] else None
-            })
+    page = job_queue.list_jobs(
+        company=request.args.get('company'),
+        status=request.args.get('status'),
+        limit=limit,
+        cursor=request.args.get('cursor')
+    )
+    
+    history = []
+    for job in page['jobs']:
+        history.append({
+            'job_id': job['job_id'],
+            'company': job['company'],
+            'industry': job.get('industry'),
+            'status': job['status'],
+            'created_at': job['created_at'],
+            'completed_at': job['completed_at'],
+            'metrics': job['results'].get('metrics') if job['results'] else None
+        })
     
     return jsonify({
         'success': True,
         'total': len(history),
-        'history': history
+        'history': history,
+        'next_cursor': page['next_cursor']
     })
 
 @app.route('/api/consultancy/proposals/<job_id>/<proposal_type>', methods=['GET'])
@@ -213,7 +301,7 @@ def download_proposal(job_id, proposal_type):
     Download specific proposal document
     Types: executive, technical, financial, funding
     """
-    job = vault_db['consultancy_jobs'].get(job_id)
+    job = job_queue.get(job_id)
     
     if not job or job['status'] != 'complete':
         return jsonify({'success': False, 'error': 'Job not found or incomplete'}), 404
@@ -252,7 +340,7 @@ def email_proposals(job_id):
         proposal_types = data.get('proposals', ['executive'])
         message = data.get('message', '')
         
-        job = vault_db['consultancy_jobs'].get(job_id)
+        job = job_queue.get(job_id)
         
         if not job or job['status'] != 'complete':
             return jsonify({'success': False, 'error': 'Job not found or incomplete'}), 404
@@ -313,99 +401,99 @@ def list_modules():
 # Background Worker
 # ============================================================================
 
-def run_consultancy_worker(job_id):
+def load_consultancy_engine():
+    """Import the consultancy engine on first use"""
+    if str(ENGINE_PATH) not in sys.path:
+        sys.path.insert(0, str(ENGINE_PATH))
+    import run_full_consultancy
+    return run_full_consultancy
+
+def is_finished(job_id):
+    job = job_queue.get(job_id)
+    return job is None or job['status'] in FINISHED_STATUSES
+
+def record_job_event(recorder, job_id, event):
+    """Persist an engine progress event and wake SSE streams"""
+    recorder(event)
+    
+    with job_events_changed:
+        job_events.setdefault(job_id, []).append(event)
+        job_events_changed.notify_all()
+
+def release_job_events(job_id, finished, subscriber=False):
     """
-    Background worker that runs the consultancy analysis
-    This calls your local Python modules
+    Forget a job's events once it has finished and no SSE stream is reading them
+    A stream opened later still gets the final status from the job store
     """
-    import subprocess
-    import sys
-    
-    job = vault_db['consultancy_jobs'][job_id]
+    with job_events_changed:
+        if subscriber:
+            job_subscribers[job_id] -= 1
+            if not job_subscribers[job_id]:
+                del job_subscribers[job_id]
+        if finished and job_id not in job_subscribers:
+            job_events.pop(job_id, None)
+        job_events_changed.notify_all()
+
+def finish_job(recorder, status, results=None, error=None):
+    """Record the outcome and let SSE streams send their closing event"""
+    recorder.finish(status, results=results, error=error)
+    release_job_events(recorder.job_id, finished=True)
+
+def run_consultancy_worker(job):
+    """
+    Worker pool handler that runs one claimed consultancy job
+    Calls the engine in-process and builds results from what it returns
+    """
+    recorder = JobProgressRecorder(job_queue, job, PHASE_PROGRESS)
     
     try:
-        job['status'] = 'running'
-        job['started_at'] = datetime.now().isoformat()
-        
-        company = job['company']
-        industry = job['industry']
-        url = job['url']
-        location = job['location']
-        
-        # Build command to run consultancy
-        # Assuming your Antigravity modules are accessible
-        module_path = Path(__file__).parent.parent / "modules" / "client-automation" / "execution"
-        script_path = module_path / "run_full_consultancy.py"
-        
-        cmd = [sys.executable, str(script_path), company]
-        
-        if industry:
-            cmd.extend(['--industry', industry])
-        if url:
-            cmd.extend(['--url', url])
-        if location:
-            cmd.extend(['--location', location])
-        
-        # Update progress: Phase 1
-        job['phase'] = 'research'
-        job['progress'] = 25
-        
-        # Run the consultancy script
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=900  # 15 minute timeout
+        engine = load_consultancy_engine()
+        result = engine.run_consultancy(
+            company_name=job['company'],
+            industry=job['industry'] or None,
+            url=job['url'] or None,
+            location=job['location'] or 'Canada',
+            on_event=lambda event: record_job_event(recorder, job['job_id'], event)
         )
         
-        if result.returncode == 0:
-            # Success! Parse results
-            job['phase'] = 'complete'
-            job['progress'] = 100
-            job['status'] = 'complete'
-            job['completed_at'] = datetime.now().isoformat()
-            
-            # Load results from generated files
-            company_slug = company.lower().replace(' ', '_')
+        if result['success']:
+            funding = result['funding'] or {}
+            proposals = result['proposals'] or {}
             
-            # Try to load research data
-            research_file = module_path.parent / ".tmp" / "research" / f"{company_slug}_enhanced_research.json"
-            funding_file = module_path.parent / ".tmp" / "funding" / f"{company_slug}_funding.json"
-            strategy_file = module_path.parent / ".tmp" / "strategy" / f"{company_slug}_strategy.json"
+            # Keep downloadable copies of the generated documents in Vault storage
+            company_slug = job['company'].lower().replace(' ', '_')
+            date_str = datetime.now().strftime('%Y-%m-%d')
+            documents = {}
+            for key, doc in proposals.get('documents', {}).items():
+                if doc['status'] != 'success':
+                    continue
+                filename = f"{company_slug}_{key}_{date_str}.md"
+                with open(STORAGE_DIR / "proposals" / filename, 'w', encoding='utf-8') as f:
+                    f.write(proposals[key])
+                documents[key] = filename
             
             results = {
                 'metrics': {
-                    'funding_found': 0,
+                    # Estimate funding amount (simplified)
+                    'funding_found': len(funding.get('opportunities', [])) * 15000,
                     'annual_roi': 0,
-                    'proposals_generated': 4
+                    'proposals_generated': result['metrics']['proposals_generated']
                 },
-                'files_generated': []
+                'phases': result['phases'],
+                'progress': result['progress'],
+                'documents': documents,
+                'files_generated': list(documents.values())
             }
-            
-            # Parse funding data for metrics
-            if funding_file.exists():
-                with open(funding_file, 'r') as f:
-                    funding_data = json.load(f)
-                    # Estimate funding amount (simplified)
-                    results['metrics']['funding_found'] = len(funding_data.get('opportunities', [])) * 15000
-            
-            job['results'] = results
+            finish_job(recorder, 'complete', results=results)
             
         else:
-            # Error occurred
-            job['status'] = 'error'
-            job['error'] = result.stderr or 'Unknown error'
-            job['completed_at'] = datetime.now().isoformat()
+            failed = [name for name, phase in result['phases'].items() if phase['status'] != 'success']
+            finish_job(recorder, 'error', error=f"Phases did not complete: {', '.join(failed)}")
             
-    except subprocess.TimeoutExpired:
-        job['status'] = 'error'
-        job['error'] = 'Analysis timed out after 15 minutes'
-        job['completed_at'] = datetime.now().isoformat()
-        
     except Exception as e:
-        job['status'] = 'error'
-        job['error'] = str(e)
-        job['completed_at'] = datetime.now().isoformat()
+        finish_job(recorder, 'error', error=str(e))
+
+worker_pool = WorkerPool(job_queue, run_consultancy_worker, workers=int(os.getenv('CONSULTANCY_MAX_JOBS', 2)))
 
 # ============================================================================
 # Health Check
@@ -418,6 +506,7 @@ def health_check():
         'status': 'online',
         'service': 'InnovLead Vault',
         'version': '1.0',
+        'jobs': job_queue.stats(),
         'timestamp': datetime.now().isoformat()
     })
 
@@ -430,8 +519,15 @@ if __name__ == '__main__':
     print("📊 Dashboard: http://localhost:5000")
     print("🔧 API: http://localhost:5000/api/")
     
+    app.debug = os.getenv('VAULT_DEBUG', 'true').lower() == 'true'
+    
+    # With the debug reloader only the serving child process runs jobs
+    if not app.debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        worker_pool.start()
+        print(f"⚙️  Job workers: {worker_pool.workers} ({job_queue.stats()['counts']['queued']} queued)")
+    
     app.run(
         host='0.0.0.0',
         port=5000,
-        debug=True
+        debug=app.debug
     )